@@ -1,14 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import argparse
-import csv
 import glob
 import os
 import sys
 import math
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.log_archive import open_dict_rows, EXT
+
 def get_latest_log_file(data_dir):
-    files = glob.glob(os.path.join(data_dir, "teleop_log_*.csv"))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(data_dir, "teleop_log_*.csv")) + \
+            glob.glob(os.path.join(data_dir, "teleop_log_*" + EXT))
     if not files:
         return None
     return max(files, key=os.path.getmtime)
@@ -44,27 +48,26 @@ def main():
     for i in range(1, 8):
         data[i] = {'in': [], 'out': [], 'norm': []}
 
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        row_count = 0
-        for row in reader:
-            row_count += 1
-            for i in range(1, 8): # Joints 1-7
-                try:
-                    inp = float(row[f"Input_J{i}"])
-                    
-                    if i == 7:
-                        out = float(row.get("Gripper_Out", 0))
-                        norm = 0.0 # Gripper norm usually not logged as separate column in early versions
-                    else:
-                        out = float(row[f"Output_J{i}"])
-                        norm = float(row[f"Norm_J{i}"])
+    _, reader = open_dict_rows(csv_file)
+    row_count = 0
+    for row in reader:
+        row_count += 1
+        for i in range(1, 8): # Joints 1-7
+            try:
+                inp = float(row[f"Input_J{i}"])
+                
+                if i == 7:
+                    out = float(row.get("Gripper_Out", 0))
+                    norm = 0.0 # Gripper norm usually not logged as separate column in early versions
+                else:
+                    out = float(row[f"Output_J{i}"])
+                    norm = float(row[f"Norm_J{i}"])
 
-                    data[i]['in'].append(inp)
-                    data[i]['out'].append(out)
-                    data[i]['norm'].append(norm)
-                except (ValueError, KeyError):
-                    continue
+                data[i]['in'].append(inp)
+                data[i]['out'].append(out)
+                data[i]['norm'].append(norm)
+            except (ValueError, KeyError):
+                continue
 
     # Computations
     for i in range(1, 7): # Arm Joints
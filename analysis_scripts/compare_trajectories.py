@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import argparse
-import csv
 import sys
 import os
 import matplotlib.pyplot as plt
@@ -10,6 +9,7 @@ import numpy as np
 # Adjust path to import mapping/config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import mapping
+from utils.log_archive import open_table, EXT
 
 def read_csv(filepath, is_leader=False):
     """
@@ -24,8 +24,7 @@ def read_csv(filepath, is_leader=False):
     timestamps = []
     data = []
     
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f)
+    with open_table(filepath) as reader:
         header = next(reader)
         
         # Simple header check/index finding could be added, but assuming standard format
@@ -53,7 +52,9 @@ def read_csv(filepath, is_leader=False):
 import glob
 
 def get_latest_file(directory, pattern):
-    files = glob.glob(os.path.join(directory, pattern))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(directory, pattern)) + \
+            glob.glob(os.path.join(directory, os.path.splitext(pattern)[0] + EXT))
     if not files: return None
     return max(files, key=os.path.getmtime)
 
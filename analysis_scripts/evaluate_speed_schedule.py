@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import argparse
+import glob
+import os
+import sys
+import datetime
+
+# Adjust path to import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    from utils import mapping
+    from utils.speed_scheduler import SpeedScheduler, simulate_follower, tracking_lag
+    from utils.log_archive import open_dict_rows, EXT
+except ImportError:
+    print("Error: Could not import utils")
+    sys.exit(1)
+
+def parse_time(value):
+    """Raw logs store seconds, teleop logs store wall-clock HH:MM:SS.ffffff."""
+    try:
+        return float(value)
+    except ValueError:
+        t = datetime.datetime.strptime(value, "%H:%M:%S.%f")
+        return t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
+
+def read_targets(filepath):
+    """
+    Returns (times, targets) of mapped M750 commands.
+    Teleop logs already hold the commanded output; raw C650 logs are mapped here.
+    """
+    times, targets = [], []
+    fields, reader = open_dict_rows(filepath)
+    if "Cmd_Output_J1" in fields:
+        cols = [f"Cmd_Output_J{i}" for i in range(1, 7)]
+    elif "Output_J1" in fields:
+        cols = [f"Output_J{i}" for i in range(1, 7)]
+    else:
+        cols = None
+
+    for row in reader:
+        try:
+            t = parse_time(row['Timestamp'])
+            if cols:
+                out = [float(row[c]) for c in cols]
+            else:
+                out, _ = mapping.process_arm_angles([float(row[f"J{i}"]) for i in range(1, 7)])
+        except (ValueError, KeyError, TypeError):
+            continue
+        if times and t <= times[-1]:
+            continue
+        times.append(t)
+        targets.append(out)
+    return times, targets
+
+def evaluate(times, targets, fixed_speeds):
+    results = []
+    for speed in fixed_speeds:
+        speeds = [speed] * len(times)
+        follower = simulate_follower(times, targets, speeds)
+        rms, lag = tracking_lag(times, targets, follower)
+        results.append((f"fixed {speed}", rms, lag, float(speed)))
+
+    sched = SpeedScheduler()
+    speeds = [sched.update(tgt, t) for t, tgt in zip(times, targets)]
+    follower = simulate_follower(times, targets, speeds)
+    rms, lag = tracking_lag(times, targets, follower)
+    results.append(("scheduled", rms, lag, sum(speeds) / len(speeds)))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Score fixed vs scheduled write_angles speed on recorded logs")
+    parser.add_argument("--file", nargs="*", help="Teleop or raw C650 logs (defaults to all in data/processed and data/raw)")
+    parser.add_argument("--fixed", type=int, nargs="*", default=[40, 50, 80], help="Fixed speeds to compare against")
+    args = parser.parse_args()
+
+    files = args.file
+    if not files:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        files = sorted(p for pattern in (os.path.join('processed', 'teleop_log_*'), os.path.join('raw', 'c650_motion_*'))
+                       for ext in ('.csv', EXT) for p in glob.glob(os.path.join(base_dir, 'data', pattern + ext)))
+    if not files:
+        print("No log files found.")
+        sys.exit(1)
+
+    print(f"{'File':<40} | {'Mode':<10} | {'RMS Err (deg)':<13} | {'Lag (ms)':<8} | {'Mean Speed':<10}")
+    print("-" * 95)
+    totals = {}
+    for path in files:
+        times, targets = read_targets(path)
+        if len(times) < 10:
+            print(f"{os.path.basename(path)[:40]:<40} | skipped (only {len(times)} rows)")
+            continue
+        for mode, rms, lag, mean_speed in evaluate(times, targets, args.fixed):
+            print(f"{os.path.basename(path)[:40]:<40} | {mode:<10} | {rms:<13.2f} | {lag*1000:<8.0f} | {mean_speed:<10.1f}")
+            acc = totals.setdefault(mode, [0.0, 0.0, 0])
+            acc[0] += rms
+            acc[1] += lag
+            acc[2] += 1
+        print("-" * 95)
+
+    if totals:
+        print("Mean over files:")
+        for mode, (rms, lag, n) in totals.items():
+            print(f"  {mode:<10} RMS={rms/n:.2f} deg  Lag={lag/n*1000:.0f} ms")
+
+if __name__ == "__main__":
+    main()
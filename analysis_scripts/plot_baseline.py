@@ -1,15 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import argparse
-import csv
 import glob
 import sys
 import os
 import matplotlib.pyplot as plt
 import numpy as np
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.log_archive import open_table, EXT
+
 def get_latest_file(directory, pattern):
-    files = glob.glob(os.path.join(directory, pattern))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(directory, pattern)) + \
+            glob.glob(os.path.join(directory, os.path.splitext(pattern)[0] + EXT))
     if not files: return None
     return max(files, key=os.path.getmtime)
 
@@ -21,8 +25,7 @@ def read_baseline_csv(filepath):
     timestamps = []
     data = [] # List of [J1...J6, Gripper]
     
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f)
+    with open_table(filepath) as reader:
         try:
             header = next(reader)
         except StopIteration:
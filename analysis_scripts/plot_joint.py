@@ -1,14 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import argparse
-import csv
 import glob
 import os
 import sys
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.log_archive import open_dict_rows, EXT
+
 def get_latest_log_file(data_dir):
-    files = glob.glob(os.path.join(data_dir, "teleop_log_*.csv"))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(data_dir, "teleop_log_*.csv")) + \
+            glob.glob(os.path.join(data_dir, "teleop_log_*" + EXT))
     if not files:
         return None
     # Sort by modification time
@@ -57,55 +61,53 @@ def main():
     col_norm = f"Norm_J{joint_idx}"
     
     # Read Data
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        fields = reader.fieldnames
+    fields, reader = open_dict_rows(csv_file)
+    
+    # Detect Format
+    mode = "PROCESSED"
+    if f"Input_J{joint_idx}" in fields:
+        col_input = f"Input_J{joint_idx}"
+        col_output = f"Output_J{joint_idx}" if f"Output_J{joint_idx}" in fields else None
+        col_norm = f"Norm_J{joint_idx}" if f"Norm_J{joint_idx}" in fields else None
+         # Gripper special case
+        if joint_idx == 7:
+             col_output = 'Gripper_Out' if 'Gripper_Out' in fields else None
+    elif f"J{joint_idx}" in fields:
+        mode = "RAW"
+        col_input = f"J{joint_idx}"
+        col_output = None
+        col_norm = None
+    else:
+        print(f"Error: Could not find columns for Joint {joint_idx}. Available: {fields}")
+        sys.exit(1)
         
-        # Detect Format
-        mode = "PROCESSED"
-        if f"Input_J{joint_idx}" in fields:
-            col_input = f"Input_J{joint_idx}"
-            col_output = f"Output_J{joint_idx}" if f"Output_J{joint_idx}" in fields else None
-            col_norm = f"Norm_J{joint_idx}" if f"Norm_J{joint_idx}" in fields else None
-             # Gripper special case
-            if joint_idx == 7:
-                 col_output = 'Gripper_Out' if 'Gripper_Out' in fields else None
-        elif f"J{joint_idx}" in fields:
-            mode = "RAW"
-            col_input = f"J{joint_idx}"
-            col_output = None
-            col_norm = None
-        else:
-            print(f"Error: Could not find columns for Joint {joint_idx}. Available: {fields}")
-            sys.exit(1)
-            
-        print(f"Format: {mode}. plotting...")
+    print(f"Format: {mode}. plotting...")
 
-        for row in reader:
+    for row in reader:
+        try:
+            # Timestamp handling (Raw uses 'Timestamp', Processed uses 'Timestamp')
+            # But raw values are float seconds, Processed values are usually HH:MM:SS string or float?
+            # Let's try float conversion, if fails, try string parse?
+            t_raw = row['Timestamp']
             try:
-                # Timestamp handling (Raw uses 'Timestamp', Processed uses 'Timestamp')
-                # But raw values are float seconds, Processed values are usually HH:MM:SS string or float?
-                # Let's try float conversion, if fails, try string parse?
-                t_raw = row['Timestamp']
-                try:
-                    t = float(t_raw)
-                except ValueError:
-                    # Parse HH:MM:SS.fff
-                    # Assuming today's date? Or just index?
-                    t = float(len(timestamps)) * 0.1 # Fallback
-                
-                inp = float(row[col_input])
-                
-                if col_output:
-                    outputs.append(float(row[col_output]))
-                if col_norm:
-                    norms.append(float(row[col_norm]))
-                
-                timestamps.append(t)
-                inputs.append(inp)
-                
+                t = float(t_raw)
             except ValueError:
-                continue
+                # Parse HH:MM:SS.fff
+                # Assuming today's date? Or just index?
+                t = float(len(timestamps)) * 0.1 # Fallback
+            
+            inp = float(row[col_input])
+            
+            if col_output:
+                outputs.append(float(row[col_output]))
+            if col_norm:
+                norms.append(float(row[col_norm]))
+            
+            timestamps.append(t)
+            inputs.append(inp)
+            
+        except ValueError:
+            continue
 
     # Plotting
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
@@ -10,19 +10,51 @@ import datetime
 # Adjust path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from utils import mapping
+    from utils import mapping, calibration
+    from utils.resampler import resample
+    from utils.log_archive import open_dict_rows, EXT
 except ImportError:
     print("Error: Could not import utils.mapping")
     sys.exit(1)
 
 def get_latest_file(directory, pattern):
-    files = glob.glob(os.path.join(directory, pattern))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(directory, pattern)) + \
+            glob.glob(os.path.join(directory, os.path.splitext(pattern)[0] + EXT))
     if not files: return None
     return max(files, key=os.path.getmtime)
 
+def resample_rows(reader, rate_hz):
+    """
+    Replay the raw log through the spline resampler.
+    Yields rows in the same dict format as the CSV reader, on a uniform grid.
+    """
+    timestamps = []
+    values = []
+    cols = [f"J{i}" for i in range(1, 8)]
+    for row in reader:
+        try:
+            t = float(row['Timestamp'])
+            timestamps.append(t)
+            values.append([float(row.get(c) or 0) for c in cols])
+        except (ValueError, KeyError):
+            continue
+
+    grid_t, grid_rows, stats = resample(timestamps, values, rate_hz=rate_hz)
+    if stats:
+        print(f"Resampled {stats['samples_in']} -> {stats['samples_out']} rows at {rate_hz:.0f} Hz "
+              f"({stats['cost_mean_us']:.1f}us/sample, max {stats['cost_max_us']:.1f}us)")
+
+    for t, vals in zip(grid_t, grid_rows):
+        row = {'Timestamp': f"{t:.4f}"}
+        row.update({c: v for c, v in zip(cols, vals)})
+        yield row
+
 def main():
     parser = argparse.ArgumentParser(description="Process Raw C650 Log -> Mapped Teleop Log")
     parser.add_argument("--file", help="Path to Raw Log (defaults to latest in data/raw/)")
+    parser.add_argument("--resample-hz", type=float, default=0,
+                        help="Resample the raw stream onto a uniform grid before mapping (0 = off)")
     args = parser.parse_args()
 
     # 1. Resolve Input File
@@ -48,8 +80,8 @@ def main():
     print(f"{'Time':<8} | {'Joint':<5} | {'Input':<8} | {'Norm':<6} | {'Output':<8}")
     print("-" * 50)
 
-    with open(input_file, 'r') as fin, open(output_file, 'w', newline='') as fout:
-        reader = csv.DictReader(fin)
+    _, reader = open_dict_rows(input_file)
+    with open(output_file, 'w', newline='') as fout:
         writer = csv.writer(fout)
         
         # Header matching teleop_explicit.py format
@@ -57,11 +89,16 @@ def main():
                  ["Gripper_In"] + \
                  [f"Norm_J{i}" for i in range(1, 7)] + \
                  [f"Output_J{i}" for i in range(1, 7)] + \
-                 ["Gripper_Out"]
+                 ["Gripper_Out", "Cal_Version"]
         writer.writerow(header)
+        cal_version = calibration.load().version
+
+        rows = reader
+        if args.resample_hz > 0:
+            rows = resample_rows(reader, args.resample_hz)
         
         count = 0
-        for row in reader:
+        for row in rows:
             try:
                 t = row['Timestamp']
                 inputs = [float(row[f"J{i}"]) for i in range(1, 7)]
@@ -77,7 +114,7 @@ def main():
                           [f"{gripper_in:.2f}"] + \
                           [f"{x:.3f}" for x in norms] + \
                           [f"{x:.2f}" for x in outputs] + \
-                          [f"{gripper_out}"]
+                          [f"{gripper_out}", cal_version]
                 
                 writer.writerow(out_row)
                 
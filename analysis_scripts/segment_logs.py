@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import argparse
+import glob
+import os
+import sys
+import time
+
+# Adjust path to import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.motion_trigger import segment_file
+from compare_trajectories import read_csv
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATTERNS = [os.path.join(BASE_DIR, 'data', 'raw', 'c650_motion_*.csv'),
+                    os.path.join(BASE_DIR, 'data', 'baselines', 'baseline_traj_*.csv')]
+
+def timed_load(paths, repeat=3):
+    """Best-of-N time for the usual analysis load (compare_trajectories.read_csv) over `paths`."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for p in paths:
+            read_csv(p)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Split existing recordings into motion segments and measure the savings")
+    parser.add_argument("files", nargs="*", help="CSV logs (default: data/raw/c650_motion_*.csv, data/baselines/baseline_traj_*.csv)")
+    parser.add_argument("--out", default=os.path.join(BASE_DIR, 'data', 'segments'), help="Output directory")
+    parser.add_argument("--threshold", type=float, default=5.0, help="Motion threshold (deg/s, any joint)")
+    parser.add_argument("--pre-roll", type=float, default=1.0, help="Seconds kept before the trigger")
+    parser.add_argument("--quiet", type=float, default=1.5, help="Seconds of stillness that end a segment")
+    args = parser.parse_args()
+
+    files = args.files or sorted(p for pat in DEFAULT_PATTERNS for p in glob.glob(pat))
+    if not files:
+        print("No recordings found.")
+        sys.exit(1)
+
+    print(f"{'File':<40} | {'Rows kept':>15} | {'Segs':>4} | {'Size before':>11} | {'Size after':>10} | {'Load before':>11} | {'Load after':>10}")
+    total = {'before': 0, 'after': 0, 't_before': 0.0, 't_after': 0.0}
+    for path in files:
+        out_dir = os.path.join(args.out, os.path.splitext(os.path.basename(path))[0])
+        rec, index = segment_file(path, out_dir, threshold=args.threshold,
+                                  pre_roll_s=args.pre_roll, quiet_s=args.quiet)
+        seg_paths = [os.path.join(out_dir, s['file']) for s in index['segments']]
+
+        before = os.path.getsize(path)
+        after = sum(os.path.getsize(p) for p in seg_paths)
+        t_before = timed_load([path])
+        t_after = timed_load(seg_paths) if seg_paths else 0.0
+        for k, v in (('before', before), ('after', after), ('t_before', t_before), ('t_after', t_after)):
+            total[k] += v
+
+        print(f"{os.path.basename(path)[:40]:<40} | {index['samples_kept']:>7}/{index['samples_seen']:<7} | "
+              f"{len(seg_paths):>4} | {before/1024:>8.1f} KB | {after/1024:>7.1f} KB | "
+              f"{t_before*1000:>8.1f} ms | {t_after*1000:>7.1f} ms")
+
+    saved = 100.0 * (1 - total['after'] / total['before']) if total['before'] else 0.0
+    speedup = total['t_before'] / total['t_after'] if total['t_after'] else float('inf')
+    print(f"\nStorage: {total['before']/1024:.1f} KB -> {total['after']/1024:.1f} KB ({saved:.1f}% saved)")
+    print(f"Analysis load: {total['t_before']*1000:.1f} ms -> {total['t_after']*1000:.1f} ms ({speedup:.1f}x)")
+    print(f"Segments written under {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 import argparse
-import csv
 import glob
 import sys
 import os
@@ -12,13 +11,20 @@ from scipy.interpolate import interp1d
 # Adjust path to import config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from config import M750_LIMITS, C650_LIMITS
+    from utils import calibration
+    _cal = calibration.load()
+    M750_LIMITS, C650_LIMITS = _cal.m750_limits, _cal.c650_limits
 except ImportError:
+    calibration = None
     M750_LIMITS = [(-170, 170)]*6
     C650_LIMITS = [(-170, 170)]*6
+from utils.sync_recorder import load_session
+from utils.log_archive import open_table, EXT
 
 def get_latest_file(directory, pattern):
-    files = glob.glob(os.path.join(directory, pattern))
+    # CSV logs and their .tla archives
+    files = glob.glob(os.path.join(directory, pattern)) + \
+            glob.glob(os.path.join(directory, os.path.splitext(pattern)[0] + EXT))
     if not files: return None
     return max(files, key=os.path.getmtime)
 
@@ -30,8 +36,7 @@ def read_csv(filepath, is_leader=False):
     timestamps = []
     data = []
     
-    with open(filepath, 'r') as f:
-        reader = csv.reader(f)
+    with open_table(filepath) as reader:
         try:
             header = next(reader)
         except StopIteration:
@@ -79,7 +84,10 @@ def main():
     parser = argparse.ArgumentParser(description="Auto-Tune M750 Limits based on Leader vs Baseline Logs")
     parser.add_argument("--leader", help="Leader Log (Input)")
     parser.add_argument("--baseline", help="Baseline Log (Target)")
+    parser.add_argument("--session", help="Synchronized C650+M750 session (record_session.py); no time stretching needed")
     parser.add_argument("--single_file", help="Legacy: Use single file with Actual columns")
+    parser.add_argument("--save", action="store_true",
+                        help="Store the solved M750 limits as a new calibration version")
     args = parser.parse_args()
 
     # 1. Resolve Files
@@ -87,14 +95,18 @@ def main():
         print("Single file mode not fully supported in this version. Use --leader and --baseline.")
         sys.exit(1)
 
-    if args.leader:
+    if args.session:
+        leader_file = base_file = args.session
+    elif args.leader:
         leader_file = args.leader
     else:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         raw_dir = os.path.join(base_dir, 'data', 'raw')
         leader_file = get_latest_file(raw_dir, "c650_motion_*.csv")
 
-    if args.baseline:
+    if args.session:
+        pass
+    elif args.baseline:
         base_file = args.baseline
     else:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -109,25 +121,39 @@ def main():
     print(f"Baseline: {os.path.basename(base_file)}")
 
     # 2. Read Data
-    t_lead, d_lead = read_csv(leader_file, is_leader=True)
-    t_base, d_base = read_csv(base_file, is_leader=False)
+    if args.session:
+        session = load_session(args.session)
+        t_lead, d_lead = session['leader']
+        t_base, d_base = session['follower']
+    else:
+        t_lead, d_lead = read_csv(leader_file, is_leader=True)
+        t_base, d_base = read_csv(base_file, is_leader=False)
 
     if len(t_lead) == 0 or len(t_base) == 0:
         print("Error: Empty data.")
         sys.exit(1)
+    if args.session:
+        d_lead, d_base = d_lead[:, :6], d_base[:, :6]
 
     # 3. Time Alignment & Interpolation
-    dur_lead = t_lead[-1]
-    dur_base = t_base[-1]
-    
-    print(f"Duration: Lead={dur_lead:.1f}s, Base={dur_base:.1f}s")
-    
-    # Scale Baseline Time to match Leader
-    if dur_base > 0:
-        scale = dur_lead / dur_base
-        t_base_scaled = t_base * scale
-    else:
+    if args.session:
+        # Both streams share one clock: only keep leader samples bracketed by follower samples
+        inside = (t_lead >= t_base[0]) & (t_lead <= t_base[-1])
+        t_lead, d_lead = t_lead[inside], d_lead[inside]
         t_base_scaled = t_base
+        print(f"Session: {len(t_lead)} leader / {len(t_base)} follower samples on a shared clock")
+    else:
+        dur_lead = t_lead[-1]
+        dur_base = t_base[-1]
+
+        print(f"Duration: Lead={dur_lead:.1f}s, Base={dur_base:.1f}s")
+
+        # Scale Baseline Time to match Leader
+        if dur_base > 0:
+            scale = dur_lead / dur_base
+            t_base_scaled = t_base * scale
+        else:
+            t_base_scaled = t_base
 
     # Resample Baseline to match Leader timestamps
     # This gives us pairs of (LeaderInput, BaselineTarget) at the same 'relative' time
@@ -205,11 +231,18 @@ def main():
         
         new_limits.append((round(target_min, 1), round(target_max, 1)))
 
-    print("\n--- Recommended config.py Block ---")
+    print("\n--- Recommended M750 Limits ---")
     print("M750_LIMITS = [")
     for lim in new_limits:
         print(f"    {lim},")
     print("]")
 
+    if args.save and calibration is not None:
+        note = f"solve_mapping {os.path.basename(leader_file)} vs {os.path.basename(base_file)}"
+        v = calibration.update(note=note, m750_limits=new_limits)
+        print(f"Saved as calibration v{v} (roll back with: python -m utils.calibration --rollback {v - 1})")
+    else:
+        print("Run with --save to store these as a new calibration version.")
+
 if __name__ == "__main__":
     main()
@@ -64,4 +64,9 @@ C650_LIMITS = [
     (-118.74, 75.41),
     (-145.28, 153.1),
     (-88.7, 10.89)
-]
\ No newline at end of file
+]
+
+# --- Follower Speed Model ---
+# Approximate joint velocity (deg/s) the M750 reaches at write_angles speed=100.
+# The speed argument is treated as a linear percentage of this.
+M750_MAX_JOINT_SPEED = 160.0
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import argparse
+import sys
+import os
+import json
+import datetime
+
+# Adjust path to import config/utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pymycobot import MyArmMControl
+from utils import connection, calibration
+from utils.pose_store import PoseStore
+from utils.playback import run_playback, print_summary, save_report, compare_reports
+
+REPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'reports')
+
+def choose_poses(store, names, tag):
+    if names:
+        missing = [n for n in names if n not in store]
+        if missing:
+            print(f"Unknown poses: {', '.join(missing)}")
+            return None
+        return [(n, store.get(n)['angles']) for n in names]
+    if tag:
+        return [(n, store.get(n)['angles']) for n in store.by_tag(tag)]
+
+    keys = store.names()
+    for i, k in enumerate(keys):
+        print(f"{i+1}: {k}")
+    sel = input("\nPoses to play (e.g. 1 3 2, in order): ").split()
+    try:
+        return [(keys[int(x) - 1], store.get(keys[int(x) - 1])['angles']) for x in sel]
+    except (ValueError, IndexError):
+        print("Invalid selection.")
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Play baseline poses on the M750 and measure positioning performance")
+    parser.add_argument("--poses", nargs="+", help="Pose names from the pose store, in playback order")
+    parser.add_argument("--tag", help="Play every pose with this tag")
+    parser.add_argument("--cycles", type=int, default=3, help="Rounds through the pose list (repeatability)")
+    parser.add_argument("--speed", type=int, nargs="+", default=[40], help="write_angles speed(s); several = sweep")
+    parser.add_argument("--tol", type=float, default=1.0, help="Settle band (deg)")
+    parser.add_argument("--hold", type=float, default=0.3, help="Time inside the band to count as settled (s)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Max time per move (s)")
+    parser.add_argument("--compare", nargs=2, metavar=("A", "B"), help="Compare two saved reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as fa, open(args.compare[1]) as fb:
+            compare_reports(json.load(fa), json.load(fb))
+        return
+
+    print("=== MyArm M750 Baseline Playback ===")
+    store = PoseStore()
+    if not len(store):
+        print(f"No poses in {store.path}. Run record_baseline.py first.")
+        return
+    poses = choose_poses(store, args.poses, args.tag)
+    if not poses:
+        return
+    print(f"Sequence: {' -> '.join(n for n, _ in poses)} x {args.cycles} cycles, speed {args.speed}")
+
+    port = connection.select_port("Select M750 (Follower) Port:")
+    try:
+        m750 = MyArmMControl(port, 1000000)
+    except Exception as e:
+        print(f"Connection Failed: {e}")
+        return
+
+    # Settings stored with the results, so reports can be compared later
+    try:
+        fw_limits = [[m750.get_joint_min(j), m750.get_joint_max(j)] for j in range(1, 7)]
+    except Exception:
+        fw_limits = None
+    settings = {'port': port, 'firmware_limits': fw_limits, 'calibration_version': calibration.load().version}
+
+    if input("The arm WILL MOVE. Clear the workspace and type 'y' to start: ").strip().lower() != 'y':
+        print("Aborted.")
+        return
+
+    try:
+        for speed in args.speed:
+            print(f"\n--- Speed {speed} ---")
+            report = run_playback(m750, poses, cycles=args.cycles, speed=speed, tol=args.tol,
+                                  hold=args.hold, timeout=args.timeout, settings=settings)
+            print_summary(report)
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(REPORT_DIR, f"playback_{timestamp}_s{speed}.json")
+            save_report(report, path)
+            print(f"Report saved to {path}")
+    except KeyboardInterrupt:
+        print("\nStopping...")
+        m750.stop()
+    finally:
+        try:
+            m750._serial_port.close()
+        except Exception:
+            pass
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import time
 import sys
-import csv
 import os
 import datetime
 import serial.tools.list_ports
 from pymycobot import MyArmC
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.group_writer import GroupWriter
+from utils.motion_trigger import SegmentRecorder
+from utils.rate_stats import RateStats
+from utils.transport import classify_read, Backoff, ERR_IO
+
 def list_serial_ports():
     return [p.device for p in serial.tools.list_ports.comports()]
 
@@ -40,6 +46,18 @@ def ensure_data_dir():
     return data_dir
 
 def main():
+    parser = argparse.ArgumentParser(description="Record C650 joint angles to CSV at the maximum read rate")
+    parser.add_argument("--window-ms", type=float, default=200, help="Group-commit window: rows reach the OS at least this often")
+    parser.add_argument("--max-rows", type=int, default=500, help="Commit early once this many rows are buffered")
+    parser.add_argument("--fsync-s", type=float, default=1.0, help="fsync interval in seconds (0 = every group)")
+    parser.add_argument("--trigger", type=float, default=0.0,
+                        help="Only record motion: start when any joint moves faster than this (deg/s); 0 = record everything")
+    parser.add_argument("--pre-roll", type=float, default=1.0, help="Seconds kept before the trigger (with --trigger)")
+    parser.add_argument("--quiet", type=float, default=1.5, help="Seconds of stillness that end a segment (with --trigger)")
+    parser.add_argument("--max-io-errors", type=int, default=20,
+                        help="Stop after this many consecutive I/O errors (leader unplugged)")
+    args = parser.parse_args()
+
     print("=== MyArm C650 Motion Logger ===")
     print("Records joint angles to CSV.")
 
@@ -58,47 +76,76 @@ def main():
     filename = os.path.join(data_dir, f"c650_motion_{timestamp}.csv")
     
     print(f"Logging to: {filename}")
+    print(f"Rows reach disk every {args.window_ms:.0f} ms (fsync every {args.fsync_s:g} s).")
     print("Press Ctrl+C to stop recording.")
 
+    # Header: Timestamp, J1, J2, J3, J4, J5, J6, Gripper
+    header = ['Timestamp', 'J1', 'J2', 'J3', 'J4', 'J5', 'J6', 'J7']
+
+    def open_writer(path):
+        w = GroupWriter(path, header=header, window_ms=args.window_ms, max_rows=args.max_rows, fsync_s=args.fsync_s)
+        w.start()
+        return w
+
+    if args.trigger:
+        # Motion segments <name>_segNNN.csv + <name>_segments.json instead of one continuous file
+        writer = SegmentRecorder(filename, header, threshold=args.trigger, pre_roll_s=args.pre_roll,
+                                 quiet_s=args.quiet, writer_factory=open_writer)
+        print(f"Motion trigger: > {args.trigger:g} deg/s, {args.pre_roll:g} s pre-roll, stop after {args.quiet:g} s still.")
+    else:
+        writer = open_writer(filename)
+    samples = RateStats()
+    backoff = Backoff()
+    io_errors = 0
     try:
-        with open(filename, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            # Header: Timestamp, J1, J2, J3, J4, J5, J6, Gripper
-            writer.writerow(['Timestamp', 'J1', 'J2', 'J3', 'J4', 'J5', 'J6', 'J7'])
-            
-            start_time = time.time()
-            
-            print(f"Logging started at {datetime.datetime.now().strftime('%H:%M:%S')}")
-            
-            while True:
+        start_time = time.monotonic()
+        next_status = start_time
+
+        print(f"Logging started at {datetime.datetime.now().strftime('%H:%M:%S')}")
+
+        # No sleep: read as fast as the port allows, the writer thread does the I/O
+        while True:
+            try:
                 angles = leader.get_joints_angle()
-                
-                # Validation
-                if not isinstance(angles, list):
-                    # print(f"\r[Warn] Read returned non-list: {angles}", end="")
-                    time.sleep(0.05)
-                    continue
-                    
-                if len(angles) < 7:
-                    # print(f"\r[Warn] Incomplete data: {angles}", end="")
-                    time.sleep(0.05)
-                    continue
-
-                current_time = time.time() - start_time
-                row = [f"{current_time:.4f}"] + [f"{a:.2f}" for a in angles]
-                writer.writerow(row)
-                csvfile.flush() # CRITICAL: Ensure data hits disk
-                
-                # Feedback
-                print(f"\rTime: {current_time:.2f}s | Angles: {[int(a) for a in angles[:6]]}", end="")
-                    
-                time.sleep(0.05) # 20Hz logging
+            except OSError as e:
+                samples.drop(ERR_IO)
+                io_errors += 1
+                if io_errors >= args.max_io_errors:
+                    print(f"\n\nLeader link lost ({e}), {io_errors} I/O errors in a row. Saved to {filename}")
+                    break
+                time.sleep(backoff.next())
+                continue
+            io_errors = 0
+            backoff.reset()
+            now = time.monotonic()
+
+            # Validation
+            err = classify_read(angles, 7)
+            if err:
+                samples.drop(err)
+                continue
+
+            samples.tick(now)
+            current_time = now - start_time
+            writer.writerow([f"{current_time:.4f}"] + [f"{a:.2f}" for a in angles[:7]])
+
+            # Feedback (throttled; printing every row would cost more than the read)
+            if now >= next_status:
+                state = ("REC " if writer.recording else "idle") if args.trigger else ""
+                print(f"\r{state}Time: {current_time:.2f}s | Angles: {[int(a) for a in angles[:6]]}", end="")
+                next_status = now + 0.1
 
     except KeyboardInterrupt:
         print(f"\n\nStopping... Saved to {filename}")
     except Exception as e:
         print(f"\nError: {e}")
     finally:
+        try:
+            writer.close()
+        except OSError as e:
+            print(f"Write error: {e}")
+        samples.report("Samples")
+        writer.report()
         try: leader._serial_port.close()
         except: pass
 
@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import time
 import sys
+import os
 import serial.tools.list_ports
 from pymycobot import MyArmC
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.terminal_dashboard import TerminalDashboard
+from utils.range_learner import RangeLearner
+
 def list_serial_ports():
     return [p.device for p in serial.tools.list_ports.comports()]
 
@@ -29,6 +35,12 @@ def select_port(prompt):
         print("Invalid selection. Try again.")
 
 def main():
+    parser = argparse.ArgumentParser(description="C650 range monitor (robust percentile limits)")
+    parser.add_argument("--lower-pct", type=float, default=0.2, help="Percentile used for the suggested minimum")
+    parser.add_argument("--upper-pct", type=float, default=99.8, help="Percentile used for the suggested maximum")
+    parser.add_argument("--sketch", help="Range sketch JSON: merged into this session if it exists, saved on exit")
+    args = parser.parse_args()
+
     print("=== MyArm C650 Range Monitor ===")
     print("This script helps you find your desired offsets/limits.")
     print("Move the robot arm manually, and this script will record the Min/Max angles observed.")
@@ -41,49 +53,65 @@ def main():
         print(f"Failed to connect: {e}")
         return
 
-    min_angles = [999.0] * 7
-    max_angles = [-999.0] * 7
-    
+    # Constant-memory robust estimator (raw min/max kept only for reference)
+    learner = RangeLearner(n_joints=7, lower_pct=args.lower_pct, upper_pct=args.upper_pct)
+    if args.sketch and os.path.exists(args.sketch):
+        learner.merge(RangeLearner.load(args.sketch))
+        print(f"Continuing from {args.sketch} ({learner.sessions - 1} earlier session(s))")
+
+    # Newest reading, shared with the dashboard's refresh timer
+    current = [None] * 7
+    reads = {'ok': 0, 'short': 0}
+
+    def render():
+        lines = ["-" * 72,
+                 f"{'Joint':<6} | {'Current':<10} | {'Min (p' + format(args.lower_pct, 'g') + ')':<12} | "
+                 f"{'Max (p' + format(args.upper_pct, 'g') + ')':<12} | {'Coverage':<8}",
+                 "-" * 72]
+        for i in range(7):
+            cur = f"{current[i]:<10.2f}" if current[i] is not None else f"{'---':<10}"
+            s = learner.suggest(i)
+            if s:
+                mn, mx, cov = f"{s[0]:<12.2f}", f"{s[1]:<12.2f}", f"{learner.coverage(i)*100:<7.0f}%"
+            else:
+                mn, mx, cov = f"{'---':<12}", f"{'---':<12}", f"{'---':<8}"
+            lines.append(f"J{i+1:<5} | {cur} | {mn} | {mx} | {cov}")
+        lines.append("-" * 72)
+        lines.append(f"Reads: {reads['ok']} ok / {reads['short']} short or failed")
+        return lines
+
+    dashboard = TerminalDashboard(render, refresh_hz=10.0)
     print("\nReading angles... (Press Ctrl+C to stop and see final report)")
-    print("-" * 60)
-    print(f"{'Joint':<6} | {'Current':<10} | {'Min Observed':<12} | {'Max Observed':<12}")
-    print("-" * 60)
+    dashboard.start()
 
     try:
         while True:
             angles = mc.get_joints_angle()
             if angles and len(angles) >= 6:
                 # Ensure we handle up to 7 joints (arm + gripper)
-                count = len(angles)
-                
-                # Update Min/Max
-                for i in range(count):
-                    if angles[i] < min_angles[i]: min_angles[i] = angles[i]
-                    if angles[i] > max_angles[i]: max_angles[i] = angles[i]
-                
-                # Print real-time status (overwrite lines to keep terminal clean-ish)
-                # Using carriage return \r and ANSI escape codes to move cursor up if possible, 
-                # but simple print block is safer for all terminals.
+                count = min(len(angles), 7)
                 
-                print(f"\033[{count+1}A") # Move cursor up 'count+1' lines
+                # Update the estimator (out-of-range reads are rejected there)
+                learner.update(angles)
                 for i in range(count):
-                    print(f"J{i+1:<5} | {angles[i]:<10.2f} | {min_angles[i]:<12.2f} | {max_angles[i]:<12.2f}")
+                    current[i] = angles[i]
+                reads['ok'] += 1
+            else:
+                # Short / failed read: keep the last values on screen
+                reads['short'] += 1
                 
             time.sleep(0.1)
             
     except KeyboardInterrupt:
-        print("\n\n" + "-" * 60)
-        print("Final Report:")
-        print("-" * 60)
-        print(f"{'Joint':<6} | {'Min':<10} | {'Max':<10}")
-        count = len(angles) if 'angles' in locals() and angles else 6
-        for i in range(count):
-             # Handle case where no valid angle was ever read
-            mn = min_angles[i] if min_angles[i] != 999.0 else "N/A"
-            mx = max_angles[i] if max_angles[i] != -999.0 else "N/A"
-            print(f"J{i+1:<5} | {mn:<10} | {mx:<10}")
+        dashboard.close()
+        dashboard.report()
+        learner.report("Final Report")
+        if args.sketch:
+            learner.save(args.sketch)
+            print(f"Sketch saved to {args.sketch}")
             
     finally:
+        dashboard.close()
         try: mc._serial_port.close()
         except: pass
 
@@ -1,25 +1,69 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import sys
 import os
 import time
+import datetime
 
 # Adjust path to import config/utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from pymycobot import MyArmMControl
-    from utils import connection
-    import config
+    from utils import connection, calibration
+    from utils.fleet import run_fleet, print_report, save_report
 except ImportError:
     print("Error: Could not import project modules.")
     sys.exit(1)
 
+REPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'reports')
+
+def fleet_main(args, cal):
+    # Every connected port (or the given ones), one worker per port
+    ports = args.ports or connection.list_serial_ports()
+    if not ports:
+        print("No serial ports found!")
+        return
+    print(f"Fleet mode: {len(ports)} port(s): {', '.join(ports)}")
+    if args.write:
+        if not args.ports:
+            print("--write needs an explicit --ports list (every serial port may include the C650 or other devices).")
+            return
+        confirm = input(f"WRITE calibration v{cal.version} limits to ALL {len(ports)} arms? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("Aborted.")
+            return
+
+    report = run_fleet(ports, lambda p: MyArmMControl(p, 1000000), cal.m750_limits,
+                       write=args.write, tol=args.tol)
+    report['calibration_version'] = cal.version
+    print_report(report)
+
+    path = args.report or os.path.join(
+        REPORT_DIR, f"limits_audit_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    save_report(report, path)
+    print(f"Report saved to {path}")
+
 def main():
+    parser = argparse.ArgumentParser(description="Compare M750 firmware limits with the calibration")
+    parser.add_argument("--fleet", action="store_true", help="Check every connected M750 concurrently")
+    parser.add_argument("--ports", nargs="+", help="Fleet mode: only these ports")
+    parser.add_argument("--write", action="store_true",
+                        help="Write the calibration limits to every arm in --ports (required), then verify by reading back")
+    parser.add_argument("--tol", type=float, default=1.0, help="Match tolerance in degrees")
+    parser.add_argument("--report", help="Fleet mode: JSON report path (default data/reports/limits_audit_*.json)")
+    args = parser.parse_args()
+
     print("=== Configuration vs Firmware Verification ===")
     
-    # 1. Load Config Limits
-    cfg_limits = config.M750_LIMITS
-    print(f"Loaded {len(cfg_limits)} limits from config.py")
+    # 1. Load Calibration Limits
+    cal = calibration.load()
+    cfg_limits = cal.m750_limits
+    print(f"Loaded {len(cfg_limits)} limits from calibration v{cal.version}")
+
+    if args.fleet or args.ports:
+        fleet_main(args, cal)
+        return
     
     # 2. Connect to Robot
     port = connection.select_port("Select M750 Port:")
@@ -52,8 +96,8 @@ def main():
             continue
             
         # Compare (Tolerance of 1 degree)
-        match_min = abs(c_min - f_min) <= 1.0
-        match_max = abs(c_max - f_max) <= 1.0
+        match_min = abs(c_min - f_min) <= args.tol
+        match_max = abs(c_max - f_max) <= args.tol
         
         status = "OK" if (match_min and match_max) else "MISMATCH"
         if status == "MISMATCH": all_match = False
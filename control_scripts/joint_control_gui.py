@@ -1,8 +1,5 @@
-from ast import arg
-import threading
-from argparse import _StoreFalseAction
-from PIL._imaging import font
 import os 
+import sys
 import time
 import threading
 import tkinter as tk
@@ -11,9 +8,14 @@ from tkinter import font as tkfont
 from pymycobot import MyArmMControl
 
 
-os.sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from utils.connection import list_serial_ports
+    from utils.command_worker import CommandWorker
+    from utils.telemetry import TelemetryPoller
+    from utils.strip_chart import StripChart
+    from utils.step_response import StepDetector
+    import config
 except ImportError:
     print("Error: Could not import project modules.")
     sys.exit(1)
@@ -23,15 +25,23 @@ class JointController(tk.Frame):
         super().__init__(root)
         self.root = root
         self.root.title("M750 - Joint Controller")
-        self.root.geometry("800x450")
+        self.root.geometry("900x950")
         self.arm = None
         self.slider = []
+        # One step scorer per arm joint (commanded slider vs measured angle)
+        self.step_detectors = [StepDetector(threshold=2.0, tol=1.0, hold=0.3) for _ in range(6)]
+        self.step_results = [None] * 6
         self.pack(fill="both", expand=True)
         self.create_widgets()
         self.ports = list_serial_ports()
-        self.send_delay = 0.05
-        self.debounce_id = None
-        self.last_send_time = 0
+        self.speed = 60
+        self.max_send_hz = 20.0
+        self.worker = None           # Owns all serial commands (off the Tk thread)
+        self.poller = None           # Owns all serial state reads (off the Tk thread)
+        self.latest_angles = None
+        self.ui_period_ms = 16       # ~60 fps telemetry drain
+        self.chart_period = 1.0 / 30.0  # strip chart redraw ~30 fps
+        self.last_chart = 0.0
         self.connect_status = False
         self.is_syncing = False
         
@@ -45,102 +55,75 @@ class JointController(tk.Frame):
             self.port_combo.set("No ports found")
         
     def connect_to_robot(self, port):
+        # Runs on a background thread (see toggle_connection)
         try:
-            self.arm = MyArmMControl(port)
-            if self.arm:
-                time.sleep(0.1)
-                angles = self.fetch_angles()
-
-                if angles is not None and len(angles) > 0:
-                    self.connect_status = True
-                    return True
-                else:
-                    self.arm = None
-                    self.connect_status = False
-                    return False
-            else:
-                self.arm = None
-                self.connect_status = False
-                return False
+            arm = MyArmMControl(port)
+            time.sleep(0.1)
+            angles = arm.get_angles()
+            if angles is not None and len(angles) > 0:
+                return arm, angles, None
+            return None, None, None
         except Exception as e:
-            self.arm = None
-            self.connect_status = False
-            messagebox.showerror("Error", str(e))
-            return False     
+            return None, None, e
 
-    def fetch_angles(self):
-        if self.connect_status:
-            angles = self.arm.get_angles()
-            return angles
-        else:
-            return None
-
-    # Debounce function to prevent sending too many requests to the robot
-    def push_angles(self, speed = 60):
-        ref_time = time.time()
-        if self.connect_status:
-            angles = self.slider
-            self.arm.send_angles(angles, speed)
-            if self.is_syncing and self.arm is None:
-                return
-            if time.time() - ref_time > self.send_delay:
-                self._execute_push_angles()
-                self.last_send_time = ref_time
-            if self.debounce_id:
-                self.root.after_cancel(self.debounce_id)
+    # Slider callback: hand the newest target to the worker. Never touches serial.
+    def push_angles(self, _value=None):
+        if not self.connect_status or self.is_syncing or self.worker is None:
+            return
+        # write_angles takes the 6 arm joints (slider 7 is the gripper)
+        angles = [float(s.get()) for s in self.slider[:6]]
+        self.worker.submit(angles, self.speed)
 
-            self.debounce_id = self.root.after(100, lambda: self._push_angles_thread(speed))
-    
-    # Thread wrapper over function to send angles to the robot
-    def _push_angles_thread(self, speed):
-        threading.Thread(target=self._send_to_robot, arg=(speed,), daemon=True).start()
-    
-    # Function to send angles to the robot
-    def _send_to_robot(self, speed):
-        try:
-            angles = [s.get() for s in self.slider]
-            self.arm.send_angles(angles, speed)
-        except Exception as e:
-            print(f"Error sending angles: {e}")
+    # Runs on the worker thread
+    def _send_to_robot(self, angles, speed):
+        self.arm.write_angles(angles, speed)
 
-    def sync_sliders(self,angles):
-        angles = self.fetch_angles()
+    def sync_sliders(self, angles):
         if angles:
             # Writing data to angle buffer
-            self.is_syncing = True          # Prevent slider buffer from updating while syncing  
-            for i, angle in enumerate(angles):
+            self.is_syncing = True          # Prevent slider callbacks from sending while syncing  
+            for i, angle in enumerate(angles[:len(self.slider)]):
                 self.slider[i].set(angle)
             self.is_syncing = False         # Allow slider buffer to update
     
-    def update_led(self):
+    def update_led(self, powered=None):
         #Updates the LED color based on connection and power state.
         if not self.connect_status:
             color = "grey"      # No connection
+        elif powered:
+            color = "#00FF00"  # Bright Green (Power On)
         else:
-            # Check robot power state via API
-            if self.arm and self.arm.is_powered_on():
-                color = "#00FF00"  # Bright Green (Power On)
-            else:
-                color = "#FF0000"  # Red (Connected but Power Off)
+            color = "#FF0000"  # Red (Connected but Power Off)
     
         self.status_led.itemconfig(self.led_circle, fill=color)
+
+    def _query_power(self):
+        # Worker thread: read power state, then hand the result back to Tk
+        powered = self.arm.is_powered_on() == 1
+        self.root.after(0, lambda: self.update_led(powered))
+        return powered
     
     def toggle_power(self):
         if self.connect_status and self.arm:
-            try:
-                if self.arm.is_power_on():
-                    self.arm.power_off()
-                    self.power_btn.config(bg="gray")
-                else:
-                    self.arm.power_on()
-                    self.power_btn.config(bg="green")
-                # Brief delay to allow hardware state to flip before we check it
-                self.root.after(200, self.update_led)
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            self.worker.run_call(self._toggle_power)
         else:
             messagebox.showwarning("Warning", "Connect to the robot first!")
 
+    def _toggle_power(self):
+        # Worker thread
+        if self.arm.is_powered_on() == 1:
+            self.arm.power_off()
+            self.root.after(0, lambda: self.power_btn.config(bg="gray"))
+        else:
+            self.arm.power_on()
+            self.root.after(0, lambda: self.power_btn.config(bg="green"))
+        # Brief delay to allow hardware state to flip before we check it
+        time.sleep(0.2)
+        self._query_power()
+
+    def _on_worker_error(self, e):
+        print(f"Error sending command: {e}")
+
     def toggle_connection(self):
         if not self.connect_status:
             port = self.port_combo.get()
@@ -148,38 +131,117 @@ class JointController(tk.Frame):
             if not port or port == "No ports found":
                 messagebox.showerror("Error", "Please select a port.")
                 return
-            # Success
-            if self.connect_to_robot(port):
-                print("Connection Success")
-                if self.connect_status :
-                    self.connect_btn.config(text="Disconnect", bg="#f44336", fg="white")
-                    self.port_combo.config(state="disabled")
-
-                    self.update_led()
-                    angles = self.fetch_angles()
-                    self.root.after(500, self.sync_sliders(angles))
+            self.connect_btn.config(state="disabled")
 
-                    messagebox.showinfo("Connected", f"Successfully linked to {port}")
-
-            # Failure
-            else:
-                print("Connection Failed")
-                self.connect_status = False
-                self.connect_btn.config(text="Connect", bg="green", fg="white")
-                self.port_combo.config(state="readonly")
-
-                self.update_led()
-
-                messagebox.showerror("Connection Failed", f"Could not communicate with M750 on {port}. Check the cable and ensure the robot is powered on.")
+            def worker():
+                result = self.connect_to_robot(port)
+                self.root.after(0, lambda: self._on_connected(port, *result))
+            threading.Thread(target=worker, daemon=True).start()
         # Disconnect
         else:
             print("Disconnecting from robot")
+            self._stop_workers()
             self.arm = None
             self.connect_btn.config(text="Connect", fg="white", bg="green")
             self.port_combo.config(state="readonly")
             self.connect_status = False
             self.update_led()
 
+    def _on_connected(self, port, arm, angles, error):
+        # Tk thread
+        self.connect_btn.config(state="normal")
+        # Success
+        if arm is not None:
+            print("Connection Success")
+            self.arm = arm
+            self.connect_status = True
+            self.worker = CommandWorker(self._send_to_robot, max_rate_hz=self.max_send_hz,
+                                        on_error=self._on_worker_error)
+            self.worker.start()
+
+            self.connect_btn.config(text="Disconnect", bg="#f44336", fg="white")
+            self.port_combo.config(state="disabled")
+
+            self.sync_sliders(angles)
+            self.poller = TelemetryPoller(self.arm, rate_hz=30.0, power_every=15)
+            self.poller.start()
+            self.root.after(self.ui_period_ms, self._drain_telemetry)
+
+            messagebox.showinfo("Connected", f"Successfully linked to {port}")
+
+        # Failure
+        else:
+            print("Connection Failed")
+            self.connect_status = False
+            self.connect_btn.config(text="Connect", bg="green", fg="white")
+            self.port_combo.config(state="readonly")
+
+            self.update_led()
+
+            if error is not None:
+                messagebox.showerror("Error", str(error))
+            else:
+                messagebox.showerror("Connection Failed", f"Could not communicate with M750 on {port}. Check the cable and ensure the robot is powered on.")
+
+    def _stop_workers(self):
+        if self.poller:
+            self.poller.stop()
+            self.poller.report()
+            self.poller = None
+        if self.worker:
+            self.worker.stop()
+            self.worker.report()
+            self.worker = None
+
+    def _drain_telemetry(self):
+        # Tk thread: apply the newest snapshot, then reschedule
+        if self.poller is None:
+            return
+        snap = self.poller.latest()
+        if snap:
+            if snap['angles']:
+                self.latest_angles = snap['angles']
+                self._track_steps(snap['t'], snap['angles'])
+            if snap['powered'] is not None:
+                self.update_led(snap['powered'])
+
+        now = time.monotonic()
+        if now - self.last_chart >= self.chart_period:
+            self.last_chart = now
+            self.chart.redraw(now)
+        self.root.after(self.ui_period_ms, self._drain_telemetry)
+
+    def _track_steps(self, t, angles):
+        # Tk thread: feed the chart and the per-joint step scorers
+        commanded = [float(s.get()) for s in self.slider[:6]]
+        actual = list(angles[:6])
+        self.chart.append(t, commanded, actual)
+        updated = False
+        for i, det in enumerate(self.step_detectors):
+            if i >= len(actual):
+                break
+            m = det.update(t, commanded[i], actual[i])
+            if m:
+                self.step_results[i] = m
+                updated = True
+        if updated:
+            self._show_steps()
+
+    def _show_steps(self):
+        parts = []
+        for i, m in enumerate(self.step_results):
+            if m is None:
+                continue
+            settle = f"{m['settle_time']:.2f}s" if m['settle_time'] is not None else "n/s"
+            parts.append(f"J{i+1}: settle {settle}, OS {m['overshoot']:.0f}%, err {m['final_error']:+.1f}°")
+        self.step_var.set("   ".join(parts))
+
+    def on_close(self):
+        self._stop_workers()
+        st = self.chart.stats()
+        print(f"Strip chart: frames={st['frames']} redraw={st['redraw_ms_avg']:.1f}ms avg / {st['redraw_ms_max']:.1f}ms max")
+        self.root.destroy()
+
     def create_widgets(self):
         # Port Section
         header_frame = tk.Frame(self, pady=20)
@@ -234,10 +296,19 @@ class JointController(tk.Frame):
             joint_slider.pack(side="left")
             self.slider.append(joint_slider)
 
+        # Step response summary (last completed step per joint)
+        self.step_var = tk.StringVar(value="Step response: move a slider")
+        tk.Label(self, textvariable=self.step_var, font=("Helvetica", 10), wraplength=860, justify="left").pack(fill="x", padx=10)
+
+        # Commanded vs actual strip chart for the 6 arm joints (blitted)
+        self.chart = StripChart(self, n_joints=6, y_limits=config.M750_LIMITS, window=10.0, rate_hz=30.0, figsize=(8, 5))
+        self.chart.widget().pack(fill="both", expand=True, padx=10, pady=5)
+
 def main():
     try :
         root = tk.Tk()
         app = JointController(root)
+        root.protocol("WM_DELETE_WINDOW", app.on_close)
         app.mainloop()
 
         app.after(1000, lambda: app.destroy())
@@ -3,13 +3,13 @@
 import sys
 import os
 import time
-import numpy as np
 
 # Adjust path to import config/utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from pymycobot import MyArmC
     from utils import connection, mapping
+    from utils.terminal_dashboard import TerminalDashboard
 except ImportError:
     print("Error: Could not import project modules.")
     sys.exit(1)
@@ -26,8 +26,28 @@ def main():
         print(f"Connection Failed: {e}")
         return
         
+    # Newest reading, shared with the dashboard's refresh timer
+    latest = {'angles': None, 'outputs': None, 'norms': None, 't': None}
+    reads = {'ok': 0, 'bad': 0}
+
+    def render():
+        angles = latest['angles']
+        if angles is None:
+            return None
+        lines = ["=== C650 -> M750 Live Mapping ===",
+                 f"{'Joint':<5} | {'Input (C650)':<12} | {'Norm (0-1)':<10} | {'Output (M750)':<13}",
+                 "-" * 50]
+        for i in range(6):
+            lines.append(f"J{i+1:<4} | {angles[i]:<12.2f} | {latest['norms'][i]:<10.3f} | {latest['outputs'][i]:<13.2f}")
+        lines.append("-" * 50)
+        lines.append(f"Reads: {reads['ok']} ok / {reads['bad']} bad | Age: {(time.monotonic() - latest['t'])*1000:5.0f} ms")
+        return lines
+
+    dashboard = TerminalDashboard(render, refresh_hz=10.0)
+
     print("\nStarting Monitoring loop... (Ctrl+C to Stop)")
-    
+    dashboard.start()
+
     try:
         while True:
             angles = leader.get_joints_angle()
@@ -35,40 +55,19 @@ def main():
             if angles and len(angles) >= 6:
                 # Process
                 outputs, norms = mapping.process_arm_angles(angles)
+                latest.update(angles=angles, outputs=outputs, norms=norms, t=time.monotonic())
+                reads['ok'] += 1
+            else:
+                reads['bad'] += 1
                 
-                # Clear Screen / Move Cursor Home (ANSI)
-                # print("\033[H\033[J", end="") # Clear whole screen? Might flicker.
-                # Just print a few newlines or specific clear?
-                # Let's simple use "Move Cursor to Top-Left" + clear if easy, 
-                # or just print a large block of text.
-                # Better: Clear screen once at start, then just overwrite? 
-                # Simple approach for now: clear command.
-                os.system('cls' if os.name == 'nt' else 'clear')
-
-                print("=== C650 -> M750 Live Mapping ===")
-                print(f"{'Joint':<5} | {'Input (C650)':<12} | {'Norm (0-1)':<10} | {'Output (M750)':<13}")
-                print("-" * 50)
-                
-                for i in range(6):
-                    j_in = angles[i]
-                    j_norm = norms[i]
-                    j_out = outputs[i]
-                    
-                    # Highlights?
-                    # If norm is clamped (0 or 1), maybe bold?
-                    
-                    print(f"J{i+1:<4} | {j_in:<12.2f} | {j_norm:<10.3f} | {j_out:<13.2f}")
-                    
-                print("-" * 50)
-                print(f"Time: {time.time():.2f}")
-                
-            time.sleep(0.1) # 10Hz Refresh
-            
-    except KeyboardInterrupt:
-        print("\nStopped.") 
+            time.sleep(0.02) # Read rate; the display refreshes at its own 10Hz
             
     except KeyboardInterrupt:
+        pass
+    finally:
+        dashboard.close()
         print("\nStopped.")
+        dashboard.report()
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,12 @@
 import time
 import sys
+import os
 import serial.tools.list_ports
 from pymycobot import MyArmC, MyArmMControl
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.transport import ResilientArm
+
 # --- Configuration & Helper Functions ---
 
 # Gripper mapping equation from official demo
@@ -83,7 +87,9 @@ def main():
     leader_port = select_port("Select LEADER (C650) port:")
     print(f"Connecting to Leader at {leader_port}...")
     try:
-        leader = MyArmC(leader_port, 1000000) # Default baudrate usually 1M
+        # Default baudrate usually 1M. Wrapped so read errors back off and the link reconnects.
+        leader = ResilientArm(lambda p: MyArmC(p, 1000000), leader_port,
+                              read_method='get_joints_angle', expected_len=7)
         print("Leader connected.")
     except Exception as e:
         print(f"Failed to connect to Leader: {e}")
@@ -94,7 +100,8 @@ def main():
     print(f"Connecting to Follower at {follower_port}...")
     try:
         # User requested MyArmMControl for better gripper support
-        follower = MyArmMControl(follower_port, 1000000)
+        follower = ResilientArm(lambda p: MyArmMControl(p, 1000000), follower_port,
+                                read_method='get_angles', expected_len=6)
         print("Follower connected.")
         
         # Explicitly enable gripper as requested
@@ -108,44 +115,24 @@ def main():
 
     print("\nStarting Teleop... Press Ctrl+C to stop.")
     
-    # Track errors to avoid spamming
-    error_count = 0 
-    
     try:
         while True:
-            try:
-                # Read angles from Leader
-                angles = leader.get_joints_angle()
-                
-                # Check if read was successful
-                if angles is None or len(angles) == 0:
-                    continue
-                    
-                # Check for invalid values (communication errors)
-                if max(angles) > 200 or min(angles) < -200:
-                    continue
-
-                # Reset error count on successful read
-                error_count = 0
-
-                # Process angles (Mapping & Limits)
-                target_angles = flexible_parameters(angles, rollback=True)
-
-                # Send to Follower
-                # Speed=50 is standard for teleop smoothness
-                follower.write_angles(target_angles, 50) # MyArmMControl uses write_angles
-                
-                # Small delay to prevent flooding serial bus
-                time.sleep(0.02)
-                
-            except OSError as e:
-                # Handle "Input/output error" (Errno 5) transparently if possible
-                if error_count < 5:
-                    print(f"Serial Error (retrying): {e}")
-                    error_count += 1
-                    time.sleep(0.5)
-                else:
-                    raise e
+            # Read angles from Leader.
+            # None = failed / short / out-of-range read; the wrapper has already
+            # backed off, and reconnects in the background if the port dropped.
+            angles = leader.read()
+            if angles is None:
+                continue
+
+            # Process angles (Mapping & Limits)
+            target_angles = flexible_parameters(angles, rollback=True)
+
+            # Send to Follower
+            # Speed=50 is standard for teleop smoothness
+            follower.write_angles(target_angles, 50) # MyArmMControl uses write_angles
+            
+            # Small delay to prevent flooding serial bus
+            time.sleep(0.02)
 
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -155,11 +142,10 @@ def main():
         traceback.print_exc()
     finally:
         print("Closing connections...")
-        # Try/Except close in case they weren't open
-        try: leader._serial_port.close() 
-        except: pass
-        try: follower._serial_port.close() 
-        except: pass
+        leader.report("Leader")
+        follower.report("Follower")
+        leader.close()
+        follower.close()
         print("Done.")
 
 if __name__ == "__main__":
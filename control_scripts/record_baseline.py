@@ -1,9 +1,9 @@
 
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import sys
 import os
-import json
 import time
 from datetime import datetime
 
@@ -11,27 +11,35 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pymycobot import MyArmMControl
 from utils import connection
+from utils.task_scheduler import RateScheduler
+from utils.pose_store import PoseStore
+from utils.transport import classify_read, ERR_IO
+from utils.rate_stats import RateStats
+from utils.trajectory_recorder import TrajectoryRecorder
+from utils.motion_trigger import SegmentRecorder
 
 DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'baselines.json')
 
-def load_baselines():
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
-    return {}
-
-def save_baselines(data):
-    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
-    print(f"Saved to {DATA_FILE}")
+def parse_name(cmd):
+    """'lift_high #pick #test' -> ('lift_high', ['pick', 'test'])"""
+    words = cmd.split()
+    tags = [w[1:] for w in words if w.startswith('#') and len(w) > 1]
+    name = " ".join(w for w in words if not w.startswith('#'))
+    return name, tags
+
+def read_pose(m750):
+    """Validated 6-joint read: the angle list, or None on an I/O error or a bad read (None / -1 / short)."""
+    try:
+        angles = m750.get_angles()
+    except OSError:
+        return None
+    if classify_read(angles, 6):
+        return None
+    return angles
 
 import csv
 
-def record_trajectory(m750):
+def record_trajectory(m750, max_rate=False, rate_hz=10.0, gripper_hz=2.0, trigger=0.0):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_dir = os.path.dirname(DATA_FILE) # data/
     traj_dir = os.path.join(base_dir, 'baselines')
@@ -39,50 +47,104 @@ def record_trajectory(m750):
     
     filename = os.path.join(traj_dir, f"baseline_traj_{timestamp}.csv")
     
-    print(f"\n--- Trajectory Mode ---")
+    print(f"\n--- Trajectory Mode ({'max rate' if max_rate else f'{rate_hz:g} Hz'}, gripper {gripper_hz:g} Hz) ---")
     print(f"Recording to: {filename}")
     print("Press Ctrl+C to STOP recording.")
     print("Starting in 3 seconds...")
     time.sleep(3)
     print("GO!")
-    
+
+    header = ["Timestamp", "J1", "J2", "J3", "J4", "J5", "J6", "Gripper"]
+    status = lambda t, a: print(f"\rRecording... T={t:.1f}s | J1={a[0]:.2f}", end="")
+    if max_rate and trigger:
+        # Only motion is persisted, as baseline_traj_<ts>_segNNN.csv (+ _segments.json index)
+        segments = SegmentRecorder(filename, header, threshold=trigger)
+        rec = TrajectoryRecorder(m750, segments, gripper_hz=gripper_hz,
+                                 status=lambda t, a: status(t, a) if segments.recording else None)
+        try:
+            rec.run()
+        except KeyboardInterrupt:
+            print()
+        segments.close()
+        rec.report()
+        segments.report()
+        return
+
     with open(filename, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(["Timestamp", "J1", "J2", "J3", "J4", "J5", "J6", "Gripper"])
-        
-        start_time = time.time()
-        try:
-            while True:
+        writer.writerow(header)
+
+        if max_rate:
+            # Joints back-to-back, gripper decimated to gripper_hz
+            rec = TrajectoryRecorder(m750, writer, gripper_hz=gripper_hz, status=status)
+            try:
+                rec.run()
+            except KeyboardInterrupt:
+                print(f"\nSaved {filename}")
+            rec.report()
+            return
+
+        start_time = time.monotonic()
+        state = {'gripper': 0, 'angles': None, 't': 0.0}
+        joint_stats = RateStats()
+
+        def joints_task():
+            try:
                 angles = m750.get_angles()
-                if not isinstance(angles, list) or len(angles) < 6:
-                     # print(f"Invalid angles: {angles}")
-                     time.sleep(0.01)
-                     continue
-                
-                # Try to get gripper
-                gripper = 0
-                try:
-                    gripper = m750.get_gripper_value()
-                except:
-                    pass
-
-                t = time.time() - start_time
-                row = [f"{t:.4f}"] + angles + [gripper]
-                writer.writerow(row)
-                
-                print(f"\rRecording... T={t:.1f}s | J1={angles[0]:.2f}", end="")
-                time.sleep(0.1) # 10Hz
-                
+            except OSError:
+                joint_stats.drop(ERR_IO)
+                return
+            now = time.monotonic()
+            err = classify_read(angles, 6)
+            if err:
+                joint_stats.drop(err)
+                return
+            joint_stats.tick(now)
+            t = now - start_time
+            # Gripper value is carried forward between (slower) gripper polls
+            row = [f"{t:.4f}"] + angles[:6] + [state['gripper']]
+            writer.writerow(row)
+            state['angles'], state['t'] = angles, t
+
+        def gripper_task():
+            try:
+                value = m750.get_gripper_value()
+            except OSError:
+                return
+            if isinstance(value, (int, float)) and value >= 0:
+                state['gripper'] = value
+
+        def status_task():
+            if state['angles']:
+                print(f"\rRecording... T={state['t']:.1f}s | J1={state['angles'][0]:.2f}", end="")
+
+        tasks = RateScheduler()
+        tasks.add("joints", joints_task, rate_hz, priority=0)
+        tasks.add("gripper", gripper_task, gripper_hz, priority=1)
+        tasks.add("status", status_task, 2.0, priority=2)
+
+        try:
+            tasks.run()
         except KeyboardInterrupt:
             print(f"\nSaved {filename}")
+            tasks.report(time.monotonic() - start_time)
+            joint_stats.report("Joints")
 
 def main():
+    parser = argparse.ArgumentParser(description="Record M750 baseline poses or trajectories")
+    parser.add_argument("--rate", type=float, default=10.0, help="Trajectory joint rate (Hz) in mode 2")
+    parser.add_argument("--gripper-hz", type=float, default=2.0, help="Gripper poll rate (Hz); carried forward in between")
+    parser.add_argument("--trigger", type=float, default=0.0,
+                        help="Mode 3: only record motion faster than this (deg/s), split into segments")
+    args = parser.parse_args()
+
     print("=== MyArm M750 Baseline Recorder ===")
     print("Select Mode:")
-    print("1. Static Poses (Save single snapshots to JSON)")
+    print("1. Static Poses (Save single snapshots to the pose library)")
     print("2. Trajectory Stream (Record continuous CSV to data/baselines/)")
-    
-    mode = input("Enter Mode (1 or 2): ").strip()
+    print("3. Trajectory Stream, max rate (joints as fast as the port allows)")
+
+    mode = input("Enter Mode (1, 2 or 3): ").strip()
     
     port = connection.select_port("Select M750 (Follower) Port:")
     try:
@@ -97,39 +159,45 @@ def main():
         print(f"Connection Failed: {e}")
         return
 
-    if mode == '2':
-        record_trajectory(m750)
+    if mode in ('2', '3'):
+        record_trajectory(m750, max_rate=(mode == '3'), rate_hz=args.rate, gripper_hz=args.gripper_hz,
+                          trigger=args.trigger)
     else:
-        # Static Mode
-        baselines = load_baselines()
+        # Static Mode: each saved pose is one appended line in the pose store
+        store = PoseStore()
+        print(f"Pose library: {len(store)} poses in {store.path}")
 
         try:
             while True:
-                angles = m750.get_angles()
-                if not angles:
+                angles = read_pose(m750)
+                if angles is None:
                     print("Failed to read angles. Retrying...")
                     time.sleep(0.5)
                     continue
                     
                 print(f"\rCurrent Angles: {[round(a, 2) for a in angles]}", end="")
                 
-                cmd = input("\n[Enter Name] to save, [q] to quit: ").strip()
+                cmd = input("\n[Enter Name #tag ...] to save, [q] to quit: ").strip()
                 if cmd.lower() == 'q':
                     break
                 
-                if cmd:
-                    angles = m750.get_angles()
-                    entry = {
-                        "timestamp": datetime.now().isoformat(),
-                        "angles": angles,
-                        "desc": cmd
-                    }
-                    baselines[cmd] = entry
-                    save_baselines(baselines)
-                    print(f"Saved pose '{cmd}': {angles}")
+                name, tags = parse_name(cmd)
+                if name:
+                    angles = read_pose(m750)
+                    if angles is None:
+                        print(f"Read failed, pose '{name}' not saved. Try again.")
+                        continue
+                    t0 = time.perf_counter()
+                    store.put(name, angles, desc=name, tags=tags)
+                    dt = (time.perf_counter() - t0) * 1000
+                    print(f"Saved pose '{name}' {tags or ''}: {angles} ({dt:.1f} ms)")
                 
         except KeyboardInterrupt:
             print("\nExiting...")
+        finally:
+            result = store.compact_if_needed()
+            if result:
+                print(f"Compacted pose store: {result[0]} -> {result[1]} bytes")
     
     try:
         m750._serial_port.close()
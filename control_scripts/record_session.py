@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import argparse
+import sys
+import os
+import time
+import datetime
+
+# Adjust path to import config/utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pymycobot import MyArmC, MyArmMControl
+from utils import connection
+from utils.sync_recorder import SyncRecorder, SESSION_DIR
+
+def main():
+    parser = argparse.ArgumentParser(description="Record C650 + M750 together on one clock (for solve_mapping --session)")
+    parser.add_argument("--no-release", action="store_true", help="Keep M750 servos engaged (e.g. while teleop drives it)")
+    parser.add_argument("--flush", type=float, default=0.5, help="Seconds between CSV flushes")
+    args = parser.parse_args()
+
+    print("=== Synchronized C650 + M750 Recorder ===")
+    p_lead = connection.select_port("Select LEADER (C650) port:")
+    p_follow = connection.select_port("Select FOLLOWER (M750) port:")
+    try:
+        leader = MyArmC(p_lead, 1000000)
+        follower = MyArmMControl(p_follow, 1000000)
+        print("Connected.")
+    except Exception as e:
+        print(f"Connection Failed: {e}")
+        return
+
+    if not args.no_release:
+        follower.release_all_servos()
+        print("M750 servos released. Move both arms through the same poses.")
+
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(SESSION_DIR, f"sync_{timestamp}.csv")
+    rec = SyncRecorder(leader.get_joints_angle, follower.get_angles, path)
+    print(f"Recording to: {path}")
+    print("Press Ctrl+C to stop.")
+
+    rec.start()
+    try:
+        while True:
+            time.sleep(args.flush)
+            rec.flush()
+            st = rec.stats()
+            lead, follow = rec.latest('leader'), rec.latest('follower')
+            print(f"\rT={st['duration_s']:.1f}s | C650 {st['leader']['rate_hz']:.0f} Hz "
+                  f"J1={lead[0] if lead else 0:.1f} | M750 {st['follower']['rate_hz']:.0f} Hz "
+                  f"J1={follow[0] if follow else 0:.1f}   ", end="")
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        rec.close()
+        rec.report()
+        print(f"Saved {path}")
+        for arm in (leader, follower):
+            try: arm._serial_port.close()
+            except: pass
+
+if __name__ == "__main__":
+    main()
@@ -1,77 +1,26 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import sys
 import os
 import time
-import re
 import numpy as np
 
 # Adjust path to import config/utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pymycobot import MyArmMControl
 from utils import connection
-
-CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.py')
-
-def update_config_file(new_limits):
-    """
-    Reads config.py and replaces the M750_LIMITS block with new values.
-    new_limits: List of tuples [(min, max), ...]
-    """
-    with open(CONFIG_PATH, 'r') as f:
-        content = f.read()
-
-    # Create the new string representation
-    # Format:
-    # M750_LIMITS = [
-    #     (165.0, -165.0),
-    #     ...
-    # ]
-    new_block = "M750_LIMITS = [\n"
-    for mn, mx in new_limits:
-        # Ensure correct ordering for config (usually we want safe ranges)
-        # Config expects specific order? No, just tuples. 
-        # But wait, config comment says "J1: Solver suggested inversion (102, -312)".
-        # IF we are setting HARDWARE limits, we usually want (Min, Max).
-        # HOWEVER, our mapping logic handles inversion based on config order (start, end).
-        # If the user physically moved Min -> Max, we should detect which is which?
-        # Actually, let's stick to (Min, Max) sorted for safety, unless user wants inversion.
-        # But wait, J1 and J6 are inverted in current config.
-        # Let's just write (Min, Max) sorted, and let the user flag inversion if needed?
-        # Or better: Just write (Min, Max). The mapping logic `np.interp` handles direction 
-        # based on C650 Limits order vs M750 Limits order. 
-        # IF C650 is (Low->High) and M750 is (Low->High), it's normal.
-        # IF C650 is (Low->High) and M750 is (High->Low), it's inverted.
-        
-        # For now, let's write sorted (Min, Max) to be safe standard limits.
-        # The User might need to invert them manually if direction is wrong.
-        # OR: We preserve the 'Direction' from the *old* config? 
-        # That's too complex. Let's write (Min, Max) and warn user.
-        
-        # ACTUALLY: The user's current config has (165, -165). This implies Inversion.
-        # If we overwrite with (-165, 165), we might Flip the control.
-        # Let's output valid python code and let the user decide? 
-        # No, the user asked to "update config accordingly".
-        
-        # Strategy: Write the Measured Min/Max. Sorting them (Min, Max).
-        # If direction is wrong, user can swap them in config.
-        
-        new_block += f"    ({mn:.1f}, {mx:.1f}),\n"
-    new_block += "]"
-
-    # Regex to find the block
-    # Matches M750_LIMITS = [ ... ] (multiline)
-    pattern = r"M750_LIMITS\s*=\s*\[[\s\S]*?\]"
-    
-    if re.search(pattern, content):
-        new_content = re.sub(pattern, new_block, content)
-        with open(CONFIG_PATH, 'w') as f:
-            f.write(new_content)
-        print(f"Successfully updated {CONFIG_PATH}")
-    else:
-        print("Error: Could not find M750_LIMITS block in config.py")
+from utils.range_learner import RangeLearner
+from utils import calibration
 
 def main():
+    parser = argparse.ArgumentParser(description="Learn M750 joint limits and write them to firmware/calibration")
+    parser.add_argument("--lower-pct", type=float, default=0.2, help="Percentile used for the learned minimum")
+    parser.add_argument("--upper-pct", type=float, default=99.8, help="Percentile used for the learned maximum")
+    parser.add_argument("--sketch", help="Range sketch JSON from earlier sessions (e.g. m750_range_monitor --sketch); "
+                                         "merged in, and saved back with this session")
+    args = parser.parse_args()
+
     print("=== MyArm M750 Auto-Limit Learner ===")
     
     port = connection.select_port("Select M750 Port:")
@@ -97,34 +46,46 @@ def main():
         print("Failed to read angles. Exiting.")
         return
         
-    min_vals = list(initial_angles)
-    max_vals = list(initial_angles)
+    # Robust percentiles instead of raw min/max: one corrupted read must not
+    # widen a limit that is about to be written to firmware.
+    learner = RangeLearner(n_joints=6, lower_pct=args.lower_pct, upper_pct=args.upper_pct)
+    if args.sketch and os.path.exists(args.sketch):
+        learner.merge(RangeLearner.load(args.sketch))
+        print(f"Merged earlier sessions from {args.sketch}")
+    learner.update(initial_angles)
     
     print("\nLearning... Move the robot! (Ctrl+C to Finish)")
     try:
         while True:
             angles = m750.get_angles()
             if angles and len(angles) == 6:
-                for i in range(6):
-                    if angles[i] < min_vals[i]: min_vals[i] = angles[i]
-                    if angles[i] > max_vals[i]: max_vals[i] = angles[i]
+                learner.update(angles)
                 
                 # Print Status
-                status = " | ".join([f"J{i+1}: {min_vals[i]:.0f}..{max_vals[i]:.0f}" for i in range(6)])
+                status = " | ".join([f"J{i+1}: {s[0]:.0f}..{s[1]:.0f}" if s else f"J{i+1}: ---"
+                                     for i, s in enumerate(learner.suggest())])
                 print(f"\r{status}", end="")
                 
             time.sleep(0.05)
             
     except KeyboardInterrupt:
         print("\n\n--- Learning Finished ---")
+    learner.report("Learned Ranges")
+    if args.sketch:
+        learner.save(args.sketch)
     
+    if any(s is None for s in learner.suggest()):
+        print("No valid readings for some joints. Exiting without changes.")
+        return
+
     # Pad limits slightly for safety? (e.g. +/- 1 degree? No, user wants FULL range)
     # Let's round to nearest integer
     new_limits = []
     for i in range(6):
         # Firmware typically wants Ints
-        mn = int(np.floor(min_vals[i]))
-        mx = int(np.ceil(max_vals[i]))
+        lo, hi = learner.suggest(i)
+        mn = int(np.floor(lo))
+        mx = int(np.ceil(hi))
         new_limits.append((mn, mx))
         print(f"Joint {i+1}: Measured Range [{mn}, {mx}]")
 
@@ -145,14 +106,19 @@ def main():
     else:
         print("Skipped Firmware Update.")
 
-    print("\n--- Step 3: Update Config File ---")
-    confirm_cfg = input("Update config.py with these limits? (y/n): ").strip().lower()
+    print("\n--- Step 3: Update Calibration ---")
+    confirm_cfg = input("Save these limits as a new calibration version? (y/n): ").strip().lower()
     if confirm_cfg == 'y':
-        # Prepare limits for config (Tuples)
-        # Note: We pass them as (Min, Max). User can invert later if needed.
-        update_config_file(new_limits)
+        # Keep the direction of the current calibration: inverted joints stay (Max, Min).
+        current = calibration.load(force=True)
+        oriented = []
+        for i, (mn, mx) in enumerate(new_limits):
+            old_lo, old_hi = current.m750_limits[i]
+            oriented.append((float(mx), float(mn)) if old_lo > old_hi else (float(mn), float(mx)))
+        v = calibration.update(note="set_limits", m750_limits=oriented)
+        print(f"Saved calibration v{v} (roll back with: python -m utils.calibration --rollback {v - 1})")
     else:
-        print("Skipped Config Update.")
+        print("Skipped Calibration Update.")
 
 if __name__ == "__main__":
     main()
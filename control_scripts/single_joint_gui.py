@@ -3,7 +3,6 @@
 import sys
 import os
 import time
-import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -12,6 +11,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from pymycobot import MyArmMControl
     from utils import connection
+    from utils.command_worker import CommandWorker
+    from utils.telemetry import TelemetryPoller
+    from utils.strip_chart import StripChart
+    from utils.step_response import StepDetector
 except ImportError:
     print("Error: Could not import project modules.")
     sys.exit(1)
@@ -23,7 +26,7 @@ class SingleJointController:
         self.joint_id = joint_id
         
         self.master.title(f"M750 Control - Joint {joint_id}")
-        self.master.geometry("400x250")
+        self.master.geometry("640x560")
         
         # 1. Get Firmware Limits
         try:
@@ -35,22 +38,27 @@ class SingleJointController:
             self.min_limit = -180
             self.max_limit = 180
 
+        # Commanded target (set by the slider) and live step scoring
+        self.commanded = None
+        self.step_detector = StepDetector(threshold=2.0, tol=1.0, hold=0.3)
+
         # UI Setup
         self.create_widgets()
         
-        # Start Live Update Loop (to show actual pos)
+        # Serial I/O lives on worker threads; Tk only drains their results
+        self.worker = CommandWorker(self._send_angle, max_rate_hz=20.0,
+                                    on_error=lambda e: print(f"Send Error: {e}"))
+        self.worker.start()
+        self.poller = TelemetryPoller(self.robot, rate_hz=30.0, power_every=0)
+        self.poller.start()
+
+        # Start Live Update Loop (to show actual pos), ~60 fps on the Tk thread
         self.running = True
-        self.update_thread = threading.Thread(target=self.monitor_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-        
-def main():
-    root = tk.Tk()
-    app = JointController(root)
-    root.mainloop()
+        self.ui_period_ms = 16
+        self.chart_period = 1.0 / 30.0  # chart redraw ~30 fps
+        self.last_chart = 0.0
+        self.master.after(self.ui_period_ms, self.monitor_loop)
 
-if __name__ == "__main__":
-    main()
     def create_widgets(self):
         # Styles
         style = ttk.Style()
@@ -90,36 +98,65 @@ if __name__ == "__main__":
         btn_rel = ttk.Button(self.master, text="RELEASE SERVOS", command=self.release_servos)
         btn_rel.pack(pady=10)
 
+        # Step response of the last move
+        self.step_var = tk.StringVar(value="Settle: --- | Overshoot: --- | Err: ---")
+        ttk.Label(self.master, textvariable=self.step_var).pack(pady=2)
+
+        # Commanded vs actual strip chart (blitted)
+        self.chart = StripChart(self.master, n_joints=1, labels=[f"J{self.joint_id} (°)"],
+                                y_limits=[(self.min_limit, self.max_limit)], window=10.0, rate_hz=30.0)
+        self.chart.widget().pack(fill="both", expand=True, padx=5, pady=5)
+
     def on_slider_change(self, val):
         angle = float(val)
-        # Send command (Joint, Angle, Speed)
-        # Speed 50 is moderate
-        try:
-            self.robot.send_angle(self.joint_id, angle, 80)
-        except Exception as e:
-            print(f"Send Error: {e}")
+        self.commanded = angle
+        # Newest slider value only; the worker coalesces and rate-limits
+        self.worker.submit(angle, 80)
+
+    def _send_angle(self, angle, speed):
+        # Worker thread: Send command (Joint, Angle, Speed)
+        self.robot.write_angle(self.joint_id, angle, speed)
 
     def release_servos(self):
         print("Releasing servos...")
-        self.robot.release_all_servos()
+        self.worker.run_call(self.robot.release_all_servos)
 
     def monitor_loop(self):
-        while self.running:
-            try:
-                # Read actual angle
-                angles = self.robot.get_angles()
-                if angles and len(angles) >= self.joint_id:
-                    actual = angles[self.joint_id - 1]
-                    self.current_val_var.set(f"Actual: {actual:.2f}°")
-                    
-                    # Optional: Sync slider to actual if not being dragged?
-                    # might cause fighting. Let's just monitor.
-            except Exception:
-                pass
-            time.sleep(0.1)
+        # Tk thread: apply the newest telemetry snapshot (no serial I/O here)
+        if not self.running:
+            return
+        snap = self.poller.latest()
+        if snap and snap['angles'] and len(snap['angles']) >= self.joint_id:
+            actual = snap['angles'][self.joint_id - 1]
+            self.current_val_var.set(f"Actual: {actual:.2f}°")
+
+            # Optional: Sync slider to actual if not being dragged?
+            # might cause fighting. Let's just monitor.
+            self.chart.append(snap['t'], [self.commanded], [actual])
+            if self.commanded is not None:
+                m = self.step_detector.update(snap['t'], self.commanded, actual)
+                if m:
+                    self._show_step(m)
+
+        now = time.monotonic()
+        if now - self.last_chart >= self.chart_period:
+            self.last_chart = now
+            self.chart.redraw(now)
+        self.master.after(self.ui_period_ms, self.monitor_loop)
+
+    def _show_step(self, m):
+        settle = f"{m['settle_time']:.2f}s" if m['settle_time'] is not None else "not settled"
+        self.step_var.set(f"Step {m['start']:.1f}->{m['target']:.1f}° | Settle: {settle} | "
+                          f"Overshoot: {m['overshoot']:.1f}% | Err: {m['final_error']:+.2f}°")
 
     def on_close(self):
         self.running = False
+        self.poller.stop()
+        self.worker.stop()
+        self.poller.report()
+        self.worker.report()
+        st = self.chart.stats()
+        print(f"Strip chart: frames={st['frames']} redraw={st['redraw_ms_avg']:.1f}ms avg / {st['redraw_ms_max']:.1f}ms max")
         self.master.destroy()
 
 def main():
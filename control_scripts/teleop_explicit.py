@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import time
 import sys
 import os
@@ -9,7 +10,18 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pymycobot import MyArmC, MyArmMControl
-from utils import connection, mapping
+from utils import connection, mapping, calibration
+from utils.resampler import SplineResampler
+from utils.speed_scheduler import SpeedScheduler
+from utils.feedback_trim import FeedbackTrimThread
+from utils.task_scheduler import RateScheduler
+from utils.transport import ResilientArm, classify_read
+from utils.watchdog import CommWatchdog
+from utils.web_dashboard import WebDashboard
+from utils.terminal_dashboard import TerminalDashboard
+from utils.flight_recorder import FlightRecorder
+from data_collection.episode_writer import EpisodeWriter
+import config
 
 import threading
 
@@ -17,11 +29,13 @@ import csv
 import datetime
 
 class MonitorThread(threading.Thread):
-    def __init__(self):
+    def __init__(self, refresh_hz=5.0):
         super().__init__()
         self.daemon = True
         self.running = True
         self.latest_data = {}
+        # Console view runs on its own fixed refresh timer
+        self.dashboard = TerminalDashboard(self.render, refresh_hz=refresh_hz)
         
         # Setup CSV logging
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -38,37 +52,51 @@ class MonitorThread(threading.Thread):
                      ["Gripper_In"] + \
                      [f"Norm_J{i}" for i in range(1, 7)] + \
                      [f"Cmd_Output_J{i}" for i in range(1, 7)] + \
-                     ["Gripper_Out"]
+                     ["Gripper_Out", "Cal_Version"]
             writer.writerow(header)
 
     def stop(self):
         self.running = False
+        self.dashboard.close()
 
-    def update(self, raw_in, mapped_arm, gripper_val, norm_vals):
+    def update(self, raw_in, mapped_arm, gripper_val, norm_vals, cal_version):
+        # cal_version: the calibration the mapping used for this frame (follows hot reloads)
         self.latest_data = {
             'raw': raw_in,
             'arm': mapped_arm,
             'gripper': gripper_val,
-            'norm': norm_vals
+            'norm': norm_vals,
+            'cal_version': cal_version
         }
 
+    def render(self):
+        # Console Output (Dashboard), called by the dashboard's refresh timer
+        d = self.latest_data
+        if not d:
+            return None
+        raw = d.get('raw', [])
+        lines = ["=== Teleop Monitor (Input -> Norm -> Output) ===",
+                 f"{'Joint':<6} | {'Input':>8} | {'Norm (%)':>8} | {'Cmd Output':>10}",
+                 "-" * 42]
+        for i in range(6):
+            j_in = f"{raw[i]:8.1f}" if i < len(raw) else f"{'---':>8}"
+            j_norm = f"{d['norm'][i]*100:8.0f}" if i < len(d.get('norm') or []) else f"{'---':>8}"
+            j_out = f"{d['arm'][i]:10.1f}" if i < len(d.get('arm') or []) else f"{'---':>10}"
+            lines.append(f"J{i+1:<5} | {j_in} | {j_norm} | {j_out}")
+        lines.append("-" * 42)
+        lines.append(f"Gripper: In={raw[6] if len(raw) > 6 else 0:.1f} -> Out={d.get('gripper', 0)}")
+        return lines
+
     def run(self):
-        print(f"Monitor Thread Started. Logging to: {os.path.basename(self.log_file)}")
+        print(f"Monitor Thread Started. Logging to: {os.path.basename(self.log_file)} "
+              f"(calibration v{calibration.load().version})")
+        self.dashboard.start()
         while self.running:
             d = self.latest_data
             if not d:
                 time.sleep(0.5)
                 continue
 
-            # Console Output (Dashboard)
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print("=== Teleop Monitor (Input -> Norm -> Output) ===")
-            print(f"  Input:         {[round(x,1) for x in d.get('raw', [])[:6]]}")
-            print(f"  Norm (%):      {[round(x*100,0) for x in d.get('norm', [])]}")
-            print(f"  Cmd Output:    {[round(x,1) for x in d.get('arm', [])]}")
-            print(f"  Gripper:       In={d.get('raw', [])[6] if len(d.get('raw', []))>6 else 0} -> Out={d.get('gripper', 0)}")
-            print("-" * 60)
-            
             # CSV Logging
             try:
                 with open(self.log_file, 'a', newline='') as f:
@@ -78,7 +106,7 @@ class MonitorThread(threading.Thread):
                           [f"{d.get('raw', [])[6]:.2f}" if len(d.get('raw', []))>6 else "0"] + \
                           [f"{x:.3f}" for x in d.get('norm', [])] + \
                           [f"{x:.2f}" for x in d.get('arm', [])] + \
-                          [f"{d.get('gripper', 0)}"]
+                          [f"{d.get('gripper', 0)}", d.get('cal_version')]
                     writer.writerow(row)
             except Exception as e:
                 pass # Don't crash on logging error
@@ -86,12 +114,44 @@ class MonitorThread(threading.Thread):
             time.sleep(0.2)
 
 def main():
+    parser = argparse.ArgumentParser(description="MyArm Leader-Follower Teleop")
+    parser.add_argument("--resample-hz", type=float, default=0,
+                        help="Resample mapped targets onto a uniform grid at this rate (0 = off)")
+    parser.add_argument("--resample-delay", type=float, default=0.06,
+                        help="Resampler delay in seconds (bounds added latency)")
+    parser.add_argument("--speed", default="40",
+                        help="write_angles speed (1-100), or 'auto' to schedule it per cycle")
+    parser.add_argument("--trim", action="store_true",
+                        help="Enable closed-loop trim from background follower feedback reads")
+    parser.add_argument("--trim-hz", type=float, default=5.0,
+                        help="Feedback read rate for --trim")
+    parser.add_argument("--arm-hz", type=float, default=50.0, help="Leader read + arm write rate")
+    parser.add_argument("--gripper-hz", type=float, default=10.0, help="Gripper write rate")
+    parser.add_argument("--telemetry-hz", type=float, default=5.0, help="Monitor/log update rate")
+    parser.add_argument("--watchdog-ms", type=float, default=100.0,
+                        help="Trip if leader frames / follower acks are older than this (0 = off)")
+    parser.add_argument("--watchdog-action", choices=["hold", "stop"], default="hold",
+                        help="hold: stop sending targets; stop: also call stop() on the M750")
+    parser.add_argument("--web", type=int, default=0, metavar="PORT",
+                        help="Serve a live browser dashboard on http://127.0.0.1:PORT (0 = off)")
+    parser.add_argument("--web-hz", type=float, default=10.0, help="Dashboard frame rate")
+    parser.add_argument("--flight-s", type=float, default=10.0,
+                        help="Keep the last N seconds of frames in memory, dumped to data/flight on faults (0 = off)")
+    parser.add_argument("--episode", metavar="TASK",
+                        help="Record this session as a demonstration episode for TASK under data/episodes")
+    parser.add_argument("--operator", default=None, help="Operator name stored with the episode")
+    parser.add_argument("--feedback-hz", type=float, default=10.0,
+                        help="Follower feedback read rate while recording an episode (reuses --trim reads if enabled)")
+    args = parser.parse_args()
+
     print("=== MyArm Leader-Follower (Teleop Explicit) ===")
     
     # 1. Connect to Leader (C650)
     leader_port = connection.select_port("Select LEADER (C650) port:")
+    leader_id = connection.port_identity(leader_port)
     try:
-        leader = MyArmC(leader_port, 1000000)
+        leader = ResilientArm(lambda p: MyArmC(p, 1000000), leader_port,
+                              read_method='get_joints_angle', expected_len=7)
         print("Leader connected.")
     except Exception as e:
         print(f"Failed to connect: {e}")
@@ -99,9 +159,14 @@ def main():
 
     # 2. Connect to Follower (M750)
     follower_port = connection.select_port("Select FOLLOWER (M750) port:")
+    follower_id = connection.port_identity(follower_port)
     try:
-        follower = MyArmMControl(follower_port, 1000000)
+        follower = ResilientArm(lambda p: MyArmMControl(p, 1000000), follower_port,
+                                read_method='get_angles', expected_len=6)
         print("Follower connected.")
+        # Re-find each arm by USB identity after a replug, never on the port the other arm holds
+        leader.port_finder = lambda: connection.find_port(leader_id, leader_port, exclude=[follower.port])
+        follower.port_finder = lambda: connection.find_port(follower_id, follower_port, exclude=[leader.port])
         follower.set_gripper_enabled()
         time.sleep(0.5)
     except Exception as e:
@@ -112,46 +177,240 @@ def main():
     monitor = MonitorThread()
     monitor.start()
 
+    # 4. Optional Resampler (Mapping -> Uniform Grid -> write_angles)
+    resampler = None
+    if args.resample_hz > 0:
+        resampler = SplineResampler(rate_hz=args.resample_hz, delay=args.resample_delay,
+                                    limits=calibration.load().m750_limits)
+        print(f"Resampling follower commands at {args.resample_hz:.0f} Hz (delay {args.resample_delay*1000:.0f} ms)")
+
+    # 5. Speed (fixed, or scheduled from commanded delta / leader velocity)
+    speed_sched = None
+    speed = 40
+    if args.speed == "auto":
+        speed_sched = SpeedScheduler()
+        print("Speed: scheduled per cycle")
+    else:
+        speed = int(args.speed)
+
+    # 6. Optional Feedback Trim (own thread, started with the loop below)
+    trim = None
+    if args.trim:
+        trim = FeedbackTrimThread(follower, rate_hz=args.trim_hz,
+                                  log_dir=os.path.dirname(monitor.log_file))
+        print(f"Feedback trim enabled ({args.trim_hz:.0f} Hz reads)")
+
+    # 7. Flight recorder (last N seconds of every arm frame; dumped on fault, Ctrl+C or SIGUSR1)
+    recorder = None
+    if args.flight_s > 0:
+        recorder = FlightRecorder(seconds=args.flight_s, rate_hz=args.arm_hz)
+        sig = recorder.install_signal()
+        hint = f", or send {sig.name} to pid {os.getpid()}" if sig else ""
+        print(f"Flight recorder: last {args.flight_s:g} s kept, dumped to data/flight on faults{hint}")
+        # ResilientArm absorbs OSErrors, so the fault to capture is the link going down
+        leader.on_down = lambda arm: recorder.dump_async("leader link down")
+        follower.on_down = lambda arm: recorder.dump_async("follower link down")
+
+    # 8. Communication-loss watchdog (own thread, so it reacts even if the loop is stuck)
+    watchdog = None
+    if args.watchdog_ms > 0:
+        def on_trip(reason):
+            print(f"\n[WATCHDOG] {reason} link stale > {args.watchdog_ms:.0f} ms -> {args.watchdog_action}")
+            if args.watchdog_action == "stop":
+                follower.stop()
+            if recorder:
+                recorder.dump_async(f"watchdog {reason}")
+
+        def on_recover(reason):
+            what = "Follower answering" if reason == "follower" else "Leader frames fresh"
+            print(f"\n[WATCHDOG] {what} again, resuming.")
+
+        def follower_probe():
+            # No writes are sent while tripped, so the follower is acked by a read
+            return classify_read(follower.call('get_angles'), 6) is None
+
+        watchdog = CommWatchdog(timeout=args.watchdog_ms / 1000.0, on_trip=on_trip, on_recover=on_recover,
+                                follower_probe=follower_probe)
+
+    # Optional demonstration recording (chunks compressed and written on a background thread)
+    episodes = None
+    if args.episode:
+        episodes = EpisodeWriter()
+        episodes.start()
+        ep = episodes.begin_episode(args.episode, operator=args.operator,
+                                    calibration_version=calibration.load().version,
+                                    arm_hz=args.arm_hz, speed=args.speed, resample_hz=args.resample_hz)
+        print(f"Recording episode {ep} ('{args.episode}') to {episodes.dir}")
+
+    # Latest leader frame, shared between tasks
+    NO_ANGLES = [float('nan')] * 7
+    state = {'angles': None, 'arm': None, 'norm': None, 'gripper': 0, 'cal': None,
+             'feedback': None, 'feedback_t': float('nan')}
+
+    def arm_task():
+        nonlocal speed
+        # Read 7 angles from Leader (6 arm + 1 gripper).
+        # Invalid / short / failed reads come back as None after a backoff;
+        # if the follower link is down its writes are dropped (holds last pose).
+        t_read = time.perf_counter()
+        angles = leader.read()
+        if angles is None:
+            if recorder:
+                # Keep failed / invalid reads (and their latency, backoff included) in the history
+                recorder.record(time.monotonic(), NO_ANGLES, float('nan'), None, speed,
+                                (time.perf_counter() - t_read) * 1000, 0.0, 0.0,
+                                FlightRecorder.FLAG_READ_FAILED)
+            return
+        if watchdog:
+            watchdog.feed_leader()
+
+        # 1. Arm Control (First 6 joints)
+        t_map = time.perf_counter()
+        cal = calibration.load()   # One record per frame, so the logged version is the one used
+        arm_angles, norm_vals = mapping.process_arm_angles(angles, cal)
+        state['angles'], state['arm'], state['norm'] = angles, arm_angles, norm_vals
+        state['cal'] = cal
+
+        target = arm_angles
+        if resampler:
+            resampler.push(time.monotonic(), arm_angles)
+            due = resampler.emit()
+            # Only the newest grid point matters for a position command
+            target = due[-1][1] if due else None
+        if target is not None:
+            if trim:
+                trim.set_target(target)
+                target = trim.apply(target)
+            if speed_sched:
+                speed = speed_sched.update(target, dt_next=1.0 / args.arm_hz)
+            if watchdog and watchdog.tripped:
+                if recorder:
+                    recorder.record(time.monotonic(), angles, arm_angles, None, speed,
+                                    (t_map - t_read) * 1000, (time.perf_counter() - t_map) * 1000, 0.0,
+                                    FlightRecorder.FLAG_TRIPPED)
+                return # Hold: no new targets until the link is healthy again
+        t_write = time.perf_counter()
+        if target is not None:
+            follower.write_angles(target, speed)
+            if watchdog and follower.connected and follower.last_error is None:
+                watchdog.feed_follower()
+        if recorder:
+            t_done = time.perf_counter()
+            recorder.record(time.monotonic(), angles, arm_angles, target, speed,
+                            (t_map - t_read) * 1000, (t_write - t_map) * 1000, (t_done - t_write) * 1000)
+        if episodes and target is not None:
+            if trim:
+                actual, actual_t = trim.latest()
+                if actual is not None:
+                    state['feedback'], state['feedback_t'] = actual, actual_t
+            episodes.add(time.monotonic(), angles, target, state['gripper'],
+                         state['feedback'], state['feedback_t'])
+
+    def gripper_task():
+        # 2. Gripper Control (7th joint)
+        if state['angles'] is None or (watchdog and watchdog.tripped):
+            return
+        gripper_val = mapping.process_gripper(state['angles'][6], state['cal'])
+        follower.set_gripper_value(gripper_val, 50)
+        state['gripper'] = gripper_val
+
+    def web_task():
+        # Compact frame for the browser; publish() only stores a reference
+        if state['angles'] is None:
+            return
+        web.publish({
+            't': time.monotonic() - start_time,
+            'in': state['angles'],
+            'norm': state['norm'],
+            'out': state['arm'],
+            'grip': state['gripper'],
+            'loop': tasks.stats(time.monotonic() - start_time),
+        })
+
+    def feedback_task():
+        # Follower feedback for the episode (low rate; each read is a serial round trip)
+        actual = follower.get_angles()
+        if isinstance(actual, list) and len(actual) >= 6:
+            state['feedback'], state['feedback_t'] = actual, time.monotonic()
+
+    def telemetry_task():
+        # Update Monitor
+        if state['angles'] is not None:
+            monitor.update(state['angles'], state['arm'], state['gripper'], state['norm'], state['cal'].version)
+
+    # 9. Multi-rate loop (each serial transaction interleaved on this thread)
+    tasks = RateScheduler()
+    tasks.add("arm", arm_task, args.arm_hz, priority=0)
+    tasks.add("gripper", gripper_task, args.gripper_hz, priority=1)
+    if trim:
+        trim.start()
+    elif episodes:
+        tasks.add("feedback", feedback_task, args.feedback_hz, priority=2)
+    tasks.add("telemetry", telemetry_task, args.telemetry_hz, priority=3)
+
+    # 10. Optional browser dashboard (HTTP + SSE on daemon threads)
+    web = None
+    if args.web:
+        web = WebDashboard(port=args.web, rate_hz=args.web_hz)
+        web.start()
+        web_stats = tasks.add("web", web_task, args.web_hz, priority=3)
+        print(f"Web dashboard: {web.url}")
+
     print("\nStarting Teleop... Press Ctrl+C to stop.")
+    start_time = time.monotonic()
+    if watchdog:
+        watchdog.start()
     
     try:
         while True:
             try:
-                # Read 7 angles from Leader (6 arm + 1 gripper)
-                angles = leader.get_joints_angle()
-                
-                if not angles or len(angles) < 7:
-                    continue
-                
-                if max(angles) > 200 or min(angles) < -200:
-                    continue
-
-                # 1. Arm Control (First 6 joints)
-                arm_angles, norm_vals = mapping.process_arm_angles(angles)
-                follower.write_angles(arm_angles, 40)
-                
-                # 2. Gripper Control (7th joint)
-                gripper_raw = angles[6]
-                gripper_val = mapping.process_gripper(gripper_raw)
-                
-                follower.set_gripper_value(gripper_val, 50)
-                
-                # Update Monitor
-                monitor.update(angles, arm_angles, gripper_val, norm_vals)
-
-                time.sleep(0.02)
-                
+                tasks.run_once()
+                tasks.sleep_until_next()
             except OSError as e:
                  time.sleep(0.5)
 
     except KeyboardInterrupt:
         print("\nStopping...")
-        monitor.running = False
+        if recorder:
+            recorder.dump("sigint")
+    except Exception as e:
+        if recorder:
+            recorder.dump(f"exception {type(e).__name__}")
+        raise
     finally:
-        try: leader._serial_port.close() 
-        except: pass
-        try: follower._serial_port.close() 
-        except: pass
+        monitor.stop()
+        monitor.dashboard.report()
+        tasks.report(time.monotonic() - start_time)
+        if web:
+            web.stop()
+            web.report(loop_period=1.0 / args.arm_hz)
+            # Share of the control thread spent building/publishing frames
+            print(f"Web task on loop thread: {web_stats.cost_est * args.web_hz * 100:.3f}% of loop time")
+        if watchdog:
+            watchdog.stop()
+            watchdog.report()
+        if recorder:
+            recorder.report(loop_period=1.0 / args.arm_hz)
+        if episodes:
+            meta = episodes.end_episode()
+            try:
+                episodes.close()
+            except OSError as e:
+                print(f"Episode write error: {e}")
+            print(f"Episode {meta['episode']}: {meta['frames']} frames")
+            episodes.report()
+        if trim:
+            trim.stop()
+            trim.report()
+        if resampler:
+            st = resampler.stats()
+            print(f"Resampler: in={st['samples_in']} out={st['samples_out']} "
+                  f"cost={st['cost_mean_us']:.1f}us/sample (max {st['cost_max_us']:.1f}us) "
+                  f"latency<={st['latency_s']*1000:.0f}ms")
+        leader.report("Leader")
+        follower.report("Follower")
+        leader.close()
+        follower.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,9 +2,13 @@
 # -*- coding: UTF-8 -*-
 import time
 import sys
+import os
 import serial.tools.list_ports
 from pymycobot import MyArmC, MyArmM
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.transport import ResilientArm
+
 # --- Configuration & Helper Functions ---
 
 # Gripper mapping equation from official demo
@@ -85,7 +89,9 @@ def main():
     leader_port = select_port("Select LEADER (C650) port:")
     print(f"Connecting to Leader at {leader_port}...")
     try:
-        leader = MyArmC(leader_port, 1000000) # Default baudrate usually 1M
+        # Default baudrate usually 1M. Wrapped so read errors back off and the link reconnects.
+        leader = ResilientArm(lambda p: MyArmC(p, 1000000), leader_port,
+                              read_method='get_joints_angle', expected_len=7)
         print("Leader connected.")
     except Exception as e:
         print(f"Failed to connect to Leader: {e}")
@@ -105,15 +111,9 @@ def main():
     
     try:
         while True:
-            # Read angles from Leader
-            angles = leader.get_joints_angle()
-            
-            # Check if read was successful
-            if angles is None or len(angles) == 0:
-                continue
-                
-            # Check for invalid values (communication errors)
-            if max(angles) > 200 or min(angles) < -200:
+            # Read angles from Leader (None = failed / invalid read, already backed off)
+            angles = leader.read()
+            if angles is None:
                 continue
 
             # Process angles (Mapping & Limits)
@@ -133,8 +133,9 @@ def main():
     finally:
         print("Closing connections...")
         # Try/Except close in case they weren't open
-        try: leader._serial_port.close() 
-        except: pass
+        if 'leader' in locals():
+            leader.report("Leader")
+            leader.close()
         try: follower._serial_port.close() 
         except: pass
         print("Done.")
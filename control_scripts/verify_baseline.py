@@ -1,38 +1,122 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import argparse
 import sys
 import os
-import json
 import time
 
 # Adjust path to import config from parent directory
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pymycobot import MyArmC
 from utils import connection, mapping
+from utils.terminal_dashboard import TerminalDashboard
+from utils.pose_store import PoseStore
+from utils.transport import Backoff, classify_read
 
 DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'baselines.json')
 
-def load_baselines():
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
-    return {}
+TRAJ_DIR = os.path.join(os.path.dirname(DATA_FILE), 'baselines')
+
+def read_leader(leader, backoff):
+    """Validated 7-joint leader read; sleeps with backoff and returns None on an I/O error or a bad read."""
+    try:
+        raw_angles = leader.get_joints_angle()
+    except OSError:
+        raw_angles = None
+    if classify_read(raw_angles, 7) is None:
+        backoff.reset()
+        return raw_angles
+    time.sleep(backoff.next())
+    return None
+
+def nearest_main(args, baselines):
+    # Index every baseline pose + trajectory frame, then match the leader live
+    from utils.pose_index import PoseIndex
+
+    index = PoseIndex(min_spacing=args.min_spacing)
+    index.add_baselines(baselines)
+    n_traj = 0 if args.no_traj else index.add_trajectory_dir(TRAJ_DIR)
+    t0 = time.perf_counter()
+    n = index.build()
+    print(f"Indexed {n} poses ({len(baselines)} baselines, {n_traj} trajectory frames) "
+          f"in {(time.perf_counter() - t0)*1000:.1f} ms")
+    if n == 0:
+        print("Nothing to index. Run record_baseline.py first.")
+        return
+
+    port = connection.select_port("Select C650 (Leader) Port:")
+    try:
+        leader = MyArmC(port, 1000000)
+    except Exception as e:
+        print(f"Connection Failed: {e}")
+        return
+
+    latest = {'matches': None, 'mapped': None}
+
+    def render():
+        if latest['matches'] is None:
+            return None
+        lines = [f"=== Nearest Baselines (k={args.k}, mapped M750 space) ===",
+                 "Current: " + " ".join(f"{a:7.1f}" for a in latest['mapped'][:6]),
+                 "-" * 78,
+                 f"{'#':<2} | {'Baseline':<34} | {'Dist':>6} | Error J1..J6 (mapped - baseline)"]
+        for r, (label, dist, err) in enumerate(latest['matches']):
+            lines.append(f"{r+1:<2} | {label[:34]:<34} | {dist:6.1f} | " + " ".join(f"{e:6.1f}" for e in err))
+        for r in range(len(latest['matches']), args.k):
+            lines.append(f"{r+1:<2} | {'---':<34} |")
+        st = index.stats()
+        lines.append("-" * 78)
+        lines.append(f"Query: {st['query_us_avg']:.1f}us avg / {st['query_us_max']:.1f}us max over {n} poses")
+        return lines
+
+    dashboard = TerminalDashboard(render, refresh_hz=10.0)
+    dashboard.start()
+    backoff = Backoff()
+    try:
+        while True:
+            raw_angles = read_leader(leader, backoff)
+            if raw_angles is None:
+                continue
+            mapped_angles, _ = mapping.process_arm_angles(raw_angles)
+            latest['matches'] = index.query(mapped_angles, k=args.k)
+            latest['mapped'] = mapped_angles
+            time.sleep(0.02)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dashboard.close()
+        print("\nStopped.")
+        index.report()
+        leader._serial_port.close()
 
 def main():
+    parser = argparse.ArgumentParser(description="Verify leader mapping against recorded baselines")
+    parser.add_argument("--nearest", action="store_true",
+                        help="Live k-nearest match against every baseline pose and trajectory frame")
+    parser.add_argument("--k", type=int, default=3, help="Number of nearest baselines to show")
+    parser.add_argument("--no-traj", action="store_true", help="Index static poses only")
+    parser.add_argument("--tag", help="Only use poses with this tag")
+    parser.add_argument("--min-spacing", type=float, default=0.5,
+                        help="Skip trajectory frames closer than this (deg) to the previous one")
+    args = parser.parse_args()
+
     print("=== MyArm Baseline Verifier (Leader Only) ===")
     
-    baselines = load_baselines()
+    store = PoseStore()
+    baselines = store.as_dict(args.tag)
+    if args.nearest:
+        nearest_main(args, baselines)
+        return
+
     if not baselines:
-        print(f"No baselines found in {DATA_FILE}. Run record_baseline.py first.")
+        print(f"No baselines found in {store.path}. Run record_baseline.py first.")
         return
 
     print("\nAvailable Baselines:")
     keys = list(baselines.keys())
     for i, k in enumerate(keys):
-        print(f"{i+1}: {k} (rec: {baselines[k]['timestamp']})")
+        tags = " ".join(f"#{t}" for t in baselines[k]['tags'])
+        print(f"{i+1}: {k} (rec: {baselines[k]['timestamp']}) {tags}")
         
     try:
         idx = int(input("\nSelect Pose Number to Verify: ")) - 1
@@ -57,11 +141,12 @@ def main():
     print("Watch the ERROR (Mapped - Target). Goal is 0.0.")
     print("-" * 60)
     
+    backoff = Backoff()
     try:
         while True:
             # Read Leader
-            raw_angles = leader.get_joints_angle()
-            if not raw_angles or len(raw_angles) < 6:
+            raw_angles = read_leader(leader, backoff)
+            if raw_angles is None:
                 continue
 
             # Process using LIVE config/mapping logic
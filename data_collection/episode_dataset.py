@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None   # Windows: no cross-process lock
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_collection.episode_writer import EPISODE_DIR, META_FILE, read_episode
+
+INDEX_FILE = "index.json"
+CACHE_DIR = "cache"
+LOCK_FILE = ".lock"
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+@contextlib.contextmanager
+def _locked(directory):
+    """Exclusive lock on <directory>/.lock, held while the corpus / index are updated."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, LOCK_FILE), 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class EpisodeDataset:
+    """
+    Random-access window sampler over recorded episodes (see EpisodeWriter).
+
+    Logic:
+    1. Complete episodes are decompressed ONCE into an append-only corpus
+       per field: <root>/cache/<field>.bin (raw rows, all episodes back to
+       back). <root>/index.json keeps each episode's row offset, length,
+       task and meta.json mtime. Opening the dataset only stats meta.json
+       files; new episodes are appended, and the corpus is rebuilt only if
+       an indexed episode changed or disappeared. Updates run under a lock
+       file (several workers may open the dataset at once), and every
+       <field>.bin is checked against the indexed row count: bytes left by
+       a crash between the append and the index write are truncated, a
+       short corpus is rebuilt.
+    2. Each field is opened as one np.memmap, so nothing is materialized:
+       only the pages a window touches are read, and the OS page cache is
+       shared between workers / processes.
+    3. Window starts are drawn uniformly over all valid (episode, start)
+       pairs (cumulative window counts + searchsorted) and the whole batch
+       is gathered with a single fancy-index into the memmap.
+    4. iter_batches() keeps `prefetch` batches in flight on a thread pool.
+    """
+
+    def __init__(self, root=EPISODE_DIR, field='leader'):
+        self.root = root
+        self.field = field
+        self.cache = os.path.join(root, CACHE_DIR)
+        self.index = self._sync_index()
+        self.episodes = self.index['episodes']
+        self.lengths = np.array([e['frames'] for e in self.episodes], dtype=np.int64)
+        self.offsets = np.array([e['offset'] for e in self.episodes], dtype=np.int64)
+        self.maps = {}
+
+        # Stats
+        self.batches = 0
+        self.windows = 0
+
+    # --- Index / corpus ---
+    def _scan(self):
+        """{dir: meta.json mtime} of every complete episode (reads meta only when needed)."""
+        found = {}
+        if not os.path.isdir(self.root):
+            return found
+        for name in sorted(os.listdir(self.root)):
+            if not name.startswith('episode_'):
+                continue
+            try:
+                found[name] = os.stat(os.path.join(self.root, name, META_FILE)).st_mtime_ns
+            except OSError:
+                continue
+        return found
+
+    def _sync_index(self):
+        with _locked(self.cache):
+            return self._sync_index_locked()
+
+    def _corpus_intact(self, index):
+        """Truncate each <field>.bin to the indexed rows. False if one is missing or short."""
+        for field, spec in (index['fields'] or {}).items():
+            path = os.path.join(self.cache, f"{field}.bin")
+            expected = index['rows'] * int(np.prod(spec['shape'])) * np.dtype(spec['dtype']).itemsize
+            size = os.path.getsize(path) if os.path.exists(path) else -1
+            if size < expected:
+                return False
+            if size > expected:
+                with open(path, 'r+b') as f:
+                    f.truncate(expected)
+        return True
+
+    def _sync_index_locked(self):
+        index_path = os.path.join(self.root, INDEX_FILE)
+        index = None
+        if os.path.exists(index_path):
+            try:
+                with open(index_path) as f:
+                    index = json.load(f)
+            except ValueError:
+                index = None
+
+        found = self._scan()
+        known = {e['dir']: e for e in index['episodes']} if index else {}
+        stale = any(found.get(d) != e['stamp'] for d, e in known.items())
+        if index is None or stale or not self._corpus_intact(index):
+            index = {'fields': None, 'rows': 0, 'episodes': [], 'skipped': {}}
+            for name in os.listdir(self.cache) if os.path.isdir(self.cache) else []:
+                if name.endswith('.bin'):
+                    os.remove(os.path.join(self.cache, name))
+            known = {}
+
+        skipped = index.setdefault('skipped', {})
+        new = [d for d in found if d not in known and skipped.get(d) != found[d]]
+        for name in new:
+            self._append_episode(index, name, found[name])
+        if new or not os.path.exists(index_path):
+            _write_json(index_path, index)
+        return index
+
+    def _append_episode(self, index, name, stamp):
+        ep_dir = os.path.join(self.root, name)
+        with open(os.path.join(ep_dir, META_FILE)) as f:
+            meta = json.load(f)
+        if meta.get('status') != 'complete' or not meta['frames']:
+            # Still recording (or empty): look again once its meta.json changes
+            index['skipped'][name] = stamp
+            return
+        index['skipped'].pop(name, None)
+        data, meta = read_episode(ep_dir)
+        if index['fields'] is None:
+            index['fields'] = meta['fields']
+        os.makedirs(self.cache, exist_ok=True)
+        for field, spec in index['fields'].items():
+            arr = np.ascontiguousarray(data[field], dtype=spec['dtype'])
+            with open(os.path.join(self.cache, f"{field}.bin"), 'ab') as f:
+                f.write(arr.tobytes())
+        n = len(data['t'])
+        index['episodes'].append({'dir': name, 'stamp': stamp, 'offset': index['rows'], 'frames': n,
+                                  'task': meta.get('task'), 'operator': meta.get('operator')})
+        index['rows'] += n
+
+    def __len__(self):
+        return len(self.episodes)
+
+    @property
+    def total_frames(self):
+        return int(self.index['rows'])
+
+    def tasks(self):
+        return sorted({e['task'] for e in self.episodes if e['task']})
+
+    # --- Memory maps ---
+    def corpus(self, field=None):
+        """np.memmap of one field over the whole corpus, shape (rows, ...)."""
+        field = field or self.field
+        mm = self.maps.get(field)
+        if mm is None:
+            spec = self.index['fields'][field]
+            mm = np.memmap(os.path.join(self.cache, f"{field}.bin"), dtype=spec['dtype'], mode='r',
+                           shape=(self.total_frames,) + tuple(spec['shape']))
+            self.maps[field] = mm
+        return mm
+
+    def episode(self, i, field=None):
+        """One episode's rows (a view into the memmap, nothing is read yet)."""
+        o, n = self.offsets[i], self.lengths[i]
+        return self.corpus(field)[o:o + n]
+
+    # --- Sampling ---
+    def window_counts(self, T, stride=1):
+        return np.maximum((self.lengths - T) // stride + 1, 0)
+
+    def sample_batch(self, B, T, rng=None, stride=1, field=None):
+        """
+        B random windows of T frames: returns (batch (B, T, D) float32, episode ids, start frames).
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        counts = self.window_counts(T, stride)
+        total = int(counts.sum())
+        if total == 0:
+            raise ValueError(f"no episode has {T} frames")
+        cum = np.cumsum(counts)
+        picks = rng.integers(0, total, size=B)
+        eps = np.searchsorted(cum, picks, side='right')
+        starts = (picks - (cum[eps] - counts[eps])) * stride
+
+        rows = (self.offsets[eps] + starts)[:, None] + np.arange(T)
+        out = np.asarray(self.corpus(field)[rows], dtype=np.float32)
+        self.batches += 1
+        self.windows += B
+        return out, eps, starts
+
+    def iter_batches(self, B, T, n_batches=None, workers=4, prefetch=8, seed=None, stride=1, field=None):
+        """Yield (batch, episode ids, starts) with `prefetch` batches prepared ahead on `workers` threads."""
+        seeds = np.random.SeedSequence(seed)
+        produced = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = []
+            while n_batches is None or produced < n_batches:
+                while len(pending) < prefetch and (n_batches is None or produced + len(pending) < n_batches):
+                    rng = np.random.default_rng(seeds.spawn(1)[0])
+                    pending.append(pool.submit(self.sample_batch, B, T, rng, stride, field))
+                yield pending.pop(0).result()
+                produced += 1
+
+    def stats(self):
+        return {'episodes': len(self), 'frames': self.total_frames, 'batches': self.batches,
+                'windows': self.windows}
+
+    def report(self):
+        st = self.stats()
+        print(f"Dataset: {st['episodes']} episodes, {st['frames']} frames | {st['batches']} batches, "
+              f"{st['windows']} windows")
+
+
+def _rss_mb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def benchmark(root, B=64, T=50, n_batches=500, workers=4):
+    rss0 = _rss_mb()
+    t0 = time.perf_counter()
+    ds = EpisodeDataset(root)
+    t_open = time.perf_counter() - t0
+    corpus_mb = ds.total_frames * 7 * 4 / 1e6
+    print(f"Opened {len(ds)} episodes / {ds.total_frames} frames ({corpus_mb:.1f} MB leader data) in {t_open*1000:.0f} ms")
+
+    for w in (0, workers):
+        t0 = time.perf_counter()
+        if w == 0:
+            rng = np.random.default_rng(0)
+            for _ in range(n_batches):
+                ds.sample_batch(B, T, rng)
+        else:
+            for _ in ds.iter_batches(B, T, n_batches=n_batches, workers=w, seed=0):
+                pass
+        dt = time.perf_counter() - t0
+        label = "no prefetch" if w == 0 else f"{w} workers"
+        print(f"{label:<12}: {n_batches * B / dt:,.0f} windows/s ({n_batches / dt:,.0f} batches/s of ({B}, {T}, 7))")
+    print(f"RSS: {_rss_mb():.0f} MB (+{_rss_mb() - rss0:.0f} MB while sampling)")
+    ds.report()
+
+    # Baseline: what a CSV corpus costs before the first window can be drawn
+    n_csv = min(len(ds), 20)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(n_csv):
+            path = os.path.join(tmp, f"ep{i}.csv")
+            with open(path, 'w', newline='') as f:
+                w = csv.writer(f)
+                w.writerow(['Timestamp', 'J1', 'J2', 'J3', 'J4', 'J5', 'J6', 'J7'])
+                ep_t, ep_leader = ds.episode(i, 't'), ds.episode(i)
+                w.writerows([f"{t:.4f}"] + [f"{a:.2f}" for a in row] for t, row in zip(ep_t, ep_leader))
+            paths.append(path)
+        frames = int(ds.lengths[:n_csv].sum())
+        t0 = time.perf_counter()
+        for path in paths:
+            with open(path) as f:
+                reader = csv.reader(f)
+                next(reader)
+                np.array([[float(x) for x in row[1:8]] for row in reader], dtype=np.float32)
+        per_frame = (time.perf_counter() - t0) / frames
+    print(f"CSV baseline: {per_frame*1e6:.1f} us/frame to parse -> ~{per_frame * ds.total_frames:.1f} s "
+          f"for the whole corpus before the first window (vs {t_open*1000:.0f} ms to open the memmaps)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Episode dataset index / benchmark")
+    parser.add_argument("--root", default=EPISODE_DIR, help="Episode directory")
+    parser.add_argument("--bench", action="store_true", help="Benchmark window sampling")
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--window", type=int, default=50)
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.root, args.batch, args.window, args.batches, args.workers)
+    else:
+        ds = EpisodeDataset(args.root)
+        ds.report()
+        print(f"Tasks: {', '.join(ds.tasks()) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import json
+import time
+import queue
+import datetime
+import threading
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EPISODE_DIR = os.path.join(BASE_DIR, 'data', 'episodes')
+
+# name -> (per-frame shape, dtype)
+FIELDS = {
+    't': ((), np.float64),             # time.monotonic() of the frame
+    'leader': ((7,), np.float32),      # raw C650 angles (6 joints + gripper)
+    'command': ((6,), np.float32),     # mapped M750 target actually sent
+    'gripper': ((), np.float32),       # gripper command
+    'follower': ((6,), np.float32),    # latest M750 feedback read (NaN until the first read)
+    'follower_t': ((), np.float64),    # time of that feedback read
+}
+
+META_FILE = "meta.json"
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class EpisodeWriter(threading.Thread):
+    """
+    Episode dataset writer for teleop demonstrations.
+
+    Layout (one directory per episode, append-only):
+        <root>/episode_000003/
+            meta.json            operator, task, calibration version, fields, chunk list
+            chunk_000000.npz     compressed arrays, one per field, `chunk_frames` rows
+            chunk_000001.npz
+            ...
+
+    Logic:
+    1. add() writes one frame into preallocated chunk buffers on the caller's
+       thread (array row assignment only).
+    2. A full chunk is handed to this thread through a queue and fresh
+       buffers are swapped in; compression (np.savez_compressed) and disk I/O
+       happen here, so the control loop never blocks on disk.
+    3. meta.json is rewritten atomically by this thread after every chunk,
+       listing only chunks whose file was written and renamed into place
+       (a chunk that failed to write is counted in `chunks_failed`). A crash loses at most the chunk
+       being filled; end_episode() flushes the partial chunk and marks the
+       episode complete.
+    """
+
+    def __init__(self, root=EPISODE_DIR, chunk_frames=500, fields=FIELDS):
+        super().__init__(name="episode-writer")
+        self.daemon = True
+        self.root = root
+        self.chunk_frames = chunk_frames
+        self.fields = fields
+        self.jobs = queue.Queue()
+        self.episode = None          # meta dict of the open episode
+        self.dir = None
+        self.buffers = None
+        self.fill = 0
+        self.error = None
+        self.on_disk = {}            # writer thread: dir -> (latest meta, chunks written, chunks failed)
+
+        # Stats
+        self.frames = 0
+        self.chunks = 0
+        self.bytes = 0
+        self.add_time = 0.0
+        self.write_time = 0.0
+        self.write_time_max = 0.0
+        self.backlog_max = 0
+
+    # --- Control thread side ---
+    def _new_buffers(self):
+        n = self.chunk_frames
+        return {k: np.full((n,) + shape, np.nan, dtype=dtype) for k, (shape, dtype) in self.fields.items()}
+
+    def next_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        existing = [int(d.split('_')[1]) for d in os.listdir(self.root)
+                    if d.startswith('episode_') and d.split('_')[1].isdigit()]
+        return max(existing) + 1 if existing else 0
+
+    def begin_episode(self, task, operator=None, calibration_version=None, **extra):
+        """Start a new episode directory. Returns its index."""
+        if self.episode is not None:
+            self.end_episode()
+        index = self.next_index()
+        self.dir = os.path.join(self.root, f"episode_{index:06d}")
+        os.makedirs(self.dir)
+        self.episode = {
+            'episode': index, 'task': task, 'operator': operator,
+            'calibration_version': calibration_version,
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'status': 'recording', 'frames': 0, 'chunk_frames': self.chunk_frames,
+            'fields': {k: {'shape': list(shape), 'dtype': np.dtype(dtype).name}
+                       for k, (shape, dtype) in self.fields.items()},
+            'chunks': [], 'extra': extra,
+        }
+        self.buffers = self._new_buffers()
+        self.fill = 0
+        self.jobs.put(('meta', self.dir, dict(self.episode)))
+        return index
+
+    def add(self, t, leader, command, gripper=np.nan, follower=None, follower_t=np.nan):
+        """Append one frame to the open episode (no disk I/O)."""
+        if self.episode is None:
+            return
+        c0 = time.perf_counter()
+        b, i = self.buffers, self.fill
+        b['t'][i] = t
+        b['leader'][i] = leader[:7]
+        b['command'][i] = command
+        b['gripper'][i] = gripper
+        if follower is not None:
+            b['follower'][i] = follower[:6]
+            b['follower_t'][i] = follower_t
+        self.fill = i + 1
+        self.frames += 1
+        if self.fill == self.chunk_frames:
+            self._hand_off()
+        self.add_time += time.perf_counter() - c0
+
+    def _hand_off(self):
+        n = self.fill
+        if not n:
+            return
+        ep = self.episode
+        index = len(ep['chunks'])
+        name = f"chunk_{index:06d}.npz"
+        arrays = {k: v[:n] for k, v in self.buffers.items()}
+        chunk = {'file': name, 'frames': n, 't_start': float(arrays['t'][0]), 't_end': float(arrays['t'][n - 1])}
+        ep['chunks'].append(chunk)
+        ep['frames'] += n
+        # meta.json is updated by the writer thread once the file is on disk
+        self.jobs.put(('chunk', self.dir, chunk, arrays))
+        self.backlog_max = max(self.backlog_max, self.jobs.qsize())
+        self.buffers = self._new_buffers()
+        self.fill = 0
+
+    def end_episode(self, success=None, notes=None):
+        """Flush the partial chunk and mark the episode complete. Returns the episode meta."""
+        if self.episode is None:
+            return None
+        self._hand_off()
+        ep = self.episode
+        ep['status'] = 'complete'
+        ep['success'] = success
+        ep['notes'] = notes
+        if ep['chunks']:
+            ep['duration_s'] = ep['chunks'][-1]['t_end'] - ep['chunks'][0]['t_start']
+        self.jobs.put(('meta', self.dir, dict(ep, chunks=list(ep['chunks']))))
+        self.episode = None
+        self.buffers = None
+        return ep
+
+    # --- Writer thread ---
+    def _write_meta(self, directory):
+        """meta.json from the control side's latest meta, with only the chunks actually on disk."""
+        meta, written, failed = self.on_disk[directory]
+        meta = dict(meta, chunks=list(written), frames=sum(c['frames'] for c in written))
+        if failed:
+            meta['chunks_failed'] = failed
+        if 'duration_s' in meta:
+            meta['duration_s'] = written[-1]['t_end'] - written[0]['t_start'] if written else 0.0
+        _write_json(os.path.join(directory, META_FILE), meta)
+
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            try:
+                t0 = time.perf_counter()
+                if job[0] == 'chunk':
+                    _, directory, chunk, arrays = job
+                    entry = self.on_disk[directory]
+                    path = os.path.join(directory, chunk['file'])
+                    tmp = path + ".tmp.npz"
+                    try:
+                        np.savez_compressed(tmp, **arrays)
+                        os.replace(tmp, path)
+                    except OSError as e:
+                        entry[2] += 1
+                        self.error = e
+                    else:
+                        entry[1].append(chunk)
+                        self.chunks += 1
+                        self.bytes += os.path.getsize(path)
+                    self._write_meta(directory)
+                else:
+                    _, directory, meta = job
+                    entry = self.on_disk.setdefault(directory, [None, [], 0])
+                    entry[0] = meta
+                    self._write_meta(directory)
+                dt = time.perf_counter() - t0
+                self.write_time += dt
+                self.write_time_max = max(self.write_time_max, dt)
+            except OSError as e:
+                self.error = e
+            finally:
+                self.jobs.task_done()
+
+    def close(self, timeout=10.0):
+        """End any open episode and wait for the writer to drain."""
+        if self.episode is not None:
+            self.end_episode()
+        self.jobs.put(None)
+        if self.is_alive():
+            self.join(timeout=timeout)
+        if self.error is not None:
+            raise self.error
+
+    def stats(self):
+        return {'frames': self.frames, 'chunks': self.chunks, 'bytes': self.bytes,
+                'add_us_avg': (self.add_time / self.frames * 1e6) if self.frames else 0.0,
+                'write_ms_max': self.write_time_max * 1000, 'backlog_max': self.backlog_max}
+
+    def report(self):
+        st = self.stats()
+        raw = st['frames'] * sum(int(np.prod(s)) * np.dtype(d).itemsize for s, d in self.fields.values())
+        ratio = raw / st['bytes'] if st['bytes'] else 0.0
+        print(f"Episodes: {st['frames']} frames in {st['chunks']} chunks, {st['bytes']/1024:.1f} KB "
+              f"({ratio:.1f}x compression) | add {st['add_us_avg']:.1f}us avg on loop | "
+              f"chunk write max {st['write_ms_max']:.1f} ms off loop | backlog max {st['backlog_max']}")
+
+
+def read_episode(path):
+    """Load a whole episode directory: ({field: array}, meta)."""
+    with open(os.path.join(path, META_FILE)) as f:
+        meta = json.load(f)
+    parts = {k: [] for k in meta['fields']}
+    for chunk in meta['chunks']:
+        with np.load(os.path.join(path, chunk['file'])) as z:
+            for k in parts:
+                parts[k].append(z[k])
+    data = {}
+    for k, spec in meta['fields'].items():
+        if parts[k]:
+            data[k] = np.concatenate(parts[k])
+        else:
+            data[k] = np.empty([0] + spec['shape'], dtype=spec['dtype'])
+    return data, meta
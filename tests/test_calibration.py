@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import calibration
+import config
+
+
+def test_defaults_come_from_config(tmp_path):
+    cal = calibration.load(str(tmp_path / "calibration.json"))
+    assert cal.version == 0
+    assert cal.m750_limits == [tuple(x) for x in config.M750_LIMITS]
+    assert cal.leader_gripper_open == config.LEADER_GRIPPER_OPEN
+
+
+def test_save_history_and_rollback(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    limits = [(-10.0, 10.0)] * 6
+    v1 = calibration.update(note="first", path=path, m750_limits=limits)
+    v2 = calibration.update(note="second", path=path, m750_gains=[1.0] * 6)
+    assert (v1, v2) == (1, 2)
+
+    cal = calibration.load(path, force=True)
+    assert cal.version == 2 and cal.m750_limits == limits and cal.m750_gains == [1.0] * 6
+
+    v3 = calibration.rollback(1, path)
+    cal = calibration.load(path, force=True)
+    assert v3 == 3 and cal.m750_gains == list(config.M750_GAINS)
+    assert [v for v, _, _ in calibration.versions(path)] == [1, 2, 3]
+
+    # No temp files left behind by the atomic writes
+    assert sorted(os.listdir(tmp_path)) == ["calibration.json", "history"]
+    with open(path) as f:
+        assert json.load(f)["parent"] == 2
+
+
+def test_cached_load_is_cheap(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    calibration.update(note="bench", path=path, m750_limits=[(-20.0, 20.0)] * 6)
+    first = calibration.load(path, force=True)
+
+    n = 5000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        cal = calibration.load(path)
+    per_call = (time.perf_counter() - t0) / n
+    assert cal is first
+    # A control loop can call it every cycle
+    assert per_call < 20e-6
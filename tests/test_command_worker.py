@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.command_worker import CommandWorker
+
+
+def test_coalesces_flood_and_caps_rate():
+    sent = []
+    worker = CommandWorker(lambda angles, speed: sent.append((time.monotonic(), angles)), max_rate_hz=50.0)
+    worker.start()
+
+    # Slider drag: 500 ticks within ~0.25 s
+    for i in range(500):
+        worker.submit([float(i)] * 6, 60)
+        time.sleep(0.0005)
+    time.sleep(0.1)
+    worker.stop()
+
+    st = worker.stats()
+    assert st['ticks'] == 500
+    assert st['sent'] + st['coalesced'] == 500
+    assert st['sent'] < 30
+    # The final target is never lost
+    assert sent[-1][1] == [499.0] * 6
+    # Rate cap respected
+    gaps = [b[0] - a[0] for a, b in zip(sent, sent[1:])]
+    assert min(gaps) >= 0.02 - 0.002
+
+
+def test_one_off_calls_run_in_order():
+    calls = []
+    worker = CommandWorker(lambda *a: None)
+    worker.start()
+    worker.run_call(calls.append, "power_off")
+    worker.run_call(calls.append, "power_on")
+    time.sleep(0.05)
+    worker.stop()
+    assert calls == ["power_off", "power_on"]
+    assert worker.stats()['calls'] == 2
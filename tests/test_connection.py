@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import connection
+
+
+def fake_ports(monkeypatch, *ports):
+    infos = [SimpleNamespace(device=dev, serial_number=sn, vid=0x1a86, pid=0x55d4) for dev, sn in ports]
+    monkeypatch.setattr(connection.serial.tools.list_ports, 'comports', lambda: infos)
+
+
+def test_serial_number_finds_the_reenumerated_port(monkeypatch):
+    fake_ports(monkeypatch, ("/dev/ttyACM2", "C650-01"), ("/dev/ttyACM3", "M750-07"))
+    assert connection.find_port("M750-07", "/dev/ttyACM1") == "/dev/ttyACM3"
+
+
+def test_shared_vid_pid_never_picks_the_other_arm(monkeypatch):
+    # Neither arm reports a serial number: both match the same VID:PID
+    fake_ports(monkeypatch, ("/dev/ttyACM0", None), ("/dev/ttyACM1", None))
+    assert connection.port_identity("/dev/ttyACM1") == "1a86:55d4"
+    # Ambiguous: only the arm's own previous port is acceptable
+    assert connection.find_port("1a86:55d4", "/dev/ttyACM1") == "/dev/ttyACM1"
+    assert connection.find_port("1a86:55d4", "/dev/ttyACM5") is None
+    # The other arm's port is skipped, leaving exactly one match
+    assert connection.find_port("1a86:55d4", "/dev/ttyACM5", exclude=["/dev/ttyACM0"]) == "/dev/ttyACM1"
+    assert connection.find_port("1a86:55d4", "/dev/ttyACM0", exclude=["/dev/ttyACM0"]) == "/dev/ttyACM1"
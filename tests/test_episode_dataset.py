@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_collection.episode_writer import EpisodeWriter
+from data_collection.episode_dataset import EpisodeDataset
+
+
+def make_corpus(root, lengths, incomplete=0):
+    w = EpisodeWriter(str(root), chunk_frames=64)
+    w.start()
+    for ep, n in enumerate(lengths):
+        w.begin_episode(f"task{ep % 2}")
+        for i in range(n):
+            # Leader J1 encodes (episode, frame) so windows can be checked exactly
+            w.add(i * 0.02, [ep * 1000 + i] + [0.0] * 6, [0.0] * 6)
+        w.end_episode()
+    if incomplete:
+        w.begin_episode("crashed")
+        for i in range(incomplete):
+            w.add(i * 0.02, [0.0] * 7, [0.0] * 6)
+        w._hand_off()
+        w.episode = None     # never ended
+    w.close()
+
+
+def test_windows_are_contiguous_slices_of_one_episode(tmp_path):
+    make_corpus(tmp_path, [120, 30, 200], incomplete=64)
+    ds = EpisodeDataset(str(tmp_path))
+    assert len(ds) == 3 and ds.total_frames == 350 and ds.tasks() == ["task0", "task1"]
+    assert isinstance(ds.episode(0), np.memmap)
+
+    batch, eps, starts = ds.sample_batch(32, 40, np.random.default_rng(0))
+    assert batch.shape == (32, 40, 7) and batch.dtype == np.float32
+    assert 1 not in eps          # the 30-frame episode is shorter than the window
+    for b, e, s in zip(batch, eps, starts):
+        assert np.array_equal(b[:, 0], e * 1000 + s + np.arange(40))
+
+
+def test_prefetch_iterator_and_index_reuse(tmp_path):
+    make_corpus(tmp_path, [100, 100])
+    ds = EpisodeDataset(str(tmp_path))
+    batches = list(ds.iter_batches(8, 10, n_batches=20, workers=3, prefetch=4, seed=1))
+    assert len(batches) == 20 and all(b[0].shape == (8, 10, 7) for b in batches)
+
+    # Reopening reuses the index and corpus; a new episode is appended, not rebuilt
+    corpus = tmp_path / "cache" / "leader.bin"
+    size = corpus.stat().st_size
+    assert len(EpisodeDataset(str(tmp_path))) == 2 and corpus.stat().st_size == size
+    make_corpus(tmp_path, [50])
+    ds2 = EpisodeDataset(str(tmp_path))
+    assert len(ds2) == 3 and ds2.offsets[2] == 200 and corpus.stat().st_size == size + 50 * 7 * 4
+    assert np.array_equal(ds2.episode(2)[:, 0], np.arange(50))   # make_corpus numbers episodes per call
+
+    with pytest.raises(ValueError):
+        ds.sample_batch(4, 500)
+
+
+def test_corpus_is_repaired_after_a_crash_between_append_and_index(tmp_path):
+    make_corpus(tmp_path, [80, 60])
+    EpisodeDataset(str(tmp_path))
+    corpus = tmp_path / "cache" / "leader.bin"
+    size = corpus.stat().st_size
+    with open(corpus, 'ab') as f:
+        f.write(b"\0" * 7 * 4 * 30)     # rows appended, index never rewritten
+
+    ds = EpisodeDataset(str(tmp_path))
+    assert corpus.stat().st_size == size and ds.total_frames == 140
+    make_corpus(tmp_path, [40])
+    ds = EpisodeDataset(str(tmp_path))
+    assert ds.offsets[2] == 140 and np.array_equal(ds.episode(2)[:, 0], np.arange(40))
+
+    # A short corpus can't be trusted at all: rebuilt from the episodes
+    with open(corpus, 'r+b') as f:
+        f.truncate(size // 2)
+    ds = EpisodeDataset(str(tmp_path))
+    assert ds.total_frames == 180 and corpus.stat().st_size == 180 * 7 * 4
+    assert np.array_equal(ds.episode(1)[:, 0], 1000 + np.arange(60))
+
+
+def _open_dataset(root):
+    return EpisodeDataset(root).total_frames
+
+
+def test_concurrent_opens_build_one_corpus(tmp_path):
+    import multiprocessing
+    make_corpus(tmp_path, [100, 70, 90])
+    with multiprocessing.get_context('fork').Pool(4) as pool:
+        totals = pool.map(_open_dataset, [str(tmp_path)] * 8)
+    assert totals == [260] * 8
+    assert (tmp_path / "cache" / "leader.bin").stat().st_size == 260 * 7 * 4
+    ds = EpisodeDataset(str(tmp_path))
+    assert [e['offset'] for e in ds.episodes] == [0, 100, 170]
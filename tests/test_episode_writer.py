@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_collection.episode_writer import EpisodeWriter, read_episode
+
+
+def feed(writer, n, t0=0.0):
+    for i in range(n):
+        follower = [float(i)] * 6 if i >= 3 else None
+        writer.add(t0 + i * 0.02, [float(i)] * 7, [i * 0.5] * 6, gripper=i % 100,
+                   follower=follower, follower_t=t0 + i * 0.02)
+
+
+def test_chunked_episodes_round_trip(tmp_path):
+    w = EpisodeWriter(str(tmp_path), chunk_frames=100)
+    w.start()
+    assert w.begin_episode("pick cube", operator="op1", calibration_version=4, arm_hz=50) == 0
+    feed(w, 250)
+    meta = w.end_episode(success=True)
+    assert meta['frames'] == 250 and [c['frames'] for c in meta['chunks']] == [100, 100, 50]
+
+    assert w.begin_episode("place cube") == 1
+    feed(w, 30, t0=100.0)
+    w.close()
+
+    data, meta = read_episode(str(tmp_path / "episode_000000"))
+    assert meta['status'] == 'complete' and meta['success'] is True
+    assert meta['task'] == "pick cube" and meta['calibration_version'] == 4 and meta['extra'] == {'arm_hz': 50}
+    assert data['leader'].shape == (250, 7) and data['command'].dtype == np.float32
+    assert np.array_equal(data['leader'][:, 0], np.arange(250))
+    # Feedback is NaN until the first follower read
+    assert np.isnan(data['follower'][:3]).all() and data['follower'][3, 0] == 3.0
+    assert abs(meta['duration_s'] - 249 * 0.02) < 1e-9
+
+    data, meta = read_episode(str(tmp_path / "episode_000001"))
+    assert len(data['t']) == 30 and meta['status'] == 'complete'
+    assert w.stats()['chunks'] == 4
+
+
+def test_crash_keeps_completed_chunks(tmp_path):
+    w = EpisodeWriter(str(tmp_path), chunk_frames=50)
+    w.start()
+    w.begin_episode("demo")
+    feed(w, 120)
+    # Simulated crash: stop the writer without end_episode()
+    w.jobs.put(None)
+    w.join(timeout=5)
+
+    with open(tmp_path / "episode_000000" / "meta.json") as f:
+        assert json.load(f)['status'] == 'recording'
+    data, meta = read_episode(str(tmp_path / "episode_000000"))
+    assert len(data['t']) == 100 and len(meta['chunks']) == 2
+
+
+def test_failed_chunk_is_not_listed(tmp_path, monkeypatch):
+    w = EpisodeWriter(str(tmp_path), chunk_frames=50)
+    w.start()
+    w.begin_episode("demo")
+    feed(w, 50)
+    w.jobs.join()
+
+    real_savez = np.savez_compressed
+    def full_disk(path, **arrays):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(np, "savez_compressed", full_disk)
+    feed(w, 50, t0=1.0)
+    w.jobs.join()
+    monkeypatch.setattr(np, "savez_compressed", real_savez)
+    feed(w, 30, t0=2.0)
+    w.end_episode()
+    with pytest.raises(OSError):
+        w.close()              # the failure is still reported
+
+    data, meta = read_episode(str(tmp_path / "episode_000000"))
+    assert [c['file'] for c in meta['chunks']] == ["chunk_000000.npz", "chunk_000002.npz"]
+    assert meta['frames'] == 80 and meta['chunks_failed'] == 1 and len(data['t']) == 80
+    assert meta['status'] == 'complete'
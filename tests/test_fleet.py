@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.fleet import run_fleet, save_report
+
+EXPECTED = [(-165.0, 165.0), (-54.0, 100.0), (62.0, -100.0)]
+
+
+def make_fleet(n, latency=0.01):
+    arms = {f"SIM{i}": SimulatedArm(f"SIM{i}", latency=latency) for i in range(n)}
+
+    def connect(port):
+        if port not in arms:
+            raise OSError(f"could not open port {port}")
+        return arms[port]
+    return arms, connect
+
+
+def test_audit_runs_arms_concurrently(tmp_path):
+    arms, connect = make_fleet(4)
+    for arm in arms.values():
+        arm.limits.update({1: (-165.0, 165.0), 2: (-54.0, 100.0), 3: (-100.0, 62.0)})
+    arms["SIM2"].limits[2] = (-80.0, 100.0)
+
+    report = run_fleet(list(arms) + ["MISSING"], connect, EXPECTED)
+    by_port = {a['port']: a for a in report['arms']}
+    assert by_port["SIM0"]['ok'] and not by_port["SIM2"]['ok']
+    assert by_port["SIM2"]['joints'][1]['status'] == "MISMATCH"
+    assert by_port["MISSING"]['error'].startswith("OSError")
+
+    # 6 reads x 10 ms per arm: wall time ~ one arm, not the sum of four
+    slowest = max(a['elapsed_s'] for a in report['arms'])
+    assert report['wall_s'] < slowest + 0.05
+    assert report['wall_s'] < 0.6 * report['sum_arm_s']
+
+    path = str(tmp_path / "report.json")
+    save_report(report, path)
+    with open(path) as f:
+        assert len(json.load(f)['arms']) == 5
+
+
+def test_write_then_verify():
+    arms, connect = make_fleet(2, latency=0.0)
+    report = run_fleet(list(arms), connect, EXPECTED, write=True, write_delay=0.0)
+    assert all(a['ok'] for a in report['arms'])
+    assert arms["SIM1"].limits[3] == (-100.0, 62.0)
+
+
+def test_write_skips_devices_that_are_not_an_m750():
+    arms, connect = make_fleet(2, latency=0.0)
+    before = dict(arms["SIM1"].limits)
+    arms["SIM1"].inject('short')      # e.g. the C650 leader on the same hub
+    report = run_fleet(list(arms), connect, EXPECTED, write=True, write_delay=0.0)
+    by_port = {a['port']: a for a in report['arms']}
+    assert by_port["SIM0"]['ok']
+    assert by_port["SIM1"]['error'].startswith("ValueError") and not by_port["SIM1"]['ok']
+    assert arms["SIM1"].limits == before
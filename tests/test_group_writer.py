@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import csv
+import time
+
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.group_writer import GroupWriter
+
+
+def read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_rows_reach_file_within_one_window(tmp_path):
+    path = str(tmp_path / "log.csv")
+    w = GroupWriter(path, header=['T', 'J1'], window_ms=50, max_rows=10_000, fsync_s=0)
+    w.start()
+    for i in range(100):
+        w.writerow([i, i * 2])
+    # Still buffered right after writerow(), on disk after one window (no close needed)
+    time.sleep(0.2)
+    rows = read_rows(path)
+    assert rows[0] == ['T', 'J1'] and len(rows) == 101 and rows[-1] == ['99', '198']
+
+    w.writerow([100, 200])
+    w.close()
+    assert len(read_rows(path)) == 102
+    st = w.stats()
+    assert st['rows'] == 101 and st['groups'] >= 2 and st['fsyncs'] >= 2
+
+
+def test_max_rows_commits_early_and_context_manager(tmp_path):
+    path = str(tmp_path / "log.csv")
+    with GroupWriter(path, window_ms=10_000, max_rows=50, fsync_s=None) as w:
+        for i in range(120):
+            w.writerow([i])
+        time.sleep(0.1)
+        # The long window hasn't elapsed, but full groups were committed already
+        assert len(read_rows(path)) >= 100
+    assert len(read_rows(path)) == 120 and w.fsyncs == 0
+
+
+def test_writerow_raises_after_a_write_error(tmp_path):
+    path = str(tmp_path / "log.csv")
+    w = GroupWriter(path, window_ms=10, fsync_s=None)
+    w.start()
+
+
+    class FullDisk:
+        def writerows(self, rows):
+            raise OSError(28, "No space left on device")
+
+    w.writer = FullDisk()
+    w.writerow([1])
+    w.join(timeout=1.0)
+    assert not w.is_alive() and w.error is not None
+    with pytest.raises(OSError):
+        w.writerow([2])
+    assert w.buffer == []
+    with pytest.raises(OSError):
+        w.close()
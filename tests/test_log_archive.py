@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import csv
+import zlib
+import struct
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.log_archive import (ArchiveReader, ArchiveWriter, DTYPES, encode_csv, decode_csv, verify_csv,
+                               open_table, open_dict_rows)
+
+
+def write_csv(path, header, rows):
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+
+
+def read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+def motion_rows(n=3000, dt=0.02):
+    t = np.arange(n) * dt
+    rows = []
+    for i, ti in enumerate(t):
+        angles = [30 * np.sin(ti * (0.3 + 0.1 * j)) + j for j in range(6)]
+        rows.append([f"{1_700_000_000 + ti:.4f}"] + [f"{a:.2f}" for a in angles] + [f"{i % 100:.1f}"])
+    # Integers have no negative zero: "-0.00" is archived as "0.00"
+    return [['0.00' if v == '-0.00' else v for v in row] for row in rows]
+
+
+HEADER = ['Timestamp', 'J1', 'J2', 'J3', 'J4', 'J5', 'J6', 'Gripper']
+
+
+def test_round_trip_is_exact_at_logged_precision(tmp_path):
+    src = str(tmp_path / "c650_motion.csv")
+    rows = motion_rows()
+    write_csv(src, HEADER, rows)
+
+    dst = encode_csv(src, chunk_rows=500)
+    assert os.path.getsize(dst) < os.path.getsize(src) / 3
+    with ArchiveReader(dst) as r:
+        assert r.rows_total == len(rows) and len(r.chunks) == 6
+    assert verify_csv(src, dst)
+
+    out = decode_csv(dst, str(tmp_path / "decoded.csv"))
+    assert read_rows(out) == [HEADER] + rows
+
+
+def test_slow_columns_use_narrow_deltas(tmp_path):
+    path = str(tmp_path / "log.tla")
+    with ArchiveWriter(path, ['T', 'Still', 'Slow', 'Jump'], decimals=[2, 2, 2, 0]) as w:
+        for i in range(200):
+            w.write_row([i * 0.02, 5.0, i * 0.5, i * 100_000])
+    with ArchiveReader(path) as r:
+        r.file.seek(r.chunks[0][0])
+        (clen,) = struct.unpack('<I', r.file.read(4))
+        payload = zlib.decompress(r.file.read(clen))
+        codes = [payload[4 + 10 * j] for j in range(4)]
+        chunk = r.read_chunk(0)
+    assert [DTYPES[c] for c in codes] == [np.int8, np.int8, np.int8, np.int32]
+    assert chunk['Slow'][-1] == pytest.approx(99.5) and chunk['Jump'][-1] == 19_900_000
+
+
+def test_clock_timestamps_and_missing_values(tmp_path):
+    header = ['Timestamp', 'Input_J1', 'Output_J1']
+    rows = [[f"12:00:{i // 50:02d}.{(i % 50) * 20000:06d}", f"{i * 0.1:.2f}", f"{i * 0.05:.2f}" if i % 7 else '']
+            for i in range(300)]
+    src = str(tmp_path / "teleop_log.csv")
+    write_csv(src, header, rows)
+
+    dst = encode_csv(src, chunk_rows=64)
+    with ArchiveReader(dst) as r:
+        assert r.clock
+        k = r.seek_time(12 * 3600 + 3.0)
+        chunk = r.read_chunk(k)
+        t = chunk['Timestamp']
+        assert t[0] <= 12 * 3600 + 3.0 < t[-1] + 0.02
+        assert np.isnan(r.to_arrays()['Output_J1'][0])
+    assert read_rows(decode_csv(dst, str(tmp_path / "out.csv"))) == [header] + rows
+
+
+def test_precision_is_taken_per_chunk(tmp_path):
+    # Unformatted floats (record_baseline's get_angles()) only show decimals once the arm moves
+    src = str(tmp_path / "baseline.csv")
+    rows = [[str(i), '0', '0'] for i in range(10)] + [['10', '12.34', '-5.67'], ['11', '0.1', '3']]
+    write_csv(src, ['T', 'J1', 'Gripper'], rows)
+    dst = encode_csv(src, chunk_rows=10)
+    with ArchiveReader(dst) as r:
+        arrays = r.to_arrays()
+    assert list(arrays['J1'][-2:]) == [12.34, 0.1] and list(arrays['Gripper'][-2:]) == [-5.67, 3.0]
+    assert verify_csv(src, dst)
+
+
+def test_verify_rejects_rounded_values(tmp_path):
+    src = str(tmp_path / "log.csv")
+    write_csv(src, ['T', 'J1'], [['0', '1.5'], ['1', '2.25']])
+    dst = str(tmp_path / "log.tla")
+    with ArchiveWriter(dst, ['T', 'J1'], decimals=[0, 1]) as w:
+        w.write_rows([['0', '1.5'], ['1', '2.25']])
+    assert not verify_csv(src, dst)
+
+
+def test_text_columns_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Note"):
+        with ArchiveWriter(str(tmp_path / "log.tla"), ['T', 'Note']) as w:
+            w.write_row(['0.1', 'started'])
+
+
+def test_chunk_random_access_and_seek(tmp_path):
+    path = str(tmp_path / "log.tla")
+    with ArchiveWriter(path, ['T', 'J1'], decimals=[3, 2], chunk_rows=100) as w:
+        for i in range(1050):
+            w.write_row([i * 0.01, (i % 360) - 180.0])
+    with ArchiveReader(path) as r:
+        assert len(r.chunks) == 11 and r.chunks[-1][1] == 50
+        chunk = r.read_chunk(7)
+        assert chunk['T'][0] == pytest.approx(7.0) and len(chunk['T']) == 100
+        assert r.seek_time(7.555) == 7
+        assert r.seek_time(-1.0) == 0 and r.seek_time(99.0) == 10
+        arrays = r.to_arrays()
+    assert np.allclose(arrays['J1'], (np.arange(1050) % 360) - 180.0)
+
+
+def test_truncated_archive_is_read_without_footer(tmp_path):
+    path = str(tmp_path / "crash.tla")
+    w = ArchiveWriter(path, ['T', 'J1'], decimals=[2, 2], chunk_rows=100)
+    for i in range(350):
+        w.write_row([i * 0.02, i * 0.1])
+    w.file.close()   # process died: 3 full chunks on disk, open chunk and footer lost
+
+    with ArchiveReader(path) as r:
+        assert len(r.chunks) == 3
+        assert r.seek_time(4.5) == 2
+        assert len(r.to_arrays()['T']) == 300
+
+
+def test_lzma_codec(tmp_path):
+    src = str(tmp_path / "c650_motion.csv")
+    rows = motion_rows(1000)
+    write_csv(src, HEADER, rows)
+    dst = encode_csv(src, str(tmp_path / "m.tla"), codec='lzma')
+    with ArchiveReader(dst) as r:
+        assert r.codec == 'lzma'
+    assert read_rows(decode_csv(dst, str(tmp_path / "out.csv"))) == [HEADER] + rows
+
+
+def test_loaders_read_csv_and_archive_alike(tmp_path):
+    src = str(tmp_path / "c650_motion.csv")
+    write_csv(src, HEADER, motion_rows(500))
+    dst = encode_csv(src)
+
+    with open_table(src) as a, open_table(dst) as b:
+        assert list(a) == list(b)
+
+    fields_a, rows_a = open_dict_rows(src)
+    fields_b, rows_b = open_dict_rows(dst)
+    assert fields_a == fields_b == HEADER
+    assert list(rows_a) == list(rows_b)
+
+
+def test_clock_log_over_midnight_seeks_in_order(tmp_path):
+    # 23:59:30 -> 00:01:30 at 10 Hz: footer start times must not reset to 0
+    start = 23 * 3600 + 59 * 60 + 30
+    rows = []
+    for i in range(1200):
+        s = (start + i * 0.1) % 86400
+        h, rem = divmod(s, 3600)
+        m, sec = divmod(rem, 60)
+        rows.append([f"{int(h):02d}:{int(m):02d}:{sec:09.6f}", f"{i * 0.01:.2f}"])
+    src = str(tmp_path / "teleop_log.csv")
+    write_csv(src, ['Timestamp', 'Input_J1'], rows)
+    dst = encode_csv(src, chunk_rows=100)
+
+    with ArchiveReader(dst) as r:
+        firsts = [c[2] for c in r.chunks]
+        assert firsts == sorted(firsts) and firsts[-1] == pytest.approx(86400 + 80.0)
+        assert r.seek_time(start + 15.0) == 1
+        k = r.seek_time(86400 + 45.0)     # 00:00:45 the next day
+        assert k == 7 and r.read_chunk(k)['Input_J1'][0] == pytest.approx(7.0)
+
+    # Same answer without the footer (chunk times decoded, then unwrapped)
+    with open(dst, 'rb') as f:
+        data = f.read()
+    (pos,) = struct.unpack('<Q', data[-12:-4])
+    torn = str(tmp_path / "torn.tla")
+    with open(torn, 'wb') as f:
+        f.write(data[:pos])
+    with ArchiveReader(torn) as r:
+        assert r.seek_time(86400 + 45.0) == 7
@@ -91,3 +91,12 @@ def test_raw_data_compliance():
                     continue
             
             print(f"  Verified {row_count} frames.")
+
+
+def test_explicit_calibration_record_is_used():
+    from utils import calibration
+    cal = calibration.defaults()
+    narrow = cal.replace(m750_limits=[(-10.0, 10.0)] * 6, leader_gripper_closed=0.0, leader_gripper_open=10.0)
+    mapped, _ = mapping.process_arm_angles([180.0] * 6, narrow)
+    assert all(-10.0 <= a <= 10.0 for a in mapped)
+    assert mapping.process_gripper(5.0, narrow) == 50
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import csv
+import json
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.motion_trigger import MotionTrigger, SegmentRecorder, segment_file
+
+
+def idle_move_log(path, hz=100):
+    """Idle 5 s, move J2 at 30 deg/s for 2 s, idle 5 s, move for 1 s, idle 3 s (0.05 deg noise)."""
+    rng = np.random.default_rng(1)
+    plan = [(5, 0), (2, 30), (5, 0), (1, -30), (3, 0)]
+    rows, t, j2 = [], 0.0, 0.0
+    for dur, vel in plan:
+        for _ in range(int(dur * hz)):
+            angles = [0.0] * 6
+            angles[1] = j2 + rng.normal(0, 0.05)
+            rows.append([f"{t:.4f}"] + [f"{a:.2f}" for a in angles] + ["0"])
+            t += 1.0 / hz
+            j2 += vel / hz
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(["Timestamp", "J1", "J2", "J3", "J4", "J5", "J6", "Gripper"])
+        w.writerows(rows)
+    return len(rows)
+
+
+def test_noise_does_not_trigger_but_motion_does():
+    trig = MotionTrigger(threshold=5.0, quiet_s=1.0, window=0.1)
+    rng = np.random.default_rng(0)
+    events = [trig.update(i * 0.01, list(rng.normal(0, 0.1, 6))) for i in range(500)]
+    assert not any(events)
+    events = [trig.update(5 + i * 0.01, [i * 0.2] + [0] * 5) for i in range(50)]   # 20 deg/s
+    assert events.count('start') == 1
+    events = [trig.update(5.5 + i * 0.01, [10.0] + [0] * 5) for i in range(200)]
+    assert events.count('stop') == 1 and not trig.active
+
+
+def test_segments_with_pre_roll_and_index(tmp_path):
+    src = str(tmp_path / "c650_motion_1.csv")
+    total = idle_move_log(src)
+    rec, index = segment_file(src, str(tmp_path / "out"), threshold=5.0, pre_roll_s=1.0, quiet_s=1.0)
+
+    segs = index['segments']
+    assert len(segs) == 2 and index['samples_seen'] == total
+    # Pre-roll reaches back ~1 s before each motion starts (5.0 s and 12.0 s)
+    assert 4.0 <= segs[0]['t_start'] <= 4.2 and 11.0 <= segs[1]['t_start'] <= 11.2
+    assert 5.0 <= segs[0]['t_trigger'] <= 5.2
+    # Idle stretches are dropped: well under half of the samples are kept
+    assert index['samples_kept'] < 0.5 * total
+
+    with open(tmp_path / "out" / "c650_motion_1_segments.json") as f:
+        assert json.load(f)['samples_kept'] == index['samples_kept']
+    with open(tmp_path / "out" / segs[0]['file']) as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "Timestamp" and len(rows) - 1 == segs[0]['rows']
+
+
+def test_drop_in_writer_interface(tmp_path):
+    written = {}
+
+    class ListWriter(list):
+        def writerow(self, row):
+            self.append(row)
+
+        def close(self):
+            pass
+
+    def factory(path):
+        written[path] = ListWriter()
+        return written[path]
+
+    rec = SegmentRecorder(str(tmp_path / "x.csv"), ["Timestamp"], threshold=5.0, pre_roll_s=0.2,
+                          quiet_s=0.5, writer_factory=factory)
+    for i in range(100):
+        rec.writerow([i * 0.01, 0, 0, 0, 0, 0, 0])
+    assert not written
+    for i in range(100):
+        rec.writerow([1 + i * 0.01, i * 0.5, 0, 0, 0, 0, 0])
+    assert rec.recording and len(written) == 1
+    rec.close()
+    assert rec.kept == sum(len(w) for w in written.values())
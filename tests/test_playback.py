@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.playback import measure_move, run_playback, save_report
+
+
+class LaggingArm(SimulatedArm):
+    """Follower that approaches the commanded pose with a first-order lag (tau seconds)."""
+
+    def __init__(self, tau=0.05, offset=0.0, **kw):
+        super().__init__(n_joints=6, latency=0.001, **kw)
+        self.tau = tau
+        self.offset = offset
+        self.start = [0.0] * 6
+        self.goal = [0.0] * 6
+        self.t_cmd = time.monotonic()
+
+    def write_angles(self, angles, speed):
+        self.start = self.get_angles()
+        self.goal = [a + self.offset for a in angles]
+        self.t_cmd = time.monotonic()
+
+    def get_angles(self):
+        k = 1.0 - 2.718281828 ** (-(time.monotonic() - self.t_cmd) / self.tau)
+        self.angles = [s + (g - s) * k for s, g in zip(self.start, self.goal)]
+        return self._read(6)
+
+
+def test_move_settles_and_reports_step_metrics():
+    arm = LaggingArm(tau=0.05)
+    m = measure_move(arm, [30, 0, -20, 0, 0, 0], speed=50, tol=0.5, hold=0.05, timeout=2.0)
+    assert m['settled'] and m['samples'] > 10 and m['invalid'] == 0
+    j1 = m['joints'][0]
+    # First-order lag: settle into 0.5 deg of a 30 deg step ~ tau * ln(60) ~ 0.2 s
+    assert 0.1 < j1['settle_time'] < 0.5
+    assert j1['overshoot'] < 1.0 and abs(j1['final_error']) <= 0.5
+
+
+def test_timeout_and_offset_show_in_summary(tmp_path):
+    arm = LaggingArm(tau=0.01, offset=2.0)     # never gets within 1 deg
+    report = run_playback(arm, [("a", [10] * 6), ("b", [-10] * 6)], cycles=2, speed=50,
+                          tol=1.0, hold=0.05, timeout=0.2, settings={'calibration_version': 3}, log=None)
+    s = report['poses']['a']['summary']
+    assert s['cycles'] == 2 and s['settled'] == 0
+    assert abs(s['final_error_max'] - 2.0) < 0.1
+    assert max(r['std'] for r in s['repeatability']) < 0.05
+    assert report['settings']['calibration_version'] == 3 and report['settings']['speed'] == 50
+
+    path = str(tmp_path / "playback.json")
+    save_report(report, path)
+    with open(path) as f:
+        assert json.load(f)['poses']['b']['target'] == [-10] * 6
+
+
+def test_failed_start_reads_are_retried():
+    arm = LaggingArm(tau=0.01)
+    arm.inject('none', 2)      # two bad reads, then the start pose comes through
+    m = measure_move(arm, [5] * 6, speed=50, tol=0.5, hold=0.02, timeout=1.0)
+    assert m['error'] is None and m['settled'] and m['start'] == [0.0] * 6
+
+
+def test_unreadable_start_pose_fails_the_move_not_the_sweep():
+    arm = LaggingArm(tau=0.01)
+    arm.inject('none', 5)      # "a": every start read fails, the arm is not moved
+    arm.inject('oserror', 1)   # "b", cycle 1: first read raises, then recovers
+    lines = []
+    report = run_playback(arm, [("a", [10] * 6), ("b", [-10] * 6)], cycles=2, speed=50,
+                          tol=1.0, hold=0.02, timeout=0.5, log=lines.append)
+    a, b = report['poses']['a'], report['poses']['b']
+    assert a['moves'][0]['error'] == "could not read start pose" and a['moves'][0]['start'] is None
+    assert a['summary']['failed'] == 1 and a['summary']['settled'] == 1
+    assert b['summary']['failed'] == 0 and b['summary']['settled'] == 2
+    assert any("FAILED" in line for line in lines)
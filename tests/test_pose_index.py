@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pose_index import PoseIndex
+
+
+def test_matches_brute_force_and_stays_fast():
+    rng = np.random.default_rng(0)
+    poses = rng.uniform(-150, 150, size=(30000, 6))
+    index = PoseIndex()
+    for i, p in enumerate(poses):
+        index.add_pose(f"p{i}", p)
+    index.build()
+
+    for q in rng.uniform(-150, 150, size=(200, 6)):
+        matches = index.query(q, k=3)
+        brute = np.argsort(np.linalg.norm(poses - q, axis=1))[:3]
+        assert [m[0] for m in matches] == [f"p{i}" for i in brute]
+    label, dist, err = matches[0]
+    assert np.allclose(err, q - poses[int(label[1:])])
+
+    # Tens of thousands of poses, still microseconds per query
+    assert index.stats()['query_us_avg'] < 500.0
+
+
+def test_baselines_and_trajectory_dedup(tmp_path):
+    traj = tmp_path / "baseline_traj_1.csv"
+    rows = ["Timestamp,J1,J2,J3,J4,J5,J6,Gripper"]
+    for i in range(100):
+        j1 = 0.0 if i < 50 else float(i - 50)   # idle for 50 frames, then moves 1 deg/frame
+        rows.append(f"{i*0.1:.4f},{j1},0,0,0,0,0,0")
+    traj.write_text("\n".join(rows) + "\n")
+
+    index = PoseIndex(min_spacing=0.5)
+    index.add_baselines({"home": {"angles": [0, 0, 0, 0, 0, 0]}, "bad": {"angles": [1, 2]}})
+    kept = index.add_trajectory_dir(str(tmp_path))
+    assert kept == 50            # 1 idle frame + 49 moving frames
+    index.build()
+
+    label, dist, _ = index.query([20.2, 0, 0, 0, 0, 0], k=1)[0]
+    assert label.startswith("traj:baseline_traj_1.csv@7.00s") and abs(dist - 0.2) < 1e-9
+    assert index.query([0.1, 0, 0, 0, 0, 0], k=2)[0][1] < 0.2
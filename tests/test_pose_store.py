@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pose_store import PoseStore
+
+
+def test_put_get_tags_and_reopen(tmp_path):
+    path = str(tmp_path / "poses.jsonl")
+    store = PoseStore(path, legacy_path=None)
+    store.put("home", [0] * 6, tags=["rest"])
+    store.put("lift", [10] * 6, tags=["pick", "test"])
+    store.put("lift", [12] * 6, tags=["pick"])       # overwrite
+    store.put("tmp", [1] * 6)
+    assert store.delete("tmp") and not store.delete("tmp")
+
+    again = PoseStore(path, legacy_path=None)
+    assert again.names() == ["home", "lift"]
+    assert again.get("lift")["angles"] == [12] * 6
+    assert again.by_tag("pick") == ["lift"] and again.by_tag("test") == []
+    assert again.records == 5 and again.dead_records() == 3
+
+
+def test_torn_last_line_is_skipped_and_not_glued(tmp_path):
+    path = str(tmp_path / "poses.jsonl")
+    store = PoseStore(path, legacy_path=None)
+    store.put("a", [1] * 6)
+    with open(path, "a") as f:
+        f.write('{"op":"put","name":"b","ang')   # crash mid-append
+
+    store = PoseStore(path, legacy_path=None)
+    assert store.names() == ["a"] and store.bad_lines == 1
+    store.put("c", [3] * 6)
+    assert PoseStore(path, legacy_path=None).names() == ["a", "c"]
+
+
+def test_compaction_and_legacy_migration(tmp_path):
+    legacy = tmp_path / "baselines.json"
+    legacy.write_text(json.dumps({"home": {"timestamp": "t0", "angles": [0] * 6, "desc": "home"}}))
+    path = str(tmp_path / "poses.jsonl")
+
+    store = PoseStore(path, legacy_path=str(legacy))
+    assert store.get("home")["timestamp"] == "t0"
+    for i in range(200):
+        store.put("moving", [float(i)] * 6)
+    assert store.compact_if_needed() is not None
+    before_names = store.names()
+
+    reopened = PoseStore(path, legacy_path=str(legacy))
+    assert reopened.names() == before_names and reopened.records == 2
+    assert reopened.get("moving")["angles"] == [199.0] * 6
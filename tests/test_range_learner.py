@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import random
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.range_learner import TDigest, RangeLearner, merge_files
+
+
+def test_tdigest_tail_quantiles_and_bounded_size():
+    random.seed(0)
+    xs = [random.uniform(-50.0, 100.0) for _ in range(20000)]
+    td = TDigest(compression=100)
+    for x in xs:
+        td.add(x)
+    for q in (0.002, 0.01, 0.5, 0.99, 0.998):
+        assert abs(td.quantile(q) - np.quantile(xs, q)) < 0.3
+    assert len(td.means) <= 100
+
+
+def test_single_glitch_does_not_widen_limits():
+    random.seed(1)
+    learner = RangeLearner(n_joints=2)
+    for _ in range(3000):
+        learner.update([random.uniform(-40, 60), random.uniform(-10, 10)])
+    learner.update([180.0, 999.0])   # In-range glitch on J1, garbage on J2
+    lo, hi = learner.suggest(0)
+    assert learner.raw_range(0)[1] == 180.0
+    assert hi < 61.0 and lo > -41.0
+    assert learner.rejected[1] == 1
+    assert learner.coverage(0) > 0.95
+
+
+def test_merge_sessions_via_files(tmp_path):
+    random.seed(2)
+    paths = []
+    for k, (a, b) in enumerate([(-30, 10), (0, 50)]):
+        rl = RangeLearner(n_joints=1)
+        for _ in range(2000):
+            rl.update([random.uniform(a, b)])
+        p = str(tmp_path / f"s{k}.json")
+        rl.save(p)
+        paths.append(p)
+
+    merged = merge_files(paths)
+    lo, hi = merged.suggest(0)
+    assert merged.sessions == 2 and merged.samples(0) == 4000
+    assert -30.5 < lo < -29.0 and 49.0 < hi < 50.5
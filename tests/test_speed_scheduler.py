@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import math
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.speed_scheduler import SpeedScheduler, simulate_follower, tracking_lag
+
+
+def test_speed_follows_commanded_delta():
+    """Large jumps get fast speeds, small corrections get slow ones."""
+    sched = SpeedScheduler(min_speed=10, max_speed=100, max_joint_speed=100.0, margin=1.0)
+    sched.update([0.0] * 6, t=0.0)
+    small = sched.update([0.5] + [0.0] * 5, t=0.05, dt_next=0.05)
+    sched.reset()
+    sched.update([0.0] * 6, t=0.0)
+    large = sched.update([30.0] + [0.0] * 5, t=0.05, dt_next=0.05)
+    assert small == 10
+    assert large == 100
+
+
+def test_reaches_target_by_next_frame():
+    """A 4 deg step over 50 ms needs 80 deg/s -> speed 80 with a 100 deg/s follower."""
+    sched = SpeedScheduler(max_joint_speed=100.0, margin=1.0, alpha=0.0)
+    sched.update([0.0], t=0.0)
+    assert sched.update([4.0], t=0.05, dt_next=0.05) == 80
+
+
+def test_scheduled_beats_slow_fixed_speed_on_sweep():
+    times = [k * 0.05 for k in range(200)]
+    targets = [[60.0 * math.sin(t * 2.0)] for t in times]
+
+    slow = simulate_follower(times, targets, [20] * len(times))
+    sched = SpeedScheduler()
+    speeds = [sched.update(tgt, t) for t, tgt in zip(times, targets)]
+    scheduled = simulate_follower(times, targets, speeds)
+
+    rms_slow, lag_slow = tracking_lag(times, targets, slow)
+    rms_sched, lag_sched = tracking_lag(times, targets, scheduled)
+    assert rms_sched < rms_slow
+    assert lag_sched <= lag_slow
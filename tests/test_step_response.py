@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import math
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.step_response import step_metrics, StepDetector
+
+
+def first_order(t, start, target, tau=0.1):
+    return target + (start - target) * math.exp(-t / tau)
+
+
+def test_first_order_metrics():
+    times = [i * 0.01 for i in range(200)]
+    values = [first_order(t, 0.0, 50.0) for t in times]
+    m = step_metrics(times, values, 0.0, 50.0, tol=1.0)
+    # 10->90% of a first-order response is tau * ln(9)
+    assert abs(m['rise_time'] - 0.1 * math.log(9)) < 0.02
+    # Within 1 deg of a 50 deg step: tau * ln(50)
+    assert abs(m['settle_time'] - 0.1 * math.log(50)) < 0.02
+    assert m['overshoot'] == 0.0
+    assert abs(m['final_error']) < 0.01
+
+
+def test_overshoot_and_negative_step():
+    times = [i * 0.01 for i in range(300)]
+    # Underdamped response stepping down 0 -> -40
+    values = [-40.0 * (1 - math.exp(-4 * t) * math.cos(12 * t)) for t in times]
+    m = step_metrics(times, values, 0.0, -40.0, tol=1.0)
+    assert m['overshoot'] > 10.0
+    assert m['settle_time'] is not None and m['settle_time'] > m['rise_time']
+
+
+def test_never_settles():
+    times = [0.0, 0.1, 0.2]
+    m = step_metrics(times, [0.0, 5.0, 10.0], 0.0, 50.0)
+    assert m['settle_time'] is None
+    assert m['rise_time'] is None
+    assert m['final_error'] == 40.0
+
+
+def test_detector_scores_live_step():
+    det = StepDetector(threshold=2.0, tol=1.0, hold=0.2)
+    dt = 1 / 30.0
+    result = None
+    # Idle at 0, command jumps to 30 at t=0.5
+    for i in range(90):
+        t = i * dt
+        cmd = 0.0 if t < 0.5 else 30.0
+        actual = 0.0 if t < 0.5 else first_order(t - 0.5, 0.0, 30.0)
+        m = det.update(t, cmd, actual)
+        if m:
+            result = m
+            break
+    assert result is not None
+    assert result['settled'] and result['start'] == 0.0 and result['target'] == 30.0
+    assert abs(result['settle_time'] - 0.1 * math.log(30)) < 2 * dt
+
+
+def test_detector_ignores_small_moves():
+    det = StepDetector(threshold=2.0, tol=1.0, hold=0.1)
+    results = [det.update(i * 0.05, 0.0 if i < 2 else 1.0, 0.0 if i < 3 else 1.0) for i in range(20)]
+    assert all(r is None for r in results)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.strip_chart import StripChart
+
+
+def test_ring_buffer_view_is_ordered():
+    chart = StripChart(n_joints=2, window=1.0, rate_hz=5.0)   # capacity 10
+    for i in range(25):
+        chart.append(float(i), [i, -i], [None, i])
+    h = chart.head
+    view = chart.t[h:h + chart.capacity]
+    assert list(view) == [float(i) for i in range(15, 25)]
+    assert np.isnan(chart.act[0, h:h + chart.capacity]).all()
+    assert chart.cmd[1, h + chart.capacity - 1] == -24
+
+
+def test_redraw_blits_after_single_full_draw():
+    chart = StripChart(n_joints=6, window=10.0, rate_hz=30.0)
+    for i in range(60):
+        t = i / 30.0
+        chart.append(t, [i % 50] * 6, [i % 40] * 6)
+        chart.redraw(t)
+    st = chart.stats()
+    assert st['full_draws'] == 1
+    assert st['frames'] == 60
+    # Budget at 30 fps is 33 ms; a blit frame should be a small slice of that
+    assert st['redraw_ms_avg'] < 20.0
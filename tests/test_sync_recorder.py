@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.sync_recorder import SyncRecorder, stream_skew, load_session
+
+
+def test_two_streams_share_one_clock(tmp_path):
+    leader = SimulatedArm(n_joints=7, latency=0.002)
+    follower = SimulatedArm(n_joints=6, latency=0.005)
+    leader.inject('none', count=3)
+    follower.inject('oserror', count=2)
+
+    path = str(tmp_path / "sync.csv")
+    rec = SyncRecorder(leader.get_joints_angle, follower.get_angles, path)
+    rec.start()
+    for i in range(5):
+        time.sleep(0.05)
+        leader.set_pose([float(i)] * 7)
+        follower.set_pose([float(i)] * 6)
+        rec.flush()
+    summary = rec.close()
+
+    lead, follow = summary['leader'], summary['follower']
+    # Back-to-back reads: rate is bounded by the simulated link latency, not a sleep
+    assert lead['rate_hz'] > 150 and follow['rate_hz'] > 60
+    assert lead['invalid'] == 3 and follow['errors'] == 2
+    # Follower period ~5 ms -> a leader sample is never far from a follower sample
+    assert summary['skew']['max_ms'] < 30
+
+    with open(os.path.splitext(path)[0] + ".json") as f:
+        assert json.load(f)['leader']['samples'] == lead['samples']
+    session = load_session(path)
+    t_l, d_l = session['leader']
+    t_f, d_f = session['follower']
+    assert len(t_l) == lead['samples'] and d_l.shape[1] == 7 and d_f.shape[1] == 6
+    assert np.all(np.diff(t_l) > 0) and t_f[0] >= 0
+
+
+def test_stream_skew_nearest_sample():
+    a = [0, 10_000_000, 20_000_000]          # 0, 10, 20 ms
+    b = [1_000_000, 12_000_000, 30_000_000]  # 1, 12, 30 ms
+    sk = stream_skew(a, b)
+    assert sk['max_ms'] == 8.0 and sk['p50_ms'] == 2.0 and sk['start_offset_ms'] == 1.0
+    assert stream_skew([], b) is None
+
+
+def test_load_session_with_an_empty_stream(tmp_path):
+    # Follower never answered: its stream has no rows, but still has joint columns
+    path = str(tmp_path / "session.csv")
+    with open(path, 'w') as f:
+        f.write("Stream,T_ns,Read_ns,J1,J2,J3,J4,J5,J6,J7\n")
+        f.write("leader,1000000,200000," + ",".join(["1.00"] * 7) + "\n")
+    session = load_session(path)
+    t_f, d_f = session['follower']
+    assert len(t_f) == 0 and d_f.shape == (0, 6) and d_f[:, :6].shape == (0, 6)
+    assert session['leader'][1].shape == (1, 7)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.telemetry import TelemetryPoller
+
+
+def test_latest_keeps_newest_and_carries_power():
+    arm = SimulatedArm()
+    poller = TelemetryPoller(arm, power_every=3, maxsize=2)
+    for i in range(5):
+        arm.set_pose([float(i)] * 6)
+        poller.poll()
+    snap = poller.latest()
+    assert snap['angles'] == [4.0] * 6
+    assert snap['powered'] is True   # from tick 3, carried onto tick 4
+    assert poller.dropped == 3
+    assert poller.latest() is None
+
+
+def test_gui_drain_never_waits_on_slow_serial():
+    arm = SimulatedArm(latency=0.05)   # 50 ms per serial reply
+    poller = TelemetryPoller(arm, rate_hz=50.0, power_every=0)
+    poller.start()
+
+    worst = 0.0
+    frames = 0
+    end = time.monotonic() + 0.3
+    while time.monotonic() < end:
+        t0 = time.perf_counter()
+        poller.latest()
+        worst = max(worst, time.perf_counter() - t0)
+        frames += 1
+        time.sleep(1 / 60)
+    poller.stop()
+
+    assert worst < 0.005     # UI callback cost stays far below a 16 ms frame
+    assert frames >= 15
+    assert poller.ticks >= 3
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import io
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.terminal_dashboard import TerminalDashboard
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def test_diff_writes_only_changed_cells():
+    dash = TerminalDashboard(lambda: None, stream=io.StringIO())
+    first = dash.diff(["J1 | 10.00", "J2 | 20.00"], full=True)
+    assert first.startswith("\033[2J") and "J2 | 20.00" in first
+
+    out = dash.diff(["J1 | 10.50", "J2 | 20.00"])
+    # One run on row 1 starting at column 9 ("5"), cursor parked on row 3
+    assert out == "\033[1;9H5\033[3;1H"
+
+
+def test_shorter_lines_are_blanked():
+    dash = TerminalDashboard(lambda: None, stream=io.StringIO())
+    dash.diff(["abcdef", "row2"], full=True)
+    out = dash.diff(["abc"])
+    assert "\033[1;4H   " in out
+    assert "\033[2;1H    " in out
+
+
+def test_refresh_is_one_write_and_measured():
+    stream = CountingStream()
+    frames = iter([["a 1", "b 2"], ["a 1", "b 3"]])
+    dash = TerminalDashboard(lambda: next(frames), stream=stream, full_every=0)
+    dash.refresh(now=0.0)
+    dash.refresh(now=0.1)
+    assert stream.writes == 2
+    st = dash.stats()
+    assert st['refreshes'] == 2 and st['full_frames'] == 1
+    assert st['bytes_avg'] > 0 and st['cpu_us_max'] >= 0.0
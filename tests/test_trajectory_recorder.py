@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.rate_stats import RateStats
+from utils.trajectory_recorder import TrajectoryRecorder
+
+
+class CountingArm(SimulatedArm):
+    def __init__(self, **kw):
+        super().__init__(n_joints=6, **kw)
+        self.gripper_reads = 0
+
+    def get_gripper_value(self):
+        self.gripper_reads += 1
+        self.gripper += 1
+        return super().get_gripper_value()
+
+
+class Rows(list):
+    def writerow(self, row):
+        self.append(row)
+
+
+def test_max_rate_joints_and_decimated_gripper():
+    arm = CountingArm(latency=0.002)
+    arm.inject('oserror', count=2)     # first hits the gripper poll, then a joint read
+    rows = Rows()
+    rec = TrajectoryRecorder(arm, rows, gripper_hz=10.0)
+    rec.run(duration=0.5)
+
+    st = rec.stats()
+    # ~2 ms per read and no sleep: far above the old 10 Hz
+    assert st['joints']['rate_hz'] > 150 and st['joints']['samples'] == len(rows)
+    assert st['joints']['dropped_by_kind']['io'] == 1 and st['gripper']['dropped'] == 1
+    assert 5 <= arm.gripper_reads <= 7
+    # Gripper value is carried forward between polls, and only changes at a poll
+    grips = [r[-1] for r in rows]
+    assert grips == sorted(grips) and len(set(grips)) <= arm.gripper_reads + 1
+
+
+def test_rate_stats_jitter_and_gaps():
+    s = RateStats()
+    for i in range(100):
+        s.tick(i * 0.01 + (0.05 if i >= 50 else 0.0))   # one 60 ms gap
+    s.drop('short')
+    st = s.stats()
+    assert abs(st['period_ms_p50'] - 10.0) < 1e-6
+    assert abs(st['gap_ms_max'] - 60.0) < 1e-6 and st['dropped'] == 1
+    assert abs(st['rate_hz'] - 99 / 1.04) < 1e-6
+
+
+def test_lost_port_backs_off_and_stops():
+    arm = CountingArm()
+    arm.inject('disconnect')
+    sleeps = []
+    rec = TrajectoryRecorder(arm, Rows(), gripper_hz=0, max_io_errors=5, sleep=sleeps.append)
+    rec.run(duration=5.0)
+    assert rec.link_lost and rec.joints.stats()['dropped_by_kind']['io'] == 5
+    # Growing, never-zero delays between retries instead of a busy spin
+    assert len(sleeps) == 4 and all(s > 0 for s in sleeps) and sleeps == sorted(sleeps)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.transport import ResilientArm, Backoff, classify_read, ERR_NONE, ERR_SHORT, ERR_INVALID
+
+
+def make_link(sim, **kwargs):
+    sleeps = []
+    link = ResilientArm(connect=lambda port: sim, port=sim.port, client=sim,
+                        sleep=sleeps.append, **kwargs)
+    return link, sleeps
+
+
+def test_classify_read():
+    assert classify_read(None, 7) == ERR_NONE
+    assert classify_read([1.0, 2.0], 7) == ERR_SHORT
+    assert classify_read([0.0] * 6 + [999.0], 7) == ERR_INVALID
+    assert classify_read([0.0] * 7, 7) is None
+
+
+def test_bad_reads_back_off_instead_of_spinning():
+    sim = SimulatedArm()
+    link, sleeps = make_link(sim, backoff=Backoff(base=0.01, max_delay=0.04))
+    sim.inject('none', 2)
+    sim.inject('short', 1)
+    sim.inject('garbage', 1)
+
+    results = [link.read() for _ in range(5)]
+    assert results[:4] == [None] * 4
+    assert results[4] == [0.0] * 7
+
+    # Every failed read slept, growing exponentially up to the bound
+    assert sleeps == [0.01, 0.02, 0.04, 0.04]
+    st = link.stats()
+    assert st['errors']['none'] == 2 and st['errors']['short'] == 1 and st['errors']['invalid'] == 1
+    assert st['retries'] == 4 and st['ok_reads'] == 1
+
+
+def test_transient_oserror_does_not_disconnect():
+    sim = SimulatedArm()
+    link, _ = make_link(sim, max_io_errors=3)
+    sim.inject('oserror', 2)
+    assert link.read() is None
+    assert link.read() is None
+    assert link.read() is not None
+    assert link.connected
+
+
+def test_reconnects_in_background_and_holds_follower():
+    sim = SimulatedArm()
+    link, _ = make_link(sim, read_method='get_angles', expected_len=6, max_io_errors=2)
+    link.write_angles([10.0] * 6, 50)
+
+    sim.inject('disconnect')
+    link.read()
+    link.read()
+    assert not link.connected
+
+    # While down, writes are dropped: the follower keeps its last pose
+    link.write_angles([50.0] * 6, 50)
+    assert sim.angles[:6] == [10.0] * 6
+    assert link.stats()['dropped_writes'] == 1
+
+    sim.replug()
+    assert link.wait_connected(timeout=2.0)
+    assert link.read() == [10.0] * 6
+    st = link.stats()
+    assert st['reconnects'] == 1 and st['disconnected_s'] > 0
+
+
+def test_reconnect_follows_reenumerated_port():
+    sim = SimulatedArm(port="/dev/ttyACM0")
+    link, _ = make_link(sim, max_io_errors=1, port_finder=lambda: sim.port)
+    sim.inject('disconnect')
+    link.read()
+    sim.replug(port="/dev/ttyACM1")
+    assert link.wait_connected(timeout=2.0)
+    assert link.port == "/dev/ttyACM1"
+
+
+def test_failed_reconnect_candidates_are_closed():
+    sim = SimulatedArm()
+    candidates = []
+
+    def connect(port):
+        arm = SimulatedArm(port=port)
+        if len(candidates) < 3:
+            arm.inject('disconnect')   # Port opens, but the probe read fails
+        candidates.append(arm)
+        return arm
+
+    link = ResilientArm(connect=connect, port=sim.port, client=sim, max_io_errors=1, sleep=lambda s: None)
+    link.reconnect_backoff = Backoff(base=0.001, max_delay=0.002)
+    sim.inject('disconnect')
+    link.read()
+    assert link.wait_connected(timeout=2.0)
+    assert len(candidates) == 4
+    assert not sim._serial_port.is_open
+    assert [c._serial_port.is_open for c in candidates] == [False, False, False, True]
+    assert link.client is candidates[-1]
+
+
+def test_reconnect_rejects_a_reply_of_the_wrong_length():
+    # After a replug the port finder lands on the other arm: its 7-joint reply must not be adopted
+    sim = SimulatedArm(n_joints=6)
+    candidates = []
+
+    def connect(port):
+        arm = SimulatedArm(port=port, n_joints=7 if len(candidates) < 2 else 6)
+        candidates.append(arm)
+        return arm
+
+    link = ResilientArm(connect=connect, port=sim.port, client=sim, read_method='get_joints_angle', expected_len=6,
+                        max_io_errors=1, sleep=lambda s: None)
+    link.reconnect_backoff = Backoff(base=0.001, max_delay=0.002)
+    sim.inject('disconnect')
+    link.read()
+    assert link.wait_connected(timeout=2.0)
+    assert len(candidates) == 3 and link.client is candidates[-1]
+    assert len(link.read()) == 6
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import time
+import threading
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sim import SimulatedArm
+from utils.watchdog import CommWatchdog
+
+
+def test_trips_once_and_recovers():
+    events = []
+    wd = CommWatchdog(timeout=0.1, on_trip=events.append, on_recover=lambda reason: events.append('recovered'))
+    t0 = wd.last_leader
+    assert not wd.check(now=t0 + 0.05)
+    assert wd.check(now=t0 + 0.12)
+    assert not wd.check(now=t0 + 0.2)  # Already tripped: no repeated action
+    assert events == ['leader']
+    assert abs(wd.reactions[0][1] - 0.02) < 1e-6
+
+    wd.feed_leader()
+    t1 = wd.last_leader
+    wd.check(now=t1)
+    assert wd.tripped  # Hysteresis: one fresh frame is not enough
+    wd.check(now=t1 + 0.01)
+    wd.check(now=t1 + 0.02)
+    assert not wd.tripped
+    assert events[-1] == 'recovered'
+
+
+def test_follower_ack_staleness_trips():
+    reasons = []
+    wd = CommWatchdog(timeout=0.1, on_trip=reasons.append)
+    wd.feed_leader()
+    now = wd.last_leader
+    wd.last_follower = now - 0.5
+    assert wd.check(now=now)
+    assert reasons == ['follower']
+
+
+def test_follower_stall_recovers_only_on_a_fresh_ack():
+    """Leader keeps streaming while the follower stalls: no recover/re-trip cycling."""
+    acks = []   # what the follower answers to a probe read
+    events = []
+    wd = CommWatchdog(timeout=0.1, on_trip=events.append, on_recover=lambda reason: events.append('recovered ' + reason),
+                      follower_probe=lambda: acks.pop(0) if acks else False)
+    t0 = time.monotonic()
+    wd.last_follower = t0 - 0.5
+    for i in range(50):
+        now = t0 + i * 0.01
+        wd.last_leader = now   # leader keeps streaming
+        wd.check(now=now)
+    assert events == ['follower'] and wd.trips == 1 and wd.tripped
+
+    acks.append(True)
+    for i in range(50, 100):
+        now = t0 + i * 0.01
+        wd.last_leader = now   # leader keeps streaming
+        wd.check(now=now)
+        if not wd.tripped:
+            break
+    assert events == ['follower', 'recovered follower'] and wd.trips == 1
+
+
+def test_reaction_latency_against_stalling_device():
+    """Leader read stalls for 0.5 s: follower must be stopped within timeout + a few check periods."""
+    leader = SimulatedArm()
+    follower = SimulatedArm()
+    stopped_at = []
+
+    def on_trip(reason):
+        follower.stop()
+        stopped_at.append(time.monotonic())
+
+    wd = CommWatchdog(timeout=0.1, check_period=0.005, on_trip=on_trip, watch_follower=False)
+    running = [True]
+    last_frame = [0.0]
+
+    def control_loop():
+        while running[0]:
+            if leader.get_joints_angle() is not None:
+                last_frame[0] = time.monotonic()
+                wd.feed_leader()
+            time.sleep(0.01)
+
+    loop = threading.Thread(target=control_loop, daemon=True)
+    wd.start()
+    loop.start()
+    time.sleep(0.1)
+    leader.inject('stall', 1, stall_s=0.5)
+    time.sleep(0.4)
+    running[0] = False
+    wd.stop()
+
+    assert follower.stopped
+    assert wd.trips == 1
+    reaction = stopped_at[0] - last_frame[0]
+    assert 0.1 <= reaction < 0.1 + 0.05
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import json
+import time
+import http.client
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.web_dashboard import WebDashboard
+
+
+def frame(i):
+    return {'t': i * 0.1, 'in': [1.234567] * 7, 'norm': [0.5] * 6, 'out': [2.0] * 6,
+            'grip': 10, 'loop': {'arm': {'hz': 50.0, 'cost_ms': 1.2345, 'late_ms': 0.0, 'missed': 0}}}
+
+
+def test_stream_delivers_compact_frames():
+    web = WebDashboard(port=0, rate_hz=50.0)
+    web.start()
+    try:
+        conn = http.client.HTTPConnection(web.host, web.port, timeout=2)
+        conn.request("GET", "/stream")
+        resp = conn.getresponse()
+        assert resp.getheader("Content-Type") == "text/event-stream"
+
+        web.publish(frame(1))
+        line = resp.fp.readline()
+        assert line.startswith(b"data: ")
+        data = json.loads(line[6:])
+        assert data['in'][0] == 1.23 and data['loop']['arm']['cost_ms'] == 1.23
+        conn.close()
+
+        page = http.client.HTTPConnection(web.host, web.port, timeout=2)
+        page.request("GET", "/")
+        assert b"EventSource" in page.getresponse().read()
+    finally:
+        web.stop()
+
+
+def test_publish_cost_is_tiny_fraction_of_loop():
+    web = WebDashboard(port=0, rate_hz=20.0)
+    web.start()
+    try:
+        for i in range(2000):
+            web.publish(frame(i))
+        time.sleep(0.1)
+        st = web.stats(loop_period=0.02)
+        # 50 Hz loop: publishing must take well under 1% of a period
+        assert st['loop_budget_pct'] < 1.0
+        assert st['broadcasts'] >= 1
+    finally:
+        web.stop()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import sys
+import json
+import time
+import datetime
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'data', 'calibration', 'calibration.json')
+
+# Record fields and the config.py constant each one falls back to
+FIELDS = {
+    'c650_limits': 'C650_LIMITS',
+    'c650_home_angles': 'C650_HOME_ANGLES',
+    'm750_limits': 'M750_LIMITS',
+    'm750_gains': 'M750_GAINS',
+    'leader_gripper_closed': 'LEADER_GRIPPER_CLOSED',
+    'leader_gripper_open': 'LEADER_GRIPPER_OPEN',
+}
+
+
+class Calibration:
+    """
+    One immutable calibration record.
+
+    Attributes mirror the config.py constants (limits as lists of tuples),
+    plus version / created / note. Version 0 means "defaults from config.py".
+    """
+
+    def __init__(self, record):
+        self.version = record.get('version', 0)
+        self.created = record.get('created')
+        self.note = record.get('note', '')
+        self.c650_limits = [tuple(x) for x in record['c650_limits']]
+        self.c650_home_angles = list(record['c650_home_angles'])
+        self.m750_limits = [tuple(x) for x in record['m750_limits']]
+        self.m750_gains = list(record['m750_gains'])
+        self.leader_gripper_closed = record['leader_gripper_closed']
+        self.leader_gripper_open = record['leader_gripper_open']
+
+    def to_record(self):
+        rec = {'version': self.version, 'created': self.created, 'note': self.note}
+        for field in FIELDS:
+            value = getattr(self, field)
+            rec[field] = [list(v) for v in value] if field.endswith('_limits') else value
+        return rec
+
+    def replace(self, **changes):
+        """New (unsaved) record with some fields changed."""
+        rec = self.to_record()
+        rec.update({k: v for k, v in changes.items() if k in FIELDS or k == 'note'})
+        return Calibration(rec)
+
+
+def defaults():
+    """Calibration built from config.py (used until the first save)."""
+    rec = {field: getattr(config, name) for field, name in FIELDS.items()}
+    rec.update(version=0, note='config.py defaults')
+    return Calibration(rec)
+
+
+def history_dir(path=DEFAULT_PATH):
+    return os.path.join(os.path.dirname(path), 'history')
+
+
+def _history_file(path, version):
+    return os.path.join(history_dir(path), f"calibration_v{version:04d}.json")
+
+
+def _write_atomic(path, data):
+    # Write to a temp file, fsync, then rename over the target:
+    # readers see either the old or the new file, never a partial one.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# --- Cached loader ---
+# Key: path -> (stat signature, Calibration, last check time)
+_cache = {}
+_cache_lock = threading.Lock()
+CHECK_INTERVAL = 1.0   # Re-stat the file at most once per second
+
+
+def load(path=DEFAULT_PATH, force=False):
+    """
+    Current calibration for `path` (config.py defaults if none saved yet).
+
+    Parsed once and cached; the file is re-stat'ed at most every
+    CHECK_INTERVAL seconds and only re-parsed if its mtime/size changed,
+    so calling this from the control loop costs a dict lookup.
+    """
+    now = time.monotonic()
+    entry = _cache.get(path)
+    if entry and not force and now - entry[2] < CHECK_INTERVAL:
+        return entry[1]
+
+    with _cache_lock:
+        try:
+            st = os.stat(path)
+            sig = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            sig = None
+
+        entry = _cache.get(path)
+        if entry and entry[0] == sig and not force:
+            cal = entry[1]
+        elif sig is None:
+            cal = defaults()
+        else:
+            with open(path, 'r') as f:
+                cal = Calibration(json.load(f))
+        _cache[path] = (sig, cal, now)
+        return cal
+
+
+def save(cal, note='', path=DEFAULT_PATH):
+    """Store `cal` as a new version (history copy first, then current). Returns the new version."""
+    with _cache_lock:
+        current = _read_current(path)
+        version = (current.version if current else 0) + 1
+        rec = cal.to_record()
+        rec.update(version=version, parent=current.version if current else 0,
+                   created=datetime.datetime.now().isoformat(timespec='seconds'),
+                   note=note or cal.note)
+        _write_atomic(_history_file(path, version), rec)
+        _write_atomic(path, rec)
+        _cache.pop(path, None)
+    return version
+
+
+def update(note='', path=DEFAULT_PATH, **changes):
+    """Save the current calibration with some fields changed. Returns the new version."""
+    return save(load(path, force=True).replace(**changes), note=note, path=path)
+
+
+def _read_current(path):
+    try:
+        with open(path, 'r') as f:
+            return Calibration(json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def versions(path=DEFAULT_PATH):
+    """[(version, created, note)] for every stored version, oldest first."""
+    d = history_dir(path)
+    if not os.path.isdir(d):
+        return []
+    out = []
+    for name in sorted(os.listdir(d)):
+        if name.startswith('calibration_v') and name.endswith('.json'):
+            with open(os.path.join(d, name), 'r') as f:
+                rec = json.load(f)
+            out.append((rec['version'], rec.get('created'), rec.get('note', '')))
+    return out
+
+
+def get_version(version, path=DEFAULT_PATH):
+    if version == 0:
+        return defaults()
+    with open(_history_file(path, version), 'r') as f:
+        return Calibration(json.load(f))
+
+
+def rollback(version, path=DEFAULT_PATH):
+    """Make an old version current again (saved as a new version, so history stays linear)."""
+    old = get_version(version, path)
+    return save(old, note=f"rollback to v{version}", path=path)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Inspect / roll back the calibration store")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    parser.add_argument("--list", action="store_true", help="List stored versions")
+    parser.add_argument("--rollback", type=int, metavar="VERSION", help="Make VERSION current again")
+    parser.add_argument("--bench", action="store_true", help="Measure load() cost (cold parse and cached)")
+    args = parser.parse_args()
+
+    if args.rollback is not None:
+        v = rollback(args.rollback, args.path)
+        print(f"Rolled back to v{args.rollback} (now stored as v{v})")
+    if args.list:
+        for v, created, note in versions(args.path):
+            print(f"v{v:<4} {created or '-':<20} {note}")
+    if args.bench:
+        n = 10000
+        t0 = time.perf_counter()
+        for _ in range(100):
+            load(args.path, force=True)
+        cold = (time.perf_counter() - t0) / 100
+        t0 = time.perf_counter()
+        for _ in range(n):
+            load(args.path)
+        warm = (time.perf_counter() - t0) / n
+        print(f"load(): cold parse {cold*1e6:.1f}us, cached {warm*1e6:.2f}us")
+
+    cal = load(args.path)
+    print(f"Current calibration: v{cal.version} ({cal.note})")
+
+
+if __name__ == "__main__":
+    main()
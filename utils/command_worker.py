@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import threading
+from collections import deque
+
+
+class CommandWorker(threading.Thread):
+    """
+    One long-lived thread that owns all outgoing serial commands for a GUI.
+
+    Logic:
+    1. submit() drops the newest target into a single slot. If the previous
+       target was not sent yet it is simply overwritten (coalesced), so a
+       slider drag never builds a queue of stale targets.
+    2. The worker sends the slot at most `max_rate_hz` times per second.
+    3. run_call() queues one-off commands (power on/off, release, ...);
+       these run in order, ahead of the next target.
+
+    Metrics: ticks received vs commands sent, coalesced ticks, errors and
+    send time.
+    """
+
+    def __init__(self, send, max_rate_hz=20.0, on_error=None):
+        super().__init__()
+        self.daemon = True
+        self.send = send
+        self.min_interval = 1.0 / max_rate_hz
+        self.on_error = on_error
+
+        self.cond = threading.Condition()
+        self.slot = None
+        self.jobs = deque()
+        self.running = True
+        self.last_send = 0.0
+
+        # Metrics
+        self.ticks = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.calls = 0
+        self.errors = 0
+        self.send_time = 0.0
+        self.send_time_max = 0.0
+
+    def submit(self, *args):
+        """Replace the pending target with the newest one (never blocks)."""
+        with self.cond:
+            self.ticks += 1
+            if self.slot is not None:
+                self.coalesced += 1
+            self.slot = args
+            self.cond.notify()
+
+    def run_call(self, fn, *args):
+        """Queue a one-off command to run on the worker thread."""
+        with self.cond:
+            self.jobs.append((fn, args))
+            self.cond.notify()
+
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while self.running and not self.jobs and self.slot is None:
+                    self.cond.wait()
+                if not self.running:
+                    return
+
+                if self.jobs:
+                    fn, args = self.jobs.popleft()
+                    is_job = True
+                else:
+                    # Rate cap: wait out the interval, picking up newer targets meanwhile
+                    wait = self.last_send + self.min_interval - time.monotonic()
+                    if wait > 0:
+                        self.cond.wait(wait)
+                        continue
+                    fn, args = self.send, self.slot
+                    self.slot = None
+                    is_job = False
+
+            t0 = time.monotonic()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.errors += 1
+                if self.on_error:
+                    self.on_error(e)
+            dt = time.monotonic() - t0
+
+            if is_job:
+                self.calls += 1
+            else:
+                self.last_send = t0
+                self.sent += 1
+                self.send_time += dt
+                self.send_time_max = max(self.send_time_max, dt)
+
+    def stats(self):
+        return {
+            'ticks': self.ticks,
+            'sent': self.sent,
+            'coalesced': self.coalesced,
+            'calls': self.calls,
+            'errors': self.errors,
+            'send_ms_avg': (self.send_time / self.sent * 1000) if self.sent else 0.0,
+            'send_ms_max': self.send_time_max * 1000,
+        }
+
+    def report(self):
+        st = self.stats()
+        print(f"Command worker: ticks={st['ticks']} sent={st['sent']} coalesced={st['coalesced']} "
+              f"calls={st['calls']} errors={st['errors']} "
+              f"send={st['send_ms_avg']:.1f}ms avg / {st['send_ms_max']:.1f}ms max")
@@ -23,3 +23,41 @@ def select_port(prompt):
         except ValueError:
             pass
         print("Invalid selection. Try again.")
+
+def port_identity(port):
+    """
+    USB identity (serial number, or VID:PID) of a port, used to find the
+    same device again after it re-enumerates under a different name.
+    """
+    for p in serial.tools.list_ports.comports():
+        if p.device == port:
+            if p.serial_number:
+                return p.serial_number
+            if p.vid is not None:
+                return f"{p.vid:04x}:{p.pid:04x}"
+    return None
+
+def find_port(identity, fallback=None, exclude=()):
+    """
+    Current device path for a USB identity from port_identity().
+
+    Ports in `exclude` (e.g. the one the other arm holds) are skipped. Two
+    arms without serial numbers share a VID:PID, so the identity must match
+    exactly one remaining port; if it is ambiguous only `fallback` is
+    accepted, and only if it is one of the matches.
+    """
+    if fallback in exclude:
+        fallback = None
+    if not identity:
+        return fallback
+    matches = []
+    for p in serial.tools.list_ports.comports():
+        if p.device in exclude:
+            continue
+        if p.serial_number == identity or (p.vid is not None and f"{p.vid:04x}:{p.pid:04x}" == identity):
+            matches.append(p.device)
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        return fallback if fallback in matches else None
+    return fallback
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import csv
+import time
+import datetime
+import threading
+
+# Adjust path to import config from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import calibration
+
+
+def mapping_slope(i):
+    """d(Output)/d(Input) of the proportional mapping for joint i."""
+    cal = calibration.load()
+    c_min, c_max = cal.c650_limits[i]
+    m_min, m_max = cal.m750_limits[i]
+    slope = (m_max - m_min) / (c_max - c_min) if c_max != c_min else 1.0
+    if cal.m750_gains[i] < 0:
+        slope = -slope
+    return slope
+
+
+class FeedbackTrimThread(threading.Thread):
+    """
+    Slow closed-loop correction on top of the open-loop mapping.
+
+    Logic:
+    1. The command loop calls set_target() with the mapped (untrimmed) target
+       and apply() to get the trimmed + clamped command it actually sends.
+    2. This thread reads follower.get_angles() at a low rate, so the command
+       loop never waits on the feedback read (pymycobot serializes the
+       transactions on the port with its own lock). State shared with the
+       command loop (target, trim, latest feedback) is behind self.lock.
+       Alternatively, don't start() the thread and register poll() as a
+       low-rate scheduler task.
+    3. Only while the target has been steady for `settle_time` (steady state),
+       integrate error = target - actual into a per-joint trim.
+    4. Anti-windup: the trim is clamped to +/- max_trim, and a joint stops
+       integrating once the trimmed command is pinned at M750_LIMITS.
+    """
+
+    def __init__(self, follower, rate_hz=5.0, ki=0.5, max_trim=10.0,
+                 settle_tol=0.5, settle_time=0.6, log_dir=None, n_joints=6):
+        super().__init__()
+        self.daemon = True
+        self.running = True
+        self.follower = follower
+        self.period = 1.0 / rate_hz
+        self.ki = ki
+        self.max_trim = max_trim
+        self.settle_tol = settle_tol
+        self.settle_time = settle_time
+        self.n = n_joints
+
+        self.lock = threading.Lock()
+        self.target = None
+        self.trim = [0.0] * n_joints
+        self.error = [0.0] * n_joints
+        self.steady_since = None
+        self.reads = 0
+        self.failed_reads = 0
+        self.actual = None          # latest valid feedback read
+        self.actual_t = None
+
+        # Trim log (so values can be folded back into calibration)
+        self.log_file = None
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.log_file = os.path.join(log_dir, f"trim_log_{timestamp}.csv")
+            with open(self.log_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["Timestamp"] + [f"Err_J{i}" for i in range(1, n_joints + 1)] +
+                                [f"Trim_J{i}" for i in range(1, n_joints + 1)])
+
+    def stop(self):
+        self.running = False
+
+    def set_target(self, target):
+        target = list(target[:self.n])
+        with self.lock:
+            prev = self.target
+            self.target = target
+            moved = prev is None or max(abs(a - b) for a, b in zip(target, prev)) > self.settle_tol
+            if moved:
+                self.steady_since = None
+            elif self.steady_since is None:
+                self.steady_since = time.monotonic()
+
+    def apply(self, target):
+        """Return target + trim, clamped to M750_LIMITS."""
+        with self.lock:
+            trim = list(self.trim)
+        out = list(target)
+        limits = calibration.load().m750_limits
+        for i in range(min(self.n, len(out))):
+            lo, hi = sorted(limits[i])
+            out[i] = min(max(out[i] + trim[i], lo), hi)
+        return out
+
+    def step(self, actual, now=None):
+        """One integration step from a feedback read (split out for testing)."""
+        if now is None:
+            now = time.monotonic()
+        with self.lock:
+            if self.target is None:
+                return False
+            target = list(self.target)
+            steady = self.steady_since is not None and now - self.steady_since >= self.settle_time
+
+            for i in range(self.n):
+                self.error[i] = target[i] - actual[i]
+            if not steady:
+                return False
+
+            limits = calibration.load().m750_limits
+            for i in range(self.n):
+                err = self.error[i]
+                lo, hi = sorted(limits[i])
+                cmd = target[i] + self.trim[i]
+                # Anti-windup: don't push further into a limit
+                if (cmd >= hi and err > 0) or (cmd <= lo and err < 0):
+                    continue
+                t = self.trim[i] + self.ki * err * self.period
+                self.trim[i] = min(max(t, -self.max_trim), self.max_trim)
+            return True
+
+    def poll(self):
+        """One feedback read + integration step (also usable as a scheduler task)."""
+        try:
+            actual = self.follower.get_angles()
+        except Exception:
+            actual = None
+        self.reads += 1
+
+        if isinstance(actual, list) and len(actual) >= self.n:
+            with self.lock:
+                self.actual, self.actual_t = actual, time.monotonic()
+            if self.step(actual):
+                self._log()
+        else:
+            self.failed_reads += 1
+
+    def latest(self):
+        """(angles, monotonic time) of the latest valid feedback read, or (None, None)."""
+        with self.lock:
+            return self.actual, self.actual_t
+
+    def run(self):
+        next_t = time.monotonic()
+        while self.running:
+            self.poll()
+            next_t += self.period
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_t = time.monotonic()
+
+    def _log(self):
+        if not self.log_file:
+            return
+        try:
+            with self.lock:
+                row = [datetime.datetime.now().strftime("%H:%M:%S.%f")] + \
+                      [f"{x:.2f}" for x in self.error] + [f"{x:.2f}" for x in self.trim]
+            with open(self.log_file, 'a', newline='') as f:
+                csv.writer(f).writerow(row)
+        except Exception:
+            pass # Don't crash on logging error
+
+    def report(self):
+        """Print final trims and the equivalent C650_HOME_ANGLES correction."""
+        print("\n--- Feedback Trim Summary ---")
+        print(f"Feedback reads: {self.reads} ({self.failed_reads} failed)")
+        print(f"{'Joint':<6} | {'Trim (out deg)':<14} | {'Home offset delta (in deg)':<26}")
+        for i in range(self.n):
+            slope = mapping_slope(i)
+            delta = self.trim[i] / slope if slope else 0.0
+            print(f"J{i+1:<5} | {self.trim[i]:<14.2f} | {delta:<26.2f}")
+        if self.log_file:
+            print(f"Trim log: {self.log_file}")
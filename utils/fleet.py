@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import json
+import time
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.transport import classify_read
+
+
+def _number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def audit_arm(arm, expected, write=False, write_delay=0.05, tol=1.0):
+    """
+    Check (and optionally provision) the firmware limits of ONE arm.
+
+    expected: [(min, max), ...] per joint (any order, sorted here).
+    write: set_joint_min/max for every joint first, then read back. Only
+           done if the device answers get_angles() with 6 valid joints
+           (an M750); anything else raises ValueError before any write.
+    Returns a per-arm result dict (see run_fleet()).
+    """
+    if write:
+        angles = arm.get_angles()
+        if classify_read(angles, 6) or len(angles) != 6:
+            raise ValueError(f"not an M750 (get_angles() -> {angles!r}), limits not written")
+    joints = []
+    ok = True
+    for i, lim in enumerate(expected):
+        joint_id = i + 1
+        lo, hi = min(lim), max(lim)
+        if write:
+            arm.set_joint_min(joint_id, lo)
+            time.sleep(write_delay)
+            arm.set_joint_max(joint_id, hi)
+            time.sleep(write_delay)
+        f_min = arm.get_joint_min(joint_id)
+        f_max = arm.get_joint_max(joint_id)
+
+        if not (_number(f_min) and _number(f_max)):
+            status = "NO_REPLY"
+        elif abs(lo - f_min) <= tol and abs(hi - f_max) <= tol:
+            status = "OK"
+        else:
+            status = "MISMATCH"
+        ok = ok and status == "OK"
+        joints.append({'joint': joint_id, 'expected': [lo, hi],
+                       'firmware': [f_min, f_max], 'status': status})
+    return {'ok': ok, 'written': write, 'joints': joints}
+
+
+def _run_one(port, connect, expected, write, write_delay, tol):
+    t0 = time.monotonic()
+    result = {'port': port, 'ok': False, 'error': None, 'joints': [], 'written': write}
+    arm = None
+    try:
+        arm = connect(port)
+        result.update(audit_arm(arm, expected, write=write, write_delay=write_delay, tol=tol))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        try:
+            arm._serial_port.close()
+        except Exception:
+            pass
+    result['elapsed_s'] = time.monotonic() - t0
+    return result
+
+
+def run_fleet(ports, connect, expected, write=False, write_delay=0.05, tol=1.0, max_workers=None):
+    """
+    Audit / provision every arm concurrently, one worker thread per port.
+
+    Each port is its own serial link, so the arms are independent: wall
+    time is bounded by the slowest arm instead of the sum of all of them
+    (the per-write delays still apply, but in parallel).
+
+    Returns the consolidated report:
+      {'created', 'mode', 'wall_s', 'sum_arm_s', 'arms': [per-arm results]}
+    """
+    t0 = time.monotonic()
+    workers = max_workers or max(len(ports), 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fleet") as pool:
+        futures = [pool.submit(_run_one, p, connect, expected, write, write_delay, tol) for p in ports]
+        arms = [f.result() for f in futures]
+    wall = time.monotonic() - t0
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'mode': 'write+verify' if write else 'audit',
+        'expected': [[min(l), max(l)] for l in expected],
+        'wall_s': wall,
+        'sum_arm_s': sum(a['elapsed_s'] for a in arms),
+        'arms': arms,
+    }
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp, path)
+
+
+def print_report(report):
+    print(f"\n--- Fleet Limits Report ({report['mode']}) ---")
+    print(f"{'Port':<22} | {'Result':<9} | {'Time (s)':>8} | Joints (firmware min/max, * = mismatch)")
+    print("-" * 100)
+    for a in report['arms']:
+        if a['error']:
+            print(f"{a['port']:<22} | {'ERROR':<9} | {a['elapsed_s']:>8.2f} | {a['error']}")
+            continue
+        cells = []
+        for j in a['joints']:
+            mark = "" if j['status'] == "OK" else "*"
+            f_min, f_max = j['firmware']
+            cells.append(f"J{j['joint']}{mark} {f_min}/{f_max}")
+        print(f"{a['port']:<22} | {'OK' if a['ok'] else 'MISMATCH':<9} | {a['elapsed_s']:>8.2f} | {'  '.join(cells)}")
+    print("-" * 100)
+    n_ok = sum(1 for a in report['arms'] if a['ok'])
+    slowest = max((a['elapsed_s'] for a in report['arms']), default=0.0)
+    print(f"{n_ok}/{len(report['arms'])} arms OK | wall {report['wall_s']:.2f}s "
+          f"(slowest arm {slowest:.2f}s, sequential would be {report['sum_arm_s']:.2f}s)")
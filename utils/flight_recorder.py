@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import json
+import time
+import signal
+import datetime
+import threading
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FLIGHT_DIR = os.path.join(BASE_DIR, 'data', 'flight')
+
+# Stage latency columns (ms)
+STAGES = ('read', 'map', 'write')
+
+
+class FlightRecorder:
+    """
+    Fixed-size in-memory history of every control-loop frame, dumped to disk
+    when something goes wrong.
+
+    Logic:
+    1. All arrays are preallocated for `seconds * rate_hz` frames:
+         t (monotonic s), raw (leader, 7), out (mapped, 6), target (sent, 6),
+         speed, lat (read / map / write ms), flags
+       record() writes one row in place at the ring index; nothing is
+       allocated or appended per frame.
+    2. dump(reason) copies the ring out oldest-first and writes
+       data/flight/flight_<time>_<reason>.npz plus a .json with the reason and
+       frame count. Callers: the loop's exception / Ctrl+C paths, the
+       watchdog's on_trip and a link going down (via dump_async, so the
+       reaction isn't delayed) and a signal handler (install_signal,
+       SIGUSR1 by default).
+    3. The time spent inside record() is accumulated so the overhead on the
+       loop can be reported.
+
+    A dump from another thread may catch one half-written row; that frame
+    is the newest one and is flagged by its NaN fields.
+    """
+
+    FLAG_TRIPPED = 1
+    FLAG_NO_TARGET = 2
+    FLAG_READ_FAILED = 4     # leader read failed / invalid: raw and out are NaN
+
+    def __init__(self, seconds=10.0, rate_hz=50.0, directory=FLIGHT_DIR):
+        self.capacity = max(int(seconds * rate_hz), 1)
+        self.directory = directory
+        n = self.capacity
+        self.t = np.full(n, np.nan)
+        self.raw = np.full((n, 7), np.nan)
+        self.out = np.full((n, 6), np.nan)
+        self.target = np.full((n, 6), np.nan)
+        self.speed = np.zeros(n, dtype=np.int16)
+        self.lat = np.full((n, len(STAGES)), np.nan)
+        self.flags = np.zeros(n, dtype=np.uint8)
+        self.index = 0
+        self.frames = 0
+        self.lock = threading.Lock()     # serializes dumps, never taken by record()
+
+        # Stats
+        self.cost = 0.0
+        self.cost_max = 0.0
+        self.dumps = []
+
+    def record(self, t, raw, out, target, speed, lat_read, lat_map, lat_write, flags=0):
+        c0 = time.perf_counter()
+        i = self.index
+        self.t[i] = t
+        self.raw[i] = raw[:7]
+        self.out[i] = out
+        if target is None:
+            self.target[i] = np.nan
+            flags |= self.FLAG_NO_TARGET
+        else:
+            self.target[i] = target
+        self.speed[i] = speed
+        lat = self.lat[i]
+        lat[0] = lat_read
+        lat[1] = lat_map
+        lat[2] = lat_write
+        self.flags[i] = flags
+        self.index = i + 1 if i + 1 < self.capacity else 0
+        self.frames += 1
+        dt = time.perf_counter() - c0
+        self.cost += dt
+        if dt > self.cost_max:
+            self.cost_max = dt
+
+    def snapshot(self):
+        """Copy of the buffered frames, oldest first."""
+        n = min(self.frames, self.capacity)
+        start = self.index - n
+        order = np.arange(start, start + n) % self.capacity
+        return {'t': self.t[order], 'raw': self.raw[order], 'out': self.out[order],
+                'target': self.target[order], 'speed': self.speed[order],
+                'lat': self.lat[order], 'flags': self.flags[order]}
+
+    def dump(self, reason):
+        """Write the buffer to disk. Returns the .npz path (None if nothing recorded)."""
+        with self.lock:
+            if not self.frames:
+                return None
+            t0 = time.perf_counter()
+            data = self.snapshot()
+            os.makedirs(self.directory, exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+            tag = "".join(c if c.isalnum() else "_" for c in reason)[:32]
+            path = os.path.join(self.directory, f"flight_{stamp}_{tag}.npz")
+            np.savez(path, **data)
+            meta = {'reason': reason, 'created': datetime.datetime.now().isoformat(),
+                    'frames': int(len(data['t'])), 'frames_total': self.frames,
+                    'span_s': float(data['t'][-1] - data['t'][0]) if len(data['t']) > 1 else 0.0,
+                    'stages': list(STAGES)}
+            with open(os.path.splitext(path)[0] + ".json", 'w') as f:
+                json.dump(meta, f, indent=2)
+            self.dumps.append((reason, path, time.perf_counter() - t0))
+            return path
+
+    def dump_async(self, reason):
+        """Dump from a helper thread (for watchdog / signal handlers that must return quickly)."""
+        th = threading.Thread(target=self.dump, args=(reason,), daemon=True)
+        th.start()
+        return th
+
+    def install_signal(self, signum=None):
+        """Dump on an explicit signal (default SIGUSR1, e.g. `kill -USR1 <pid>`). Returns the signal or None."""
+        signum = signum if signum is not None else getattr(signal, 'SIGUSR1', None)
+        if signum is None:
+            return None   # Not available on Windows
+        signal.signal(signum, lambda s, f: self.dump_async(f"signal {signal.Signals(s).name}"))
+        return signum
+
+    def stats(self):
+        avg = (self.cost / self.frames * 1e6) if self.frames else 0.0
+        return {'frames': self.frames, 'capacity': self.capacity, 'record_us_avg': avg,
+                'record_us_max': self.cost_max * 1e6,
+                'memory_kb': sum(a.nbytes for a in (self.t, self.raw, self.out, self.target,
+                                                    self.speed, self.lat, self.flags)) / 1024}
+
+    def report(self, loop_period=None):
+        st = self.stats()
+        share = f" ({st['record_us_avg'] / (loop_period * 1e6) * 100:.3f}% of loop period)" if loop_period else ""
+        print(f"Flight recorder: {st['frames']} frames, {st['capacity']}-frame ring ({st['memory_kb']:.0f} KB) | "
+              f"record {st['record_us_avg']:.1f}us avg / {st['record_us_max']:.1f}us max{share}")
+        for reason, path, dt in self.dumps:
+            print(f"  dump [{reason}] -> {path} ({dt*1000:.1f} ms)")
+
+
+def load_dump(path):
+    """Read a flight dump back: ({name: array}, meta)."""
+    with np.load(path) as z:
+        data = {k: z[k] for k in z.files}
+    meta_path = os.path.splitext(path)[0] + ".json"
+    meta = {}
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+    return data, meta
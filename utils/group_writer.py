@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import csv
+import time
+import threading
+
+
+class GroupWriter(threading.Thread):
+    """
+    CSV writer with group commit: rows are buffered and written in batches
+    from a background thread.
+
+    Logic:
+    1. writerow() only appends to an in-memory list (no syscall), so the
+       sampling loop never waits on the disk.
+    2. The writer thread wakes every `window_ms`, or as soon as `max_rows`
+       rows are waiting, swaps the buffer out and writes + flushes it in
+       one go.
+    3. os.fsync() runs at most every `fsync_s` seconds (0 = after every
+       group, None = never; leave it to the OS).
+
+    If a write fails (disk full / removed) the thread stops and every later
+    writerow() raises that error, so the caller stops instead of buffering
+    rows that will never be written.
+
+    Durability: if the process dies, at most the rows of the current window
+    are lost (everything older was flushed to the OS). On power loss, at
+    most the rows since the last fsync are lost.
+    """
+
+    def __init__(self, path, header=None, window_ms=200, max_rows=500, fsync_s=1.0):
+        super().__init__(name="group-writer")
+        self.daemon = True
+        self.path = path
+        self.window = window_ms / 1000.0
+        self.max_rows = max_rows
+        self.fsync_s = fsync_s
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        if header:
+            self.writer.writerow(header)
+            self.file.flush()
+
+        self.buffer = []
+        self.cond = threading.Condition()
+        self.stop_event = threading.Event()
+        self.last_fsync = time.monotonic()
+
+        # Stats
+        self.rows = 0
+        self.groups = 0
+        self.fsyncs = 0
+        self.group_max = 0
+        self.write_time = 0.0
+        self.write_time_max = 0.0
+        self.error = None
+
+    def writerow(self, row):
+        if self.error is not None:
+            raise self.error
+        with self.cond:
+            self.buffer.append(row)
+            if len(self.buffer) >= self.max_rows:
+                self.cond.notify()
+
+    def commit(self, force_sync=False):
+        """Write out everything buffered so far (called by the writer thread and close())."""
+        with self.cond:
+            rows, self.buffer = self.buffer, []
+        if not rows and not force_sync:
+            return 0
+        t0 = time.monotonic()
+        if rows:
+            self.writer.writerows(rows)
+            self.file.flush()
+        if self.fsync_s is not None and (force_sync or t0 - self.last_fsync >= self.fsync_s):
+            os.fsync(self.file.fileno())
+            self.last_fsync = t0
+            self.fsyncs += 1
+        dt = time.monotonic() - t0
+
+        if rows:
+            self.rows += len(rows)
+            self.groups += 1
+            self.group_max = max(self.group_max, len(rows))
+            self.write_time += dt
+            self.write_time_max = max(self.write_time_max, dt)
+        return len(rows)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            with self.cond:
+                if len(self.buffer) < self.max_rows:
+                    self.cond.wait(self.window)
+            try:
+                self.commit()
+            except OSError as e:
+                # Disk full / removed: keep the error for close(), stop writing
+                self.error = e
+                return
+
+    def close(self):
+        self.stop_event.set()
+        with self.cond:
+            self.cond.notify()
+        if self.is_alive():
+            self.join(timeout=5.0)
+        try:
+            if self.error is None:
+                self.commit(force_sync=True)
+        finally:
+            self.file.close()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def stats(self):
+        avg = (self.write_time / self.groups * 1000) if self.groups else 0.0
+        return {'rows': self.rows, 'groups': self.groups, 'fsyncs': self.fsyncs,
+                'rows_per_group_max': self.group_max,
+                'write_ms_avg': avg, 'write_ms_max': self.write_time_max * 1000}
+
+    def report(self):
+        st = self.stats()
+        rows_avg = st['rows'] / st['groups'] if st['groups'] else 0.0
+        print(f"Writer: {st['rows']} rows in {st['groups']} groups ({rows_avg:.1f} avg, {st['rows_per_group_max']} max) | "
+              f"{st['fsyncs']} fsyncs | write {st['write_ms_avg']:.2f} ms avg / {st['write_ms_max']:.2f} ms max")
@@ -0,0 +1,533 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import csv
+import json
+import lzma
+import time
+import zlib
+import struct
+import argparse
+import datetime
+
+import numpy as np
+
+MAGIC = b"TLA2"
+FOOTER_MAGIC = b"TLAX"
+EXT = ".tla"
+
+CODECS = {
+    'zlib': (lambda b, level: zlib.compress(b, level), zlib.decompress),
+    'lzma': (lambda b, level: lzma.compress(b, preset=level), lzma.decompress),
+}
+
+# Per-chunk column encodings: narrowest integer type that holds every delta
+DTYPES = [np.int8, np.int16, np.int32, np.int64]
+RAW = 255          # column stored as absolute int64 (chunk has missing values)
+MISSING = np.iinfo(np.int64).min
+DAY_S = 86400
+
+
+def _decimals(values, cap=6):
+    d = 0
+    for s in values:
+        s = str(s)
+        if 'e' in s or 'E' in s:
+            return cap
+        if '.' in s:
+            d = max(d, len(s) - s.index('.') - 1)
+    return min(d, cap)
+
+
+def _clock_to_us(s):
+    t = datetime.datetime.strptime(s, "%H:%M:%S.%f")
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _unwrap_days(firsts):
+    """Chunk start times of a clock log (seconds of day) made monotonic: a step back is midnight."""
+    out, offset, prev = [], 0.0, None
+    for f in firsts:
+        if f is not None:
+            if prev is not None and f + offset < prev:
+                offset += DAY_S
+            f += offset
+            prev = f
+        out.append(f)
+    return out
+
+
+class ArchiveWriter:
+    """
+    Streaming encoder for teleop / motion CSV logs.
+
+    Logic:
+    1. Every column is quantized to an integer at its own precision, taken
+       per chunk from the text being written (e.g. angles "12.34" -> 1234
+       centidegrees), so a column that only gains decimals later in the log
+       is never rounded to its early precision. Wall-clock
+       "HH:MM:SS.ffffff" timestamps are stored as microseconds of the day.
+    2. Rows are buffered into chunks of `chunk_rows`. Inside a chunk each
+       column is delta-encoded (first value absolute) and stored in the
+       narrowest integer type that fits every delta, so slow joints become
+       int8 / int16 runs. The chunk is then compressed (zlib or lzma).
+    3. Chunks are appended as they fill (a crash loses only the open chunk).
+       close() appends a footer with each chunk's offset, row count and
+       first timestamp, for seeking without decoding earlier chunks. For
+       clock logs the footer times keep counting past midnight (+86400 s
+       per rollover), so they stay sorted.
+
+    Values are reproduced to the precision they were written with, up to 6
+    decimals; anything finer (or finer than an explicit `decimals`) is
+    rounded. Text is reformatted per chunk: "0" next to "12.34" comes back
+    as "0.00", and "-0.00" as "0.00".
+    """
+
+    def __init__(self, path, columns, decimals=None, chunk_rows=4096, codec='zlib', level=None):
+        if codec not in CODECS:
+            raise ValueError(f"unknown codec {codec}")
+        self.path = path
+        self.columns = list(columns)
+        self.decimals = list(decimals) if decimals is not None else None   # None: detect per chunk
+        self.chunk_rows = chunk_rows
+        self.codec = codec
+        self.level = level if level is not None else 6
+        self.clock = False
+        self.buffer = []
+        self.index = []
+        self.file = open(path, 'wb')
+        self.header_written = False
+
+        # Stats
+        self.rows = 0
+        self.raw_bytes = 0
+
+    def write_row(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.chunk_rows:
+            self.flush_chunk()
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write_row(row)
+
+    def _write_header(self, cols):
+        self.clock = ':' in str(cols[0][0])
+        header = json.dumps({'columns': self.columns, 'decimals': self.decimals, 'clock': self.clock,
+                             'codec': self.codec, 'chunk_rows': self.chunk_rows}).encode()
+        self.file.write(MAGIC + struct.pack('<I', len(header)) + header)
+        self.header_written = True
+
+    def _chunk_decimals(self, j, values):
+        if j == 0 and self.clock:
+            return 6
+        if self.decimals is not None:
+            return self.decimals[j]
+        return _decimals(values)
+
+    def _quantize(self, j, values, decimals):
+        if j == 0 and self.clock:
+            return np.array([_clock_to_us(v) if v else MISSING for v in values], dtype=np.int64)
+        scale = 10 ** decimals
+        try:
+            return np.rint(np.asarray(values, dtype=np.float64) * scale).astype(np.int64)
+        except ValueError:
+            out = np.empty(len(values), dtype=np.int64)
+            for i, v in enumerate(values):
+                if v is None or v == '':
+                    out[i] = MISSING
+                    continue
+                try:
+                    out[i] = round(float(v) * scale)
+                except ValueError:
+                    raise ValueError(f"column {self.columns[j]}: {v!r} is not numeric") from None
+            return out
+
+    def flush_chunk(self):
+        rows = self.buffer
+        if not rows:
+            return
+        self.buffer = []
+        n = len(rows)
+        width = len(self.columns)
+        cols = list(zip(*[list(r[:width]) + [''] * (width - len(r)) for r in rows]))
+        if not self.header_written:
+            self._write_header(cols)
+
+        meta = bytearray(struct.pack('<I', n))
+        blocks = []
+        t_first = None
+        for j, values in enumerate(cols):
+            dec = self._chunk_decimals(j, values)
+            q = self._quantize(j, values, dec)
+            if j == 0:
+                t_first = int(q[0]) / 10 ** dec if q[0] != MISSING else None
+            if (q == MISSING).any():
+                meta += struct.pack('<BBq', RAW, dec, 0)
+                blocks.append(q.tobytes())
+                continue
+            d = np.diff(q)
+            lo, hi = (int(d.min()), int(d.max())) if len(d) else (0, 0)
+            code = next(k for k, dt in enumerate(DTYPES)
+                        if np.iinfo(dt).min <= lo and hi <= np.iinfo(dt).max)
+            meta += struct.pack('<BBq', code, dec, int(q[0]))
+            blocks.append(d.astype(DTYPES[code]).tobytes())
+        payload = bytes(meta) + b"".join(blocks)
+        packed = CODECS[self.codec][0](payload, self.level)
+
+        offset = self.file.tell()
+        self.file.write(struct.pack('<I', len(packed)) + packed)
+        self.file.flush()
+        self.index.append([offset, n, t_first])
+        self.rows += n
+        self.raw_bytes += len(payload)
+
+    def close(self):
+        self.flush_chunk()
+        if not self.header_written:
+            self._write_header([['']] * len(self.columns))
+        if self.clock:
+            for entry, t in zip(self.index, _unwrap_days([c[2] for c in self.index])):
+                entry[2] = t
+        footer = json.dumps({'chunks': self.index, 'rows': self.rows}).encode()
+        pos = self.file.tell()
+        self.file.write(footer + struct.pack('<Q', pos) + FOOTER_MAGIC)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ArchiveReader:
+    """
+    Decoder with chunk-level random access.
+
+    read_chunk(k) decodes one chunk into {column: float array}; iter_chunks()
+    streams them in order; seek_time(t) finds the chunk holding time t from
+    the footer. rows() yields csv.DictReader-style rows (strings formatted to
+    the original precision) so the existing CSV loaders can consume archives
+    unchanged. A file without a footer (writer crashed) is read sequentially.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        if self.file.read(4) != MAGIC:
+            raise ValueError(f"{path} is not a log archive")
+        (hlen,) = struct.unpack('<I', self.file.read(4))
+        header = json.loads(self.file.read(hlen))
+        self.columns = header['columns']
+        self.decimals = header['decimals']      # None: per chunk
+        self.clock = header['clock']
+        self.codec = header['codec']
+        self.data_start = self.file.tell()
+        self.chunks = self._read_footer()
+
+    def _read_footer(self):
+        self.file.seek(0, os.SEEK_END)
+        size = self.file.tell()
+        if size >= self.data_start + 12:
+            self.file.seek(size - 12)
+            tail = self.file.read(12)
+            if tail[8:] == FOOTER_MAGIC:
+                (pos,) = struct.unpack('<Q', tail[:8])
+                self.file.seek(pos)
+                return json.loads(self.file.read(size - 12 - pos))['chunks']
+        # No footer: walk the chunk lengths
+        chunks = []
+        self.file.seek(self.data_start)
+        while True:
+            offset = self.file.tell()
+            head = self.file.read(4)
+            if len(head) < 4:
+                break
+            (clen,) = struct.unpack('<I', head)
+            body = self.file.read(clen)
+            if len(body) < clen:
+                break   # torn last chunk
+            chunks.append([offset, None, None])
+        return chunks
+
+    @property
+    def rows_total(self):
+        return sum(c[1] for c in self.chunks if c[1] is not None)
+
+    def _decode(self, k):
+        """Chunk k -> ({column: int64 quantized array}, [decimals per column])."""
+        self.file.seek(self.chunks[k][0])
+        (clen,) = struct.unpack('<I', self.file.read(4))
+        payload = CODECS[self.codec][1](self.file.read(clen))
+        (n,) = struct.unpack_from('<I', payload, 0)
+        pos = 4 + 10 * len(self.columns)
+        out, decimals = {}, []
+        for j, name in enumerate(self.columns):
+            code, dec, first = struct.unpack_from('<BBq', payload, 4 + 10 * j)
+            if code == RAW:
+                q = np.frombuffer(payload, dtype=np.int64, count=n, offset=pos).copy()
+                pos += 8 * n
+            else:
+                dt = DTYPES[code]
+                d = np.frombuffer(payload, dtype=dt, count=n - 1, offset=pos)
+                pos += np.dtype(dt).itemsize * (n - 1)
+                q = np.empty(n, dtype=np.int64)
+                q[0] = first
+                np.cumsum(d, out=q[1:], dtype=np.int64)
+                q[1:] += first
+            out[name] = q
+            decimals.append(dec)
+        return out, decimals
+
+    @staticmethod
+    def _scale(q, dec):
+        v = q / (10 ** dec)
+        v[q == MISSING] = np.nan
+        return v
+
+    def read_chunk(self, k):
+        """Decode chunk k -> {column: float64 array} (NaN = missing)."""
+        q, decimals = self._decode(k)
+        return {c: self._scale(q[c], d) for c, d in zip(self.columns, decimals)}
+
+    def iter_chunks(self, start=0):
+        for k in range(start, len(self.chunks)):
+            yield self.read_chunk(k)
+
+    def seek_time(self, t):
+        """
+        Index of the chunk containing time t (seconds, or seconds of day for
+        clock logs; after midnight add 86400 per day since the log started).
+        """
+        firsts = [c[2] for c in self.chunks]
+        if any(f is None for f in firsts):
+            firsts = [self.read_chunk(k)[self.columns[0]][0] for k in range(len(self.chunks))]
+        if self.clock:
+            firsts = _unwrap_days(firsts)
+        k = int(np.searchsorted(np.asarray(firsts, dtype=np.float64), t, side='right')) - 1
+        return max(k, 0)
+
+    def to_arrays(self):
+        """Whole log as {column: float array}."""
+        parts = list(self.iter_chunks())
+        return {c: np.concatenate([p[c] for p in parts]) if parts else np.empty(0) for c in self.columns}
+
+    def _format_column(self, j, values, decimals):
+        if j == 0 and self.clock:
+            us = np.rint(np.nan_to_num(values) * 1e6).astype(np.int64)
+            s, us = np.divmod(us, 1_000_000)
+            m, s = np.divmod(s, 60)
+            h, m = np.divmod(m, 60)
+            strs = ["%02d:%02d:%02d.%06d" % hmsu for hmsu in zip(h.tolist(), m.tolist(), s.tolist(), us.tolist())]
+        else:
+            fmt = f"%.{decimals}f"
+            strs = [fmt % v for v in values.tolist()]
+        for i in np.flatnonzero(np.isnan(values)):
+            strs[i] = ''   # missing
+        return strs
+
+    def iter_lists(self):
+        """Rows as lists of strings (like csv.reader, without the header)."""
+        for k in range(len(self.chunks)):
+            q, decimals = self._decode(k)
+            cols = [self._format_column(j, self._scale(q[c], decimals[j]), decimals[j])
+                    for j, c in enumerate(self.columns)]
+            for row in zip(*cols):
+                yield list(row)
+
+    def rows(self):
+        """Rows as {column: string} dicts (like csv.DictReader)."""
+        for row in self.iter_lists():
+            yield dict(zip(self.columns, row))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def is_archive(path):
+    return path.endswith(EXT)
+
+
+class _TableReader:
+    """Iterate a CSV file or an archive the same way: header first, then string rows."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        if is_archive(self.path):
+            self.reader = ArchiveReader(self.path)
+            self.it = _chain([self.reader.columns], self.reader.iter_lists())
+        else:
+            self.reader = open(self.path, 'r', newline='')
+            self.it = csv.reader(self.reader)
+        return self.it
+
+    def __exit__(self, *exc):
+        self.reader.close()
+        return False
+
+
+def _chain(a, b):
+    yield from a
+    yield from b
+
+
+def open_table(path):
+    """
+    Drop-in for `csv.reader(open(path))` that also reads .tla archives:
+        with open_table(path) as reader:
+            header = next(reader)
+            for row in reader: ...
+    """
+    return _TableReader(path)
+
+
+def open_dict_rows(path):
+    """Drop-in for csv.DictReader over a CSV or a .tla archive: (fieldnames, row iterator)."""
+    if is_archive(path):
+        reader = ArchiveReader(path)
+        return reader.columns, _closing(reader.rows(), reader)
+    f = open(path, 'r', newline='')
+    dr = csv.DictReader(f)
+    return dr.fieldnames or [], _closing(dr, f)
+
+
+def _closing(it, handle):
+    try:
+        yield from it
+    finally:
+        handle.close()
+
+
+def encode_csv(src, dst=None, codec='zlib', chunk_rows=4096, level=None):
+    """CSV log -> archive. Returns the archive path."""
+    dst = dst or os.path.splitext(src)[0] + EXT
+    with open(src, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        with ArchiveWriter(dst, header, chunk_rows=chunk_rows, codec=codec, level=level) as w:
+            for row in reader:
+                if row:
+                    w.write_row(row)
+    return dst
+
+
+def decode_csv(src, dst=None):
+    """Archive -> CSV (same columns, same precision). Returns the CSV path."""
+    dst = dst or os.path.splitext(src)[0] + ".csv"
+    with ArchiveReader(src) as r, open(dst, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(r.columns)
+        w.writerows(r.iter_lists())
+    return dst
+
+
+def verify_csv(src, dst):
+    """True if archive `dst` decodes to the same values as CSV `src`, column by column."""
+    with ArchiveReader(dst) as r:
+        columns, clock = r.columns, r.clock
+        arrays = r.to_arrays()
+    with open(src, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
+    if header != columns:
+        return False
+
+    def value(row, j):
+        v = row[j] if j < len(row) else ''
+        if v == '':
+            return np.nan
+        return _clock_to_us(v) / 1e6 if j == 0 and clock else float(v)
+
+    for j, c in enumerate(columns):
+        expected = np.array([value(row, j) for row in rows], dtype=np.float64)
+        if len(arrays[c]) != len(expected) or \
+                not np.allclose(arrays[c], expected, rtol=1e-12, atol=0, equal_nan=True):
+            return False
+    return True
+
+
+def _parse_csv_floats(path):
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        out = []
+        for row in reader:
+            vals = []
+            for v in row:
+                try:
+                    vals.append(float(v))
+                except ValueError:
+                    vals.append(float('nan'))   # clock timestamps etc.
+            out.append(vals)
+    return out
+
+
+def benchmark(files, codecs=('zlib', 'lzma')):
+    print(f"{'File':<32} | {'Format':<10} | {'Size KB':>9} | {'Ratio':>6} | {'Encode MB/s':>11} | {'Decode rows/s':>13}")
+    for path in files:
+        csv_size = os.path.getsize(path)
+        t0 = time.perf_counter()
+        rows = len(_parse_csv_floats(path))
+        t_csv = time.perf_counter() - t0
+        name = os.path.basename(path)[:32]
+        print(f"{name:<32} | {'csv':<10} | {csv_size/1024:>9.1f} | {1.0:>6.1f} | {'-':>11} | {rows/t_csv:>13,.0f}")
+        for codec in codecs:
+            dst = os.path.splitext(path)[0] + f".{codec}{EXT}"
+            t0 = time.perf_counter()
+            encode_csv(path, dst, codec=codec)
+            t_enc = time.perf_counter() - t0
+            size = os.path.getsize(dst)
+            with ArchiveReader(dst) as r:
+                t0 = time.perf_counter()
+                n = sum(len(c[r.columns[0]]) for c in r.iter_chunks())
+                t_dec = time.perf_counter() - t0
+            assert n == rows
+            print(f"{'':<32} | {codec + ' tla':<10} | {size/1024:>9.1f} | {csv_size/size:>6.1f} | "
+                  f"{csv_size/1e6/t_enc:>11.1f} | {rows/t_dec:>13,.0f}")
+            os.remove(dst)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive CSV logs as quantized delta-encoded chunks (.tla)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("encode", help="CSV -> .tla")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--codec", choices=sorted(CODECS), default="zlib")
+    p.add_argument("--chunk-rows", type=int, default=4096)
+    p.add_argument("--delete", action="store_true", help="Remove the CSV after a verified round trip")
+    p = sub.add_parser("decode", help=".tla -> CSV")
+    p.add_argument("files", nargs="+")
+    p = sub.add_parser("bench", help="Compare size / encode / decode with CSV")
+    p.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    if args.cmd == "encode":
+        for src in args.files:
+            dst = encode_csv(src, codec=args.codec, chunk_rows=args.chunk_rows)
+            print(f"{src} -> {dst} ({os.path.getsize(src)/1024:.1f} KB -> {os.path.getsize(dst)/1024:.1f} KB)")
+            if args.delete:
+                if verify_csv(src, dst):
+                    os.remove(src)
+                else:
+                    print(f"  Decoded values differ from the CSV, keeping {src}")
+    elif args.cmd == "decode":
+        for src in args.files:
+            print(f"{src} -> {decode_csv(src)}")
+    else:
+        benchmark(args.files)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,13 @@ import os
 
 # Adjust path to import config from parent directory
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import config
+from utils import calibration
 
 def map_value(x, in_min, in_max, out_min, out_max):
     # Standard linear mapping
     return (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
 
-def process_arm_angles(angles: list) -> list:
+def process_arm_angles(angles: list, cal=None) -> list:
     """
     Process first 6 joints using Proportional Mapping.
     
@@ -22,10 +22,16 @@ def process_arm_angles(angles: list) -> list:
     Joints 2 and 3 (Indices 1 and 2) are physically inverted between C and M series.
     We handle this by mapping:
     C650 (Min -> Max)  ===>  M750 (Max -> Min)
+
+    Limits / gains / offsets come from `cal`, or the calibration store
+    (cached) if not given. Pass the record explicitly to know which
+    version produced the output.
     """
     if len(angles) < 6:
         return angles, []
 
+    cal = cal or calibration.load()
+
     raw_angles = list(angles[:6])
     final_positions = []
     normalized_values = []
@@ -33,14 +39,14 @@ def process_arm_angles(angles: list) -> list:
     for i in range(6):
         # 1. Get Input Limits & Calculate Normalization
         try:
-            c_min, c_max = config.C650_LIMITS[i]
+            c_min, c_max = cal.c650_limits[i]
         except IndexError:
             c_min, c_max = -180, 180
             
         # Apply Input Offset (Calibration)
         input_offset = 0.0
         try:
-             input_offset = config.C650_HOME_ANGLES[i]
+             input_offset = cal.c650_home_angles[i]
         except IndexError:
              pass
         val = raw_angles[i] + input_offset
@@ -56,7 +62,7 @@ def process_arm_angles(angles: list) -> list:
 
         # 2. Get Output Limits (Target)
         try:
-            m_min, m_max = config.M750_LIMITS[i]
+            m_min, m_max = cal.m750_limits[i]
         except IndexError:
             m_min, m_max = -180, 180
 
@@ -64,7 +70,7 @@ def process_arm_angles(angles: list) -> list:
         # Check M750_GAINS for direction (-1.0 means invert output range)
         inverted = False
         try:
-            if config.M750_GAINS[i] < 0:
+            if cal.m750_gains[i] < 0:
                 inverted = True
         except:
             # Fallback for old config
@@ -92,15 +98,15 @@ def process_arm_angles(angles: list) -> list:
 
     return final_positions, normalized_values
 
-def process_gripper(angle):
+def process_gripper(angle, cal=None):
     """
     Map Leader gripper angle to 0-100 value.
-    Uses proportional mapping from config.
+    Uses proportional mapping from `cal` (default: the calibration store).
     """
     # Use limits from C650 limits if available (Index 6), or specific constants if preferred.
-    # User's config.py has LEADER_GRIPPER_CLOSED/OPEN constants.
-    
-    val = map_value(angle, config.LEADER_GRIPPER_CLOSED, config.LEADER_GRIPPER_OPEN, 0, 100)
+    # The calibration store has LEADER_GRIPPER_CLOSED/OPEN constants.
+    cal = cal or calibration.load()
+    val = map_value(angle, cal.leader_gripper_closed, cal.leader_gripper_open, 0, 100)
     
     # Constrain
     if val < 0: val = 0
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import csv
+import json
+from collections import deque
+
+from utils.group_writer import GroupWriter
+
+
+class MotionTrigger:
+    """
+    Motion / idle detector on a joint stream.
+
+    Logic:
+    1. Joint speed is measured against a reference sample at least `window`
+       seconds old (max |delta| over joints / dt), so encoder noise between
+       back-to-back reads doesn't look like motion.
+    2. Speed above `threshold` (deg/s) -> 'start'.
+    3. While active, `quiet_s` seconds without any speed above threshold ->
+       'stop'.
+    """
+
+    def __init__(self, threshold=5.0, quiet_s=1.5, window=0.1):
+        self.threshold = threshold
+        self.quiet_s = quiet_s
+        self.window = window
+        self.active = False
+        self.speed = 0.0
+        self.ref = None          # (t, angles)
+        self.last_motion = None
+
+    def update(self, t, angles):
+        """Feed one sample. Returns 'start', 'stop' or None."""
+        if self.ref is None:
+            self.ref = (t, angles)
+            return None
+        dt = t - self.ref[0]
+        if dt >= self.window:
+            self.speed = max(abs(a - b) for a, b in zip(angles, self.ref[1])) / dt
+            self.ref = (t, angles)
+            if self.speed >= self.threshold:
+                self.last_motion = t
+                if not self.active:
+                    self.active = True
+                    return 'start'
+        if self.active and t - self.last_motion >= self.quiet_s:
+            self.active = False
+            return 'stop'
+        return None
+
+
+class SegmentRecorder:
+    """
+    Drop-in CSV writer that only persists motion, split into segments.
+
+    Logic:
+    1. Rows ("Timestamp, J1..J6, ...") are held in a pre-roll ring buffer
+       covering the last `pre_roll_s` seconds; nothing is written while idle.
+    2. When MotionTrigger fires, a new segment file <base>_seg<NNN>.csv is
+       opened, the pre-roll is written first (so the start of the motion is
+       never cut), then every row until the trigger reports `quiet_s` of
+       stillness.
+    3. close() writes <base>_segments.json: one entry per segment (file,
+       start / end time, rows) plus samples seen vs kept, so later analysis
+       can jump straight to the motion.
+
+    Timestamps are kept as recorded, so segments stay on the session clock.
+    """
+
+    def __init__(self, base_path, header, threshold=5.0, pre_roll_s=1.0, quiet_s=1.5, window=0.1,
+                 writer_factory=None):
+        self.base = os.path.splitext(base_path)[0]
+        self.header = header
+        self.pre_roll_s = pre_roll_s
+        self.trigger = MotionTrigger(threshold, quiet_s, window)
+        self.writer_factory = writer_factory or self._group_writer
+        self.pre_roll = deque()
+        self.writer = None
+        self.segments = []
+
+        # Stats
+        self.seen = 0
+        self.kept = 0
+
+    def _group_writer(self, path):
+        w = GroupWriter(path, header=self.header)
+        w.start()
+        return w
+
+    def writerow(self, row):
+        """Same interface as csv.writer: row[0] is the timestamp, row[1:7] the joints."""
+        self.push(float(row[0]), [float(a) for a in row[1:7]], row)
+
+    def push(self, t, angles, row):
+        self.seen += 1
+        event = self.trigger.update(t, angles)
+        if event == 'start':
+            self._open(t)
+        if self.writer is not None:
+            self.writer.writerow(row)
+            self.kept += 1
+            seg = self.segments[-1]
+            seg['t_end'], seg['rows'] = t, seg['rows'] + 1
+            if event == 'stop':
+                self._close_segment()
+        else:
+            self.pre_roll.append((t, row))
+            while self.pre_roll and t - self.pre_roll[0][0] > self.pre_roll_s:
+                self.pre_roll.popleft()
+
+    def _open(self, t):
+        path = f"{self.base}_seg{len(self.segments):03d}.csv"
+        self.writer = self.writer_factory(path)
+        start = self.pre_roll[0][0] if self.pre_roll else t
+        self.segments.append({'index': len(self.segments), 'file': os.path.basename(path),
+                              't_start': start, 't_trigger': t, 't_end': t, 'rows': 0})
+        for _, row in self.pre_roll:
+            self.writer.writerow(row)
+        self.segments[-1]['rows'] = len(self.pre_roll)
+        self.kept += len(self.pre_roll)
+        self.pre_roll.clear()
+
+    def _close_segment(self):
+        self.writer.close()
+        self.writer = None
+
+    @property
+    def recording(self):
+        return self.writer is not None
+
+    def close(self):
+        if self.writer is not None:
+            self._close_segment()
+        index = {'segments': self.segments, 'samples_seen': self.seen, 'samples_kept': self.kept,
+                 'threshold_dps': self.trigger.threshold, 'pre_roll_s': self.pre_roll_s,
+                 'quiet_s': self.trigger.quiet_s}
+        with open(f"{self.base}_segments.json", 'w') as f:
+            json.dump(index, f, indent=2)
+        return index
+
+    def report(self):
+        pct = (100.0 * self.kept / self.seen) if self.seen else 0.0
+        print(f"Motion segments: {len(self.segments)} | kept {self.kept}/{self.seen} samples ({pct:.1f}%)")
+        for s in self.segments:
+            print(f"  #{s['index']:03d} {s['t_start']:8.2f}s - {s['t_end']:8.2f}s  {s['rows']} rows  {s['file']}")
+
+
+def segment_file(path, out_dir, **kwargs):
+    """Run an existing recording (Timestamp, J1..J6, ...) through a SegmentRecorder."""
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, os.path.basename(path))
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rec = SegmentRecorder(base, header, **kwargs)
+        for row in reader:
+            try:
+                t = float(row[0])
+                angles = [float(a) for a in row[1:7]]
+            except (ValueError, IndexError):
+                continue
+            rec.push(t, angles, row)
+    return rec, rec.close()
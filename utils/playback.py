@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import json
+import time
+import datetime
+import statistics
+
+from utils.step_response import step_metrics
+from utils.transport import Backoff, classify_read
+
+
+def read_start(arm, n_joints=6, attempts=5, backoff=None):
+    """Start pose for a move: retries a failed / invalid get_angles() with backoff. None if all fail."""
+    backoff = backoff or Backoff()
+    for i in range(attempts):
+        try:
+            angles = arm.get_angles()
+        except OSError:
+            angles = None
+        if classify_read(angles, n_joints) is None:
+            return angles[:n_joints]
+        if i + 1 < attempts:
+            time.sleep(backoff.next())
+    return None
+
+
+def failed_move(target, error, n_joints=6):
+    """Result of a move that could not be measured (same keys as measure_move())."""
+    return {
+        'start': None,
+        'target': [float(a) for a in target[:n_joints]],
+        'final': None,
+        'settled': False,
+        'samples': 0,
+        'sample_hz': 0.0,
+        'invalid': 0,
+        'duration': 0.0,
+        'joints': [step_metrics([], [], 0.0, 0.0) for _ in range(n_joints)],
+        'error': error,
+    }
+
+
+def measure_move(arm, target, speed, tol=1.0, hold=0.3, timeout=5.0, n_joints=6):
+    """
+    Command one pose and record the follower's response.
+
+    The follower is sampled with back-to-back get_angles() calls (no
+    sleep), i.e. at the highest rate the link sustains. The move ends once
+    every joint has stayed within +/- tol of the target for `hold` seconds,
+    or after `timeout`. If the start pose can't be read (after retries),
+    the arm is not moved and the move is returned as failed.
+
+    Returns {'start', 'target', 'final', 'settled', 'samples', 'sample_hz',
+             'invalid', 'duration', 'joints': [step_metrics() per joint], 'error'}
+    """
+    target = [float(a) for a in target[:n_joints]]
+    start = read_start(arm, n_joints)
+    if start is None:
+        return failed_move(target, "could not read start pose", n_joints)
+
+    times, values = [], []
+    invalid = 0
+    inside_since = None
+    settled = False
+
+    t0 = time.monotonic()
+    arm.write_angles(target, speed)
+    while True:
+        angles = arm.get_angles()
+        now = time.monotonic()
+        if isinstance(angles, list) and len(angles) >= n_joints:
+            times.append(now)
+            values.append(angles[:n_joints])
+            if all(abs(a - b) <= tol for a, b in zip(angles, target)):
+                if inside_since is None:
+                    inside_since = now
+                elif now - inside_since >= hold:
+                    settled = True
+                    break
+            else:
+                inside_since = None
+        else:
+            invalid += 1
+        if now - t0 >= timeout:
+            break
+
+    duration = time.monotonic() - t0
+    joints = []
+    for j in range(n_joints):
+        m = step_metrics(times, [v[j] for v in values], start[j], target[j], t0=t0, tol=tol)
+        joints.append(m)
+    return {
+        'start': start,
+        'target': target,
+        'final': values[-1] if values else None,
+        'settled': settled,
+        'samples': len(times),
+        'sample_hz': len(times) / duration if duration > 0 else 0.0,
+        'invalid': invalid,
+        'duration': duration,
+        'joints': joints,
+        'error': None,
+    }
+
+
+def _worst(values):
+    vals = [v for v in values if v is not None]
+    return max(vals) if vals else None
+
+
+def _max_error(move):
+    return _worst(abs(j['final_error']) for j in move['joints'] if j['final_error'] is not None)
+
+
+def summarize(moves, n_joints=6):
+    """Per-pose summary over repeated cycles (repeatability = spread of the final position)."""
+    finals = [m['final'] for m in moves if m['final']]
+    repeat = []
+    for j in range(n_joints):
+        col = [f[j] for f in finals]
+        repeat.append({'std': statistics.pstdev(col) if len(col) > 1 else 0.0,
+                       'spread': (max(col) - min(col)) if col else None})
+    measured = [m for m in moves if not m.get('error')]
+    settle = [_worst(j['settle_time'] for j in m['joints']) for m in moves]
+    settle_ok = [s for s in settle if s is not None]
+    return {
+        'cycles': len(moves),
+        'settled': sum(1 for m in moves if m['settled']),
+        'failed': sum(1 for m in moves if m.get('error')),
+        'settle_s_mean': statistics.mean(settle_ok) if settle_ok else None,
+        'settle_s_max': max(settle_ok) if settle_ok else None,
+        'rise_s_max': _worst(_worst(j['rise_time'] for j in m['joints']) for m in moves),
+        'overshoot_pct_max': max(max(j['overshoot'] for j in m['joints']) for m in moves) if moves else 0.0,
+        'final_error_max': _worst(_max_error(m) for m in moves),
+        'sample_hz_mean': statistics.mean(m['sample_hz'] for m in measured) if measured else 0.0,
+        'repeatability': repeat,
+    }
+
+
+def run_playback(arm, poses, cycles=3, speed=40, tol=1.0, hold=0.3, timeout=5.0, settings=None, log=print):
+    """
+    Drive the arm through `poses` ([(name, angles)]) for `cycles` rounds.
+    `settings` (speed, firmware limits, calibration version, ...) is stored
+    with the results so reports can be compared later. A move that fails
+    (unreadable start pose, serial error) is recorded as failed and the
+    sweep goes on with the next pose.
+    """
+    results = {name: [] for name, _ in poses}
+    for c in range(cycles):
+        for name, angles in poses:
+            try:
+                m = measure_move(arm, angles, speed, tol=tol, hold=hold, timeout=timeout)
+            except Exception as e:
+                m = failed_move(angles, f"{type(e).__name__}: {e}")
+            results[name].append(m)
+            if m['error']:
+                if log:
+                    log(f"  cycle {c+1}/{cycles} {name:<16} FAILED ({m['error']})")
+                continue
+            settle = _worst(j['settle_time'] for j in m['joints'])
+            if log:
+                log(f"  cycle {c+1}/{cycles} {name:<16} settle={'%.2fs' % settle if settle is not None else 'n/a':<7} "
+                    f"err_max={_fmt(_max_error(m))} "
+                    f"@ {m['sample_hz']:.0f} Hz")
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'settings': dict(settings or {}, speed=speed, cycles=cycles, tol=tol, hold=hold, timeout=timeout),
+        'poses': {name: {'target': list(angles[:6]), 'summary': summarize(results[name]), 'moves': results[name]}
+                  for name, angles in poses},
+    }
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _fmt(x, spec=".2f"):
+    return format(x, spec) if x is not None else "n/a"
+
+
+def print_summary(report):
+    st = report['settings']
+    print(f"\n--- Playback Report (speed {st['speed']}, {st['cycles']} cycles, tol {st['tol']} deg) ---")
+    print(f"{'Pose':<16} | {'Settled':>7} | {'Settle avg/max (s)':>18} | {'Rise max':>8} | "
+          f"{'OS max %':>8} | {'Err max':>7} | {'Repeat std max':>14} | {'Hz':>5}")
+    for name, p in report['poses'].items():
+        s = p['summary']
+        rep = max((r['std'] for r in s['repeatability']), default=0.0)
+        print(f"{name[:16]:<16} | {s['settled']:>3}/{s['cycles']:<3} | "
+              f"{_fmt(s['settle_s_mean']):>8} / {_fmt(s['settle_s_max']):<7} | {_fmt(s['rise_s_max']):>8} | "
+              f"{s['overshoot_pct_max']:>8.1f} | {_fmt(s['final_error_max']):>7} | {rep:>14.3f} | {s['sample_hz_mean']:>5.0f}")
+        if s.get('failed'):
+            print(f"{'':<16}   {s['failed']} move(s) failed, see the report for details")
+
+
+def compare_reports(a, b):
+    """Side-by-side per-pose comparison of two saved reports (e.g. two speeds or firmware limit sets)."""
+    print(f"\n--- Compare: A={a['created']} (speed {a['settings']['speed']})  vs  "
+          f"B={b['created']} (speed {b['settings']['speed']}) ---")
+    diff_keys = sorted(k for k in set(a['settings']) | set(b['settings'])
+                       if a['settings'].get(k) != b['settings'].get(k))
+    for k in diff_keys:
+        print(f"  {k}: A={a['settings'].get(k)}  B={b['settings'].get(k)}")
+    print(f"{'Pose':<16} | {'Settle max A':>12} | {'Settle max B':>12} | {'Err max A':>9} | {'Err max B':>9} | "
+          f"{'OS% A':>6} | {'OS% B':>6}")
+    for name in a['poses']:
+        if name not in b['poses']:
+            continue
+        sa, sb = a['poses'][name]['summary'], b['poses'][name]['summary']
+        print(f"{name[:16]:<16} | {_fmt(sa['settle_s_max']):>12} | {_fmt(sb['settle_s_max']):>12} | "
+              f"{_fmt(sa['final_error_max']):>9} | {_fmt(sb['final_error_max']):>9} | "
+              f"{sa['overshoot_pct_max']:>6.1f} | {sb['overshoot_pct_max']:>6.1f}")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import csv
+import glob
+import time
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class PoseIndex:
+    """
+    Nearest-baseline lookup in mapped M750 joint space (6 joints, degrees).
+
+    Logic:
+    1. Static baseline poses and frames from baseline trajectories are
+       stacked into one (N, 6) array with a label per row.
+    2. Trajectory frames closer than `min_spacing` degrees to the previous
+       kept frame are skipped (a slow or idle recording is mostly duplicates).
+    3. A cKDTree over the array answers k-nearest queries in O(log N), so a
+       live query stays in the microsecond range even for tens of thousands
+       of poses. Query time is measured on every call.
+    """
+
+    def __init__(self, min_spacing=0.5):
+        self.min_spacing = min_spacing
+        self.rows = []
+        self.labels = []
+        self.tree = None
+        self.points = None
+
+        # Stats
+        self.queries = 0
+        self.query_time = 0.0
+        self.query_max = 0.0
+
+    def add_pose(self, label, angles):
+        if angles is None or len(angles) < 6:
+            return
+        self.rows.append([float(a) for a in angles[:6]])
+        self.labels.append(label)
+        self.tree = None
+
+    def add_baselines(self, baselines):
+        """Poses from the pose store ({name: {'angles': [...]}}, see PoseStore.as_dict())."""
+        for name, entry in baselines.items():
+            self.add_pose(f"pose:{name}", entry.get('angles'))
+
+    def add_trajectory(self, path):
+        """Frames from a baseline_traj_*.csv (Timestamp, J1..J6, ...). Returns frames kept."""
+        name = os.path.basename(path)
+        kept = 0
+        last = None
+        with open(path, 'r') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                try:
+                    t = float(row[0])
+                    angles = np.array([float(x) for x in row[1:7]])
+                except (ValueError, IndexError):
+                    continue
+                if last is not None and np.max(np.abs(angles - last)) < self.min_spacing:
+                    continue
+                last = angles
+                self.add_pose(f"traj:{name}@{t:.2f}s", angles)
+                kept += 1
+        return kept
+
+    def add_trajectory_dir(self, directory, pattern="baseline_traj_*.csv"):
+        total = 0
+        for path in sorted(glob.glob(os.path.join(directory, pattern))):
+            total += self.add_trajectory(path)
+        return total
+
+    def build(self):
+        self.points = np.asarray(self.rows, dtype=float).reshape(-1, 6)
+        self.tree = cKDTree(self.points) if len(self.points) else None
+        return len(self.points)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def query(self, angles, k=3):
+        """
+        k nearest indexed poses to `angles` (mapped M750 space).
+        Returns [(label, distance, per-joint error = angles - pose)], nearest first.
+        """
+        if self.tree is None:
+            if not self.rows:
+                return []
+            self.build()
+        x = np.asarray(angles[:6], dtype=float)
+        k = min(k, len(self.points))
+
+        t0 = time.perf_counter()
+        dist, idx = self.tree.query(x, k=k)
+        dt = time.perf_counter() - t0
+        self.queries += 1
+        self.query_time += dt
+        self.query_max = max(self.query_max, dt)
+
+        dist = np.atleast_1d(dist)
+        idx = np.atleast_1d(idx)
+        return [(self.labels[i], float(d), x - self.points[i]) for d, i in zip(dist, idx)]
+
+    def stats(self):
+        avg = (self.query_time / self.queries * 1e6) if self.queries else 0.0
+        return {'poses': len(self.rows), 'queries': self.queries,
+                'query_us_avg': avg, 'query_us_max': self.query_max * 1e6}
+
+    def report(self):
+        st = self.stats()
+        print(f"Pose index: {st['poses']} poses | {st['queries']} queries | "
+              f"{st['query_us_avg']:.1f}us avg / {st['query_us_max']:.1f}us max per query")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import json
+import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'data', 'poses.jsonl')
+LEGACY_PATH = os.path.join(BASE_DIR, 'data', 'baselines.json')
+
+
+class PoseStore:
+    """
+    Append-only pose library (JSON Lines) with an in-memory index.
+
+    Logic:
+    1. Every change is one line appended to the log:
+         {"op": "put", "name": ..., "angles": [...], "timestamp": ..., "desc": ..., "tags": [...]}
+         {"op": "delete", "name": ...}
+       Each append is flushed and fsync'ed, so a saved pose survives a crash
+       and a crash mid-write can only damage that one last line.
+    2. Opening the store replays the log into dicts by name and by tag
+       (later records win). Lines that don't parse, e.g. a torn final line,
+       are skipped and counted.
+    3. put / get / delete are O(1); the file is never rewritten on save.
+       compact() rewrites only the live records (temp file + fsync + rename)
+       once superseded records pile up.
+    4. If the log doesn't exist yet, poses from the old baselines.json are
+       imported once (the old file is left untouched).
+    """
+
+    def __init__(self, path=DEFAULT_PATH, legacy_path=LEGACY_PATH):
+        self.path = path
+        self.poses = {}         # name -> entry
+        self.tags = {}          # tag -> set(names)
+        self.records = 0        # lines in the log (live + superseded)
+        self.bad_lines = 0
+        self._needs_newline = False
+
+        if os.path.exists(path):
+            self._replay()
+        elif legacy_path and os.path.exists(legacy_path):
+            self._migrate(legacy_path)
+
+    # --- Log ---
+    def _replay(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        self._needs_newline = bool(data) and not data.endswith(b"\n")
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+                self._apply(rec)
+                self.records += 1
+            except (ValueError, KeyError, TypeError):
+                self.bad_lines += 1
+
+    def _apply(self, rec):
+        name = rec['name']
+        self._unindex(name)
+        if rec['op'] == 'put':
+            entry = {'timestamp': rec.get('timestamp'), 'angles': rec['angles'],
+                     'desc': rec.get('desc', name), 'tags': list(rec.get('tags', []))}
+            self.poses[name] = entry
+            for tag in entry['tags']:
+                self.tags.setdefault(tag, set()).add(name)
+        elif rec['op'] == 'delete':
+            self.poses.pop(name, None)
+        else:
+            raise ValueError(f"unknown op {rec['op']}")
+
+    def _unindex(self, name):
+        old = self.poses.get(name)
+        if old:
+            for tag in old['tags']:
+                names = self.tags.get(tag)
+                if names:
+                    names.discard(name)
+                    if not names:
+                        del self.tags[tag]
+
+    def _append(self, recs, sync=True):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        lines = "".join(json.dumps(r, separators=(',', ':')) + "\n" for r in recs)
+        if self._needs_newline:
+            # Don't glue new records onto a torn last line
+            lines = "\n" + lines
+            self._needs_newline = False
+        with open(self.path, 'a') as f:
+            f.write(lines)
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+        for r in recs:
+            self._apply(r)
+            self.records += 1
+
+    def _migrate(self, legacy_path):
+        try:
+            with open(legacy_path, 'r') as f:
+                old = json.load(f)
+        except (ValueError, OSError):
+            return
+        recs = [{'op': 'put', 'name': name, 'angles': e.get('angles'),
+                 'timestamp': e.get('timestamp'), 'desc': e.get('desc', name), 'tags': []}
+                for name, e in old.items() if e.get('angles')]
+        if recs:
+            self._append(recs)
+            print(f"Imported {len(recs)} poses from {os.path.basename(legacy_path)} into {os.path.basename(self.path)}")
+
+    # --- API ---
+    def put(self, name, angles, desc=None, tags=(), timestamp=None):
+        rec = {'op': 'put', 'name': name, 'angles': list(angles),
+               'timestamp': timestamp or datetime.datetime.now().isoformat(),
+               'desc': desc or name, 'tags': list(tags)}
+        self._append([rec])
+        return self.poses[name]
+
+    def delete(self, name):
+        if name not in self.poses:
+            return False
+        self._append([{'op': 'delete', 'name': name}])
+        return True
+
+    def get(self, name):
+        return self.poses.get(name)
+
+    def names(self):
+        return list(self.poses)
+
+    def by_tag(self, tag):
+        return sorted(self.tags.get(tag, ()))
+
+    def as_dict(self, tag=None):
+        """{name: entry} in the old baselines.json shape (optionally one tag only)."""
+        names = self.by_tag(tag) if tag else self.poses
+        return {n: self.poses[n] for n in names}
+
+    def __len__(self):
+        return len(self.poses)
+
+    def __contains__(self, name):
+        return name in self.poses
+
+    def dead_records(self):
+        return self.records - len(self.poses)
+
+    def compact(self):
+        """Rewrite the log with live records only. Returns (bytes before, bytes after)."""
+        before = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        tmp = self.path + ".compact"
+        with open(tmp, 'w') as f:
+            for name, e in self.poses.items():
+                rec = {'op': 'put', 'name': name, 'angles': e['angles'], 'timestamp': e['timestamp'],
+                       'desc': e['desc'], 'tags': e['tags']}
+                f.write(json.dumps(rec, separators=(',', ':')) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.records = len(self.poses)
+        self.bad_lines = 0
+        self._needs_newline = False
+        return before, os.path.getsize(self.path)
+
+    def compact_if_needed(self, ratio=1.0, min_dead=100):
+        """Compact once superseded records outnumber live ones (ratio) and min_dead is reached."""
+        dead = self.dead_records() + self.bad_lines
+        if dead >= min_dead and dead > ratio * len(self.poses):
+            return self.compact()
+        return None
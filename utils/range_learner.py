@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import json
+import math
+import os
+import threading
+
+
+class TDigest:
+    """
+    Merging t-digest: streaming quantile sketch with bounded memory.
+
+    Values are buffered, then merged into at most ~`compression` centroids
+    (mean, weight). Centroids are small near the tails (q -> 0 / 1) and
+    large in the middle, so extreme percentiles stay accurate, which is
+    exactly what limit learning needs. Two digests merge by re-compressing
+    their centroids together.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.means = []
+        self.weights = []
+        self.buffer = []
+        self.buffer_size = 5 * compression
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x, w=1.0):
+        self.buffer.append((x, w))
+        self.count += w
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        if len(self.buffer) >= self.buffer_size:
+            self._compress()
+
+    def _k(self, q):
+        # k1 scale function: centroid size shrinks towards the tails
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _compress(self):
+        if not self.buffer:
+            return
+        items = sorted(list(zip(self.means, self.weights)) + self.buffer)
+        self.buffer = []
+        total = sum(w for _, w in items)
+
+        means, weights = [], []
+        cm, cw = items[0]
+        w_done = 0.0
+        k_lo = self._k(0.0)
+        for m, w in items[1:]:
+            if self._k((w_done + cw + w) / total) - k_lo <= 1.0:
+                cw += w
+                cm += (m - cm) * w / cw
+            else:
+                means.append(cm)
+                weights.append(cw)
+                w_done += cw
+                k_lo = self._k(w_done / total)
+                cm, cw = m, w
+        means.append(cm)
+        weights.append(cw)
+        self.means, self.weights = means, weights
+
+    def merge(self, other):
+        other._compress()
+        for m, w in zip(other.means, other.weights):
+            self.buffer.append((m, w))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q):
+        """Value at quantile q (0..1), or None if empty."""
+        self._compress()
+        if not self.means:
+            return None
+        if len(self.means) == 1:
+            return self.means[0]
+
+        target = q * self.count
+        first, last = self.weights[0], self.weights[-1]
+        # Tails: interpolate between the exact min/max and the outer centroids
+        if target <= first / 2:
+            return self.min + (self.means[0] - self.min) * (target / (first / 2) if first else 0.0)
+        if target >= self.count - last / 2:
+            span = last / 2
+            frac = (self.count - target) / span if span else 0.0
+            return self.max - (self.max - self.means[-1]) * frac
+
+        cum = first / 2
+        for i in range(len(self.means) - 1):
+            step = (self.weights[i] + self.weights[i + 1]) / 2
+            if target <= cum + step:
+                frac = (target - cum) / step
+                return self.means[i] + (self.means[i + 1] - self.means[i]) * frac
+            cum += step
+        return self.means[-1]
+
+    def to_dict(self):
+        self._compress()
+        return {'compression': self.compression, 'count': self.count,
+                'min': self.min if self.count else None, 'max': self.max if self.count else None,
+                'means': self.means, 'weights': self.weights}
+
+    @classmethod
+    def from_dict(cls, d):
+        td = cls(d.get('compression', 100))
+        td.means = list(d['means'])
+        td.weights = list(d['weights'])
+        td.count = d['count']
+        td.min = d['min'] if d['min'] is not None else math.inf
+        td.max = d['max'] if d['max'] is not None else -math.inf
+        return td
+
+
+class CoverageHistogram:
+    """Fixed-bin visit counts, to show how much of a range was actually swept."""
+
+    def __init__(self, lo=-200.0, hi=200.0, bin_width=1.0):
+        self.lo = lo
+        self.bin_width = bin_width
+        self.counts = [0] * int(math.ceil((hi - lo) / bin_width))
+
+    def add(self, x):
+        i = int((x - self.lo) // self.bin_width)
+        if 0 <= i < len(self.counts):
+            self.counts[i] += 1
+
+    def merge(self, other):
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+
+    def coverage(self, lo, hi):
+        """Fraction of bins inside [lo, hi] that were visited at least once."""
+        i0 = max(int((lo - self.lo) // self.bin_width), 0)
+        i1 = min(int((hi - self.lo) // self.bin_width), len(self.counts) - 1)
+        if i1 < i0:
+            return 0.0
+        bins = self.counts[i0:i1 + 1]
+        return sum(1 for c in bins if c) / len(bins)
+
+    def to_dict(self):
+        return {'lo': self.lo, 'bin_width': self.bin_width, 'counts': self.counts}
+
+    @classmethod
+    def from_dict(cls, d):
+        h = cls(d['lo'], d['lo'] + d['bin_width'] * len(d['counts']), d['bin_width'])
+        h.counts = list(d['counts'])
+        return h
+
+
+class RangeLearner:
+    """
+    Robust per-joint range estimator for the range monitors / set_limits.
+
+    Logic:
+    1. Every sample goes through the same sanity filter as the serial
+       transport (|angle| <= valid_range, finite); rejects are only counted.
+    2. Accepted samples feed a t-digest and a 1-degree coverage histogram
+       per joint (constant memory, no raw samples kept).
+    3. suggest() returns (lo, hi) from the lower/upper percentiles, so a
+       single corrupted read can no longer widen a limit. Raw min/max are
+       kept for comparison only.
+    4. Sketches are saved as JSON and merge across sessions.
+
+    update() / suggest() are locked, so a dashboard thread can read
+    suggestions while the read loop feeds samples.
+    """
+
+    def __init__(self, n_joints=6, lower_pct=0.2, upper_pct=99.8, valid_range=200.0, compression=100):
+        self.n_joints = n_joints
+        self.lower_pct = lower_pct
+        self.upper_pct = upper_pct
+        self.valid_range = valid_range
+        self.digests = [TDigest(compression) for _ in range(n_joints)]
+        self.hists = [CoverageHistogram(-valid_range, valid_range) for _ in range(n_joints)]
+        self.rejected = [0] * n_joints
+        self.sessions = 1
+        self.lock = threading.RLock()
+
+    def update(self, angles):
+        """Feed one reading (list of angles; extra entries are ignored)."""
+        if not angles:
+            return
+        with self.lock:
+            for i in range(min(len(angles), self.n_joints)):
+                x = angles[i]
+                if not isinstance(x, (int, float)) or not math.isfinite(x) or abs(x) > self.valid_range:
+                    self.rejected[i] += 1
+                    continue
+                self.digests[i].add(float(x))
+                self.hists[i].add(x)
+
+    def samples(self, i):
+        return int(self.digests[i].count)
+
+    def raw_range(self, i):
+        d = self.digests[i]
+        return (d.min, d.max) if d.count else (None, None)
+
+    def suggest(self, i=None):
+        """Robust (lo, hi) for joint i, or a list for all joints. None if no data."""
+        if i is None:
+            return [self.suggest(j) for j in range(self.n_joints)]
+        with self.lock:
+            d = self.digests[i]
+            if not d.count:
+                return None
+            return (d.quantile(self.lower_pct / 100.0), d.quantile(self.upper_pct / 100.0))
+
+    def coverage(self, i):
+        with self.lock:
+            s = self.suggest(i)
+            return self.hists[i].coverage(*s) if s else 0.0
+
+    def merge(self, other):
+        with self.lock:
+            for i in range(min(self.n_joints, other.n_joints)):
+                self.digests[i].merge(other.digests[i])
+                self.hists[i].merge(other.hists[i])
+                self.rejected[i] += other.rejected[i]
+            self.sessions += other.sessions
+
+    def to_dict(self):
+        with self.lock:
+            return self._to_dict()
+
+    def _to_dict(self):
+        return {
+            'version': 1,
+            'n_joints': self.n_joints,
+            'valid_range': self.valid_range,
+            'sessions': self.sessions,
+            'joints': [{'digest': self.digests[i].to_dict(), 'hist': self.hists[i].to_dict(),
+                        'rejected': self.rejected[i]} for i in range(self.n_joints)],
+        }
+
+    @classmethod
+    def from_dict(cls, d, lower_pct=0.2, upper_pct=99.8):
+        rl = cls(d['n_joints'], lower_pct, upper_pct, d.get('valid_range', 200.0))
+        rl.sessions = d.get('sessions', 1)
+        for i, j in enumerate(d['joints']):
+            rl.digests[i] = TDigest.from_dict(j['digest'])
+            rl.hists[i] = CoverageHistogram.from_dict(j['hist'])
+            rl.rejected[i] = j.get('rejected', 0)
+        return rl
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, lower_pct=0.2, upper_pct=99.8):
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f), lower_pct, upper_pct)
+
+    def report(self, title="Range Learner"):
+        print(f"\n--- {title} (p{self.lower_pct:g} .. p{self.upper_pct:g}, {self.sessions} session(s)) ---")
+        print(f"{'Joint':<6} | {'Samples':>8} | {'Rejected':>8} | {'Raw Min':>8} | {'Raw Max':>8} | "
+              f"{'Sugg Min':>8} | {'Sugg Max':>8} | {'Coverage':>8}")
+        for i in range(self.n_joints):
+            s = self.suggest(i)
+            if s is None:
+                print(f"J{i+1:<5} | {0:>8} | {self.rejected[i]:>8} | {'N/A':>8} | {'N/A':>8} | {'N/A':>8} | {'N/A':>8} | {'-':>8}")
+                continue
+            mn, mx = self.raw_range(i)
+            print(f"J{i+1:<5} | {self.samples(i):>8} | {self.rejected[i]:>8} | {mn:>8.2f} | {mx:>8.2f} | "
+                  f"{s[0]:>8.2f} | {s[1]:>8.2f} | {self.coverage(i)*100:>7.0f}%")
+
+
+def merge_files(paths, lower_pct=0.2, upper_pct=99.8):
+    """Combine saved sketches from several sessions into one learner."""
+    learner = None
+    for p in paths:
+        rl = RangeLearner.load(p, lower_pct, upper_pct)
+        if learner is None:
+            learner = rl
+        else:
+            learner.merge(rl)
+    return learner
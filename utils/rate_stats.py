@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import numpy as np
+
+from utils.transport import ERROR_KINDS
+
+
+class RateStats:
+    """
+    Achieved rate, inter-sample jitter and dropped reads of one sampled stream.
+
+    Logic:
+    1. tick(t) is called with the timestamp of every kept sample; the
+       intervals are stored so percentiles can be reported at the end.
+    2. drop(kind) counts a read that was not kept, by transport error kind
+       (none / short / invalid / io ...).
+    3. Jitter is reported as the spread of the interval around its median
+       (p99 - p50) and the single worst gap, since one long stall matters
+       more for a recording than the standard deviation.
+    """
+
+    def __init__(self):
+        self.first = None
+        self.last = None
+        self.intervals = []
+        self.dropped = {k: 0 for k in ERROR_KINDS}
+
+    def tick(self, t):
+        if self.last is not None:
+            self.intervals.append(t - self.last)
+        else:
+            self.first = t
+        self.last = t
+
+    def drop(self, kind):
+        self.dropped[kind] = self.dropped.get(kind, 0) + 1
+
+    @property
+    def samples(self):
+        return len(self.intervals) + (1 if self.first is not None else 0)
+
+    def stats(self):
+        dropped = sum(self.dropped.values())
+        st = {'samples': self.samples, 'dropped': dropped, 'dropped_by_kind': dict(self.dropped),
+              'rate_hz': 0.0, 'period_ms_p50': None, 'jitter_ms_p99': None, 'gap_ms_max': None}
+        if self.intervals:
+            dt = np.asarray(self.intervals) * 1000
+            p50 = float(np.median(dt))
+            span = self.last - self.first
+            st.update(rate_hz=len(dt) / span if span > 0 else 0.0, period_ms_p50=p50,
+                      jitter_ms_p99=float(np.percentile(dt, 99)) - p50, gap_ms_max=float(dt.max()))
+        return st
+
+    def report(self, label="Samples"):
+        st = self.stats()
+        if st['period_ms_p50'] is None:
+            print(f"{label}: {st['samples']} samples, {st['dropped']} dropped")
+            return
+        kinds = ", ".join(f"{k}={v}" for k, v in st['dropped_by_kind'].items() if v) or "none"
+        print(f"{label}: {st['samples']} samples @ {st['rate_hz']:.1f} Hz | period p50 {st['period_ms_p50']:.2f} ms, "
+              f"jitter p99 +{st['jitter_ms_p99']:.2f} ms, max gap {st['gap_ms_max']:.1f} ms | "
+              f"dropped {st['dropped']} ({kinds})")
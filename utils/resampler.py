@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+from bisect import bisect_right
+
+
+class SplineResampler:
+    """
+    Streaming resampler for irregularly sampled joint streams.
+
+    Logic:
+    1. push() stores timestamped samples (leader reads, or mapped targets).
+    2. emit() returns points on a uniform grid of `rate_hz`, trailing the
+       wall clock by a fixed `delay` so every output point is bracketed by
+       real samples.
+    3. Between two samples we evaluate a cubic Hermite segment whose
+       tangents come from the neighbouring samples (non-uniform Catmull-Rom),
+       so position AND velocity are continuous across segments.
+
+    Latency is bounded by `delay` (+ one grid period). If the input stalls we
+    hold the last sample instead of extrapolating, so a dropped cable never
+    makes the follower run away.
+    """
+
+    def __init__(self, rate_hz=50.0, delay=0.06, history=8, limits=None, max_burst=5):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.period = 1.0 / rate_hz
+        self.delay = delay
+        self.limits = limits
+        self.max_burst = max_burst
+        self.history = max(history, 4)
+        self.times = []
+        self.samples = []
+        self.grid_origin = None
+        self.grid_n = 0
+
+        # Stats
+        self.samples_in = 0
+        self.samples_out = 0
+        self.cost_total = 0.0
+        self.cost_max = 0.0
+
+    def reset(self):
+        self.times.clear()
+        self.samples.clear()
+        self.grid_origin = None
+
+    def push(self, t, values):
+        """Add a sample. Out-of-order or duplicate timestamps are dropped."""
+        if self.times and t <= self.times[-1]:
+            return False
+        self.times.append(t)
+        self.samples.append((t, list(values)))
+        if len(self.times) > self.history:
+            del self.times[0]
+            del self.samples[0]
+        self.samples_in += 1
+        return True
+
+    def sample(self, t):
+        """Evaluate the spline at time t (held at both ends of the history)."""
+        s = self.samples
+        if not s:
+            return None
+        if t <= s[0][0]:
+            return self._clamp(list(s[0][1]))
+        if t >= s[-1][0]:
+            return self._clamp(list(s[-1][1]))
+
+        # Segment [k, k+1] containing t
+        k = bisect_right(self.times, t) - 1
+
+        t1, p1 = s[k]
+        t2, p2 = s[k + 1]
+        # Missing neighbours at the ends of the history -> one-sided differences
+        t0, p0 = s[k - 1] if k > 0 else (t1, p1)
+        t3, p3 = s[k + 2] if k + 2 < len(s) else (t2, p2)
+
+        h = t2 - t1
+        u = (t - t1) / h
+        u2 = u * u
+        u3 = u2 * u
+        h00 = 2 * u3 - 3 * u2 + 1
+        h10 = u3 - 2 * u2 + u
+        h01 = -2 * u3 + 3 * u2
+        h11 = u3 - u2
+
+        out = []
+        for j in range(len(p1)):
+            m1 = (p2[j] - p0[j]) / (t2 - t0)
+            m2 = (p3[j] - p1[j]) / (t3 - t1)
+            out.append(h00 * p1[j] + h10 * h * m1 + h01 * p2[j] + h11 * h * m2)
+        return self._clamp(out)
+
+    def emit(self, now=None):
+        """
+        Return [(t_grid, values), ...] for every grid point that is due,
+        i.e. t_grid <= now - delay. At most `max_burst` points are returned;
+        after a long stall the grid skips ahead instead of replaying history.
+        """
+        if now is None:
+            now = time.monotonic()
+        if not self.samples:
+            return []
+
+        t_out = now - self.delay
+        if self.grid_origin is None:
+            self.start_grid(max(self.samples[0][0], t_out))
+
+        # Grid times are origin + n * period (no accumulated float drift)
+        last_n = int((t_out - self.grid_origin) / self.period + 1e-9)
+        if last_n - self.grid_n >= self.max_burst:
+            self.grid_n = last_n - self.max_burst + 1
+
+        out = []
+        while self.grid_n <= last_n:
+            t_grid = self.grid_origin + self.grid_n * self.period
+            t0 = time.perf_counter()
+            values = self.sample(t_grid)
+            cost = time.perf_counter() - t0
+
+            self.cost_total += cost
+            if cost > self.cost_max:
+                self.cost_max = cost
+            self.samples_out += 1
+
+            out.append((t_grid, values))
+            self.grid_n += 1
+        return out
+
+    def start_grid(self, t):
+        """Anchor the output grid so its first point falls at time t."""
+        self.grid_origin = t
+        self.grid_n = 0
+
+    def _clamp(self, values):
+        if not self.limits:
+            return values
+        for j, (a, b) in enumerate(self.limits[:len(values)]):
+            lo, hi = min(a, b), max(a, b)
+            if values[j] < lo: values[j] = lo
+            if values[j] > hi: values[j] = hi
+        return values
+
+    def stats(self):
+        mean_us = (self.cost_total / self.samples_out * 1e6) if self.samples_out else 0.0
+        return {
+            'samples_in': self.samples_in,
+            'samples_out': self.samples_out,
+            'cost_mean_us': mean_us,
+            'cost_max_us': self.cost_max * 1e6,
+            'latency_s': self.delay + self.period,
+        }
+
+
+def resample(timestamps, rows, rate_hz=50.0, limits=None):
+    """
+    Offline helper: resample a whole recording onto a uniform grid.
+    Returns (grid_timestamps, grid_rows, stats).
+    """
+    if not timestamps:
+        return [], [], {}
+    span = timestamps[-1] - timestamps[0]
+    rs = SplineResampler(rate_hz=rate_hz, delay=0.0, history=len(timestamps) + 4,
+                         limits=limits, max_burst=int(span * rate_hz) + 2)
+    for t, row in zip(timestamps, rows):
+        rs.push(t, row)
+    rs.start_grid(timestamps[0])
+
+    grid_t, grid_rows = [], []
+    for t, values in rs.emit(now=timestamps[-1]):
+        grid_t.append(t)
+        grid_rows.append(values)
+    return grid_t, grid_rows, rs.stats()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import threading
+
+
+class _FakeSerial:
+    def __init__(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+
+class SimulatedArm:
+    """
+    Stand-in for MyArmC / MyArmMControl with fault injection, for testing
+    transport, watchdog and recorder code without hardware.
+
+    Exposes the subset of the pymycobot API the scripts use:
+    get_joints_angle() (C650), get_angles() / write_angles() (M750),
+    gripper, limits, power and stop.
+
+    Faults (see inject()):
+      'none'       -> read returns None
+      'short'      -> read returns a truncated list
+      'garbage'    -> read returns out-of-range values (> 200 deg)
+      'oserror'    -> call raises OSError (Errno 5, like a flaky USB link)
+      'disconnect' -> every call raises OSError until the device is
+                      re-plugged (see replug()), like USB re-enumeration
+      'stall'      -> call blocks for `stall_s` seconds, then succeeds
+    """
+
+    def __init__(self, port="SIM0", n_joints=7, latency=0.0):
+        self.port = port
+        self.n = n_joints
+        self.latency = latency
+        self.angles = [0.0] * n_joints
+        self.gripper = 0
+        self.limits = {i: (-180.0, 180.0) for i in range(1, 8)}
+        self.powered = True
+        self.stopped = False
+        self._serial_port = _FakeSerial()
+
+        self.lock = threading.Lock()
+        self.faults = []        # queue of (kind, remaining count)
+        self.stall_s = 0.0
+        self.unplugged = False
+        self.calls = 0
+        self.writes = []        # (time.monotonic(), angles, speed)
+
+    # --- Fault Injection ---
+    def inject(self, kind, count=1, stall_s=None):
+        with self.lock:
+            if kind == 'disconnect':
+                self.unplugged = True
+                return
+            if stall_s is not None:
+                self.stall_s = stall_s
+            self.faults.append([kind, count])
+
+    def replug(self, port=None):
+        """Device comes back (optionally under a new port name)."""
+        with self.lock:
+            self.unplugged = False
+            if port:
+                self.port = port
+            self._serial_port = _FakeSerial()
+
+    def _begin(self):
+        with self.lock:
+            self.calls += 1
+            if self.unplugged:
+                raise OSError(5, "Input/output error (simulated unplug)")
+            fault = None
+            if self.faults:
+                fault = self.faults[0][0]
+                self.faults[0][1] -= 1
+                if self.faults[0][1] <= 0:
+                    self.faults.pop(0)
+            stall = self.stall_s
+        if fault == 'oserror':
+            raise OSError(5, "Input/output error (simulated)")
+        if fault == 'stall':
+            time.sleep(stall)
+        elif self.latency:
+            time.sleep(self.latency)
+        return fault
+
+    def _read(self, n):
+        fault = self._begin()
+        if fault == 'none':
+            return None
+        if fault == 'short':
+            return list(self.angles[:max(n // 2, 1)])
+        if fault == 'garbage':
+            return [999.0] * n
+        return list(self.angles[:n])
+
+    # --- Leader (MyArmC) ---
+    def get_joints_angle(self):
+        return self._read(self.n)
+
+    # --- Follower (MyArmMControl) ---
+    def get_angles(self):
+        return self._read(6)
+
+    def write_angles(self, angles, speed):
+        self._begin()
+        self.stopped = False
+        with self.lock:
+            self.angles[:len(angles)] = list(angles)
+            self.writes.append((time.monotonic(), list(angles), speed))
+
+    def send_angles(self, angles, speed):
+        self.write_angles(angles, speed)
+
+    def send_angle(self, joint_id, angle, speed):
+        self._begin()
+        self.angles[joint_id - 1] = angle
+
+    def set_gripper_enabled(self):
+        self._begin()
+
+    def set_gripper_value(self, value, speed):
+        self._begin()
+        self.gripper = value
+
+    def get_gripper_value(self):
+        self._begin()
+        return self.gripper
+
+    def get_joint_min(self, joint_id):
+        self._begin()
+        return self.limits[joint_id][0]
+
+    def get_joint_max(self, joint_id):
+        self._begin()
+        return self.limits[joint_id][1]
+
+    def set_joint_min(self, joint_id, angle):
+        self._begin()
+        self.limits[joint_id] = (angle, self.limits[joint_id][1])
+
+    def set_joint_max(self, joint_id, angle):
+        self._begin()
+        self.limits[joint_id] = (self.limits[joint_id][0], angle)
+
+    def release_all_servos(self):
+        self._begin()
+
+    def is_powered_on(self):
+        self._begin()
+        return 1 if self.powered else 0
+
+    def power_on(self):
+        self._begin()
+        self.powered = True
+
+    def power_off(self):
+        self._begin()
+        self.powered = False
+
+    def stop(self):
+        self._begin()
+        self.stopped = True
+
+    # --- Test helpers ---
+    def set_pose(self, angles):
+        with self.lock:
+            self.angles[:len(angles)] = list(angles)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import os
+import math
+import time
+import numpy as np
+
+# Adjust path to import config from parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+
+class SpeedScheduler:
+    """
+    Per-cycle speed argument for write_angles().
+
+    Logic:
+    1. Track the inter-command interval (EMA) to predict when the next
+       command will arrive.
+    2. Commanded delta = new target - previous target (where the follower is
+       assumed to be heading). The slowest speed that still covers the
+       largest joint delta before the next command is |delta| / dt_next.
+    3. Leader velocity (EMA of target deltas / dt) is a floor: if the leader
+       keeps moving, the follower should not decelerate to a stop between
+       frames.
+    4. Convert deg/s to the 1-100 speed argument using M750_MAX_JOINT_SPEED
+       and clamp to [min_speed, max_speed].
+    """
+
+    def __init__(self, min_speed=10, max_speed=100, max_joint_speed=None,
+                 margin=1.1, alpha=0.3, default_dt=0.05):
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+        self.max_joint_speed = max_joint_speed or getattr(config, 'M750_MAX_JOINT_SPEED', 160.0)
+        self.margin = margin
+        self.alpha = alpha
+
+        self.prev_target = None
+        self.prev_t = None
+        self.dt_est = default_dt
+        self.velocity = None
+        self.last_speed = max_speed
+
+    def reset(self):
+        self.prev_target = None
+        self.prev_t = None
+        self.velocity = None
+
+    def update(self, target, t=None, dt_next=None):
+        """Return the speed argument for sending `target` now."""
+        if t is None:
+            t = time.monotonic()
+
+        if self.prev_target is None:
+            self.prev_target = list(target)
+            self.prev_t = t
+            self.velocity = [0.0] * len(target)
+            return self.last_speed
+
+        dt = t - self.prev_t
+        if dt > 0:
+            self.dt_est += self.alpha * (dt - self.dt_est)
+
+        deltas = [a - b for a, b in zip(target, self.prev_target)]
+        if dt > 0:
+            for j, d in enumerate(deltas):
+                self.velocity[j] += self.alpha * (d / dt - self.velocity[j])
+
+        horizon = dt_next if dt_next else self.dt_est
+        horizon = max(horizon, 1e-3)
+
+        required = 0.0
+        for j, d in enumerate(deltas):
+            v = max(abs(d) / horizon, abs(self.velocity[j]))
+            if v > required:
+                required = v
+
+        speed = math.ceil(required * self.margin / self.max_joint_speed * 100)
+        speed = int(min(max(speed, self.min_speed), self.max_speed))
+
+        self.prev_target = list(target)
+        self.prev_t = t
+        self.last_speed = speed
+        return speed
+
+
+def simulate_follower(times, targets, speeds, max_joint_speed=None):
+    """
+    Offline follower model: after each command the joints move straight
+    towards the target at speed/100 * max_joint_speed until the next command.
+
+    Returns the follower position at each command time (just before the
+    command is applied), so it can be compared against the target stream.
+    """
+    vmax = max_joint_speed or getattr(config, 'M750_MAX_JOINT_SPEED', 160.0)
+    pos = list(targets[0])
+    out = [list(pos)]
+    for k in range(1, len(times)):
+        dt = times[k] - times[k - 1]
+        step = speeds[k - 1] / 100.0 * vmax * dt
+        goal = targets[k - 1]
+        for j in range(len(pos)):
+            d = goal[j] - pos[j]
+            if abs(d) <= step:
+                pos[j] = goal[j]
+            else:
+                pos[j] += step if d > 0 else -step
+        out.append(list(pos))
+    return out
+
+
+def tracking_lag(times, targets, follower, max_shift=0.5, step=0.005):
+    """
+    Score how far the follower trails the target stream.
+
+    Returns (rms_error_deg, lag_s): the RMS error at zero shift, and the
+    time shift of the target stream that best explains the follower motion.
+    """
+    t = np.asarray(times, dtype=float)
+    ref = np.asarray(targets, dtype=float)
+    pos = np.asarray(follower, dtype=float)
+    if len(t) < 2:
+        return 0.0, 0.0
+
+    def rms(shift):
+        mask = (t - shift) >= t[0]
+        if not mask.any():
+            return float('inf')
+        shifted = np.column_stack([np.interp(t[mask] - shift, t, ref[:, j]) for j in range(ref.shape[1])])
+        return float(np.sqrt(np.mean((pos[mask] - shifted) ** 2)))
+
+    err0 = rms(0.0)
+    shifts = np.arange(0.0, max_shift + 1e-9, step)
+    errs = [rms(s) for s in shifts]
+    return err0, float(shifts[int(np.argmin(errs))])
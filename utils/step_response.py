@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+
+def step_metrics(times, values, start, target, t0=None, tol=1.0):
+    """
+    Classic step-response figures for one joint.
+
+    times/values: measured samples after the command was issued.
+    start: position before the step, target: commanded position.
+    t0: time the command was issued (defaults to times[0]).
+    tol: settle band in degrees (absolute).
+
+    Returns dict:
+      rise_time   - 10% -> 90% of the step (s), None if never reached
+      settle_time - from t0 until the response enters +/- tol and stays (s)
+      overshoot   - peak beyond target, as % of step size
+      final_error - target - last sample (deg)
+    """
+    if not times:
+        return {'rise_time': None, 'settle_time': None, 'overshoot': 0.0, 'final_error': None}
+    if t0 is None:
+        t0 = times[0]
+
+    step = target - start
+    sign = 1.0 if step >= 0 else -1.0
+    mag = abs(step)
+
+    # Rise time (10% -> 90%)
+    t10 = t90 = None
+    if mag > 0:
+        for t, v in zip(times, values):
+            frac = (v - start) * sign / mag
+            if t10 is None and frac >= 0.1:
+                t10 = t
+            if t90 is None and frac >= 0.9:
+                t90 = t
+                break
+    rise = (t90 - t10) if (t10 is not None and t90 is not None) else None
+
+    # Settle time: last time the response was outside the band
+    settle = None
+    last_out = None
+    for t, v in zip(times, values):
+        if abs(v - target) > tol:
+            last_out = t
+    if abs(values[-1] - target) <= tol:
+        if last_out is None:
+            settle = times[0] - t0
+        else:
+            # First sample after the last excursion
+            for t in times:
+                if t > last_out:
+                    settle = t - t0
+                    break
+
+    # Overshoot (% of step)
+    overshoot = 0.0
+    if mag > 0:
+        peak = max((v - target) * sign for v in values)
+        overshoot = max(peak, 0.0) / mag * 100.0
+
+    return {
+        'rise_time': rise,
+        'settle_time': settle,
+        'overshoot': overshoot,
+        'final_error': target - values[-1],
+    }
+
+
+class StepDetector:
+    """
+    Finds steps in a live (command, measurement) stream and scores them.
+
+    Logic:
+    1. When the command moves, a step starts (from the measured position at
+       that moment). While the command keeps moving (slider drag), the step
+       target follows it and t0 becomes the time of the last change.
+    2. Once the command is still and the measurement has stayed inside the
+       +/- tol band for `hold` seconds (or `timeout` passed), the step is
+       scored with step_metrics() and returned by update().
+    3. Steps smaller than `threshold` degrees are ignored.
+    """
+
+    def __init__(self, threshold=2.0, tol=1.0, hold=0.3, timeout=5.0, max_samples=2000):
+        self.threshold = threshold
+        self.tol = tol
+        self.hold = hold
+        self.timeout = timeout
+        self.max_samples = max_samples
+
+        self.cmd = None
+        self.active = False
+        self.start = None
+        self.t0 = None
+        self.inside_since = None
+        self.times = []
+        self.values = []
+
+    def update(self, t, cmd, actual):
+        """Feed one sample. Returns a metrics dict when a step completes, else None."""
+        if self.cmd is None:
+            self.cmd = cmd
+            return None
+
+        if cmd != self.cmd:
+            if not self.active:
+                self.active = True
+                self.start = actual
+                self.times, self.values = [], []
+            self.cmd = cmd
+            self.t0 = t
+            self.inside_since = None
+
+        if not self.active:
+            return None
+
+        if len(self.times) < self.max_samples:
+            self.times.append(t)
+            self.values.append(actual)
+
+        if abs(actual - cmd) <= self.tol:
+            if self.inside_since is None:
+                self.inside_since = t
+        else:
+            self.inside_since = None
+
+        settled = self.inside_since is not None and t - self.inside_since >= self.hold
+        if not settled and t - self.t0 < self.timeout:
+            return None
+
+        self.active = False
+        if abs(cmd - self.start) < self.threshold:
+            return None
+        pts = [(ts, v) for ts, v in zip(self.times, self.values) if ts >= self.t0]
+        m = step_metrics([p[0] for p in pts], [p[1] for p in pts], self.start, cmd, t0=self.t0, tol=self.tol)
+        m['start'] = self.start
+        m['target'] = cmd
+        m['settled'] = settled
+        return m
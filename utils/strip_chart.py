@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import numpy as np
+from matplotlib.figure import Figure
+
+
+class StripChart:
+    """
+    Rolling commanded-vs-actual plot for one or more joints, embedded in Tk.
+
+    Logic:
+    1. Samples go into a preallocated "double" ring buffer: each sample is
+       written at i and i + capacity, so the last `capacity` samples are
+       always the contiguous view buf[head:head + capacity] (no copies,
+       no per-frame allocation).
+    2. Axes limits are fixed (x: -window..0 s, y: joint range), so the
+       static parts (axes, ticks, labels) are drawn once and cached with
+       copy_from_bbox(). Each frame restores that background, redraws only
+       the line artists and blits the axes.
+    3. Redraw time is measured (avg / max) so we can check it stays within
+       a few ms at 30 fps.
+    """
+
+    def __init__(self, master=None, n_joints=1, labels=None, y_limits=None,
+                 window=10.0, rate_hz=30.0, figsize=(6, 2.5)):
+        self.n = n_joints
+        self.window = window
+        self.capacity = int(window * rate_hz * 2)  # headroom for bursts of samples
+
+        # Double ring buffers: time, commanded, actual
+        cap2 = 2 * self.capacity
+        self.t = np.full(cap2, np.nan)
+        self.cmd = np.full((n_joints, cap2), np.nan)
+        self.act = np.full((n_joints, cap2), np.nan)
+        self.x = np.empty(self.capacity)   # reused for "t - now"
+        self.head = 0
+        self.count = 0
+
+        # Figure
+        self.fig = Figure(figsize=figsize, dpi=100)
+        self.axes = []
+        self.cmd_lines = []
+        self.act_lines = []
+        labels = labels or [f"J{i+1}" for i in range(n_joints)]
+        for i in range(n_joints):
+            ax = self.fig.add_subplot(n_joints, 1, i + 1)
+            ax.set_xlim(-window, 0)
+            lo, hi = y_limits[i] if y_limits else (-180, 180)
+            ax.set_ylim(min(lo, hi) - 5, max(lo, hi) + 5)
+            ax.set_ylabel(labels[i], fontsize=8)
+            ax.tick_params(labelsize=7)
+            ax.grid(True, alpha=0.3)
+            if i < n_joints - 1:
+                ax.tick_params(labelbottom=False)
+            cl, = ax.plot([], [], color='tab:orange', lw=1.2, animated=True, label='Commanded')
+            al, = ax.plot([], [], color='tab:blue', lw=1.2, animated=True, label='Actual')
+            self.axes.append(ax)
+            self.cmd_lines.append(cl)
+            self.act_lines.append(al)
+        self.axes[0].legend(loc='upper left', fontsize=7)
+        self.axes[-1].set_xlabel("Time (s)", fontsize=8)
+        self.fig.tight_layout()
+
+        if master is not None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.canvas = FigureCanvasTkAgg(self.fig, master=master)
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.fig)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Stats
+        self.full_draws = 0
+        self.frames = 0
+        self.redraw_time = 0.0
+        self.redraw_max = 0.0
+
+    def widget(self):
+        return self.canvas.get_tk_widget()
+
+    def _on_draw(self, event=None):
+        # Full redraw happened (first show / resize): re-cache the static background
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def append(self, t, commanded, actual):
+        """Add one sample (lists of length n_joints; None entries are left as gaps)."""
+        i = self.head
+        j = i + self.capacity
+        self.t[i] = self.t[j] = t
+        for k in range(self.n):
+            c = commanded[k] if commanded is not None else None
+            a = actual[k] if actual is not None else None
+            self.cmd[k, i] = self.cmd[k, j] = np.nan if c is None else c
+            self.act[k, i] = self.act[k, j] = np.nan if a is None else a
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def redraw(self, now=None):
+        if self.background is None:
+            # Full draw once (or after a resize); not counted as a blit frame
+            self.canvas.draw()
+            self.full_draws += 1
+        t0 = time.perf_counter()
+        if now is None:
+            now = time.monotonic()
+
+        h = self.head
+        tv = self.t[h:h + self.capacity]
+        np.subtract(tv, now, out=self.x)
+
+        self.canvas.restore_region(self.background)
+        for k in range(self.n):
+            self.cmd_lines[k].set_data(self.x, self.cmd[k, h:h + self.capacity])
+            self.act_lines[k].set_data(self.x, self.act[k, h:h + self.capacity])
+            self.axes[k].draw_artist(self.cmd_lines[k])
+            self.axes[k].draw_artist(self.act_lines[k])
+        self.canvas.blit(self.fig.bbox)
+
+        dt = time.perf_counter() - t0
+        self.frames += 1
+        self.redraw_time += dt
+        self.redraw_max = max(self.redraw_max, dt)
+        return dt
+
+    def stats(self):
+        avg = (self.redraw_time / self.frames * 1000) if self.frames else 0.0
+        return {'frames': self.frames, 'full_draws': self.full_draws, 'redraw_ms_avg': avg, 'redraw_ms_max': self.redraw_max * 1000}
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import os
+import csv
+import json
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+from utils.transport import classify_read
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SESSION_DIR = os.path.join(BASE_DIR, 'data', 'sessions')
+
+
+class StreamReader(threading.Thread):
+    """
+    Reads one arm back-to-back (no sleep) and stamps every sample.
+
+    Logic:
+    1. time.monotonic_ns() is taken right before and right after each read;
+       the sample time is the midpoint, so half the round trip is the
+       worst-case stamping error (kept per sample as read_ns).
+    2. Valid samples go into a deque that the writer drains; only the
+       timestamps are kept for the final rate / skew statistics.
+    3. Invalid reads (None / short / out of range) are counted and retried
+       immediately; exceptions back off 10 ms so a dead port can't spin.
+    """
+
+    def __init__(self, name, read, expected_len, valid_range=200.0):
+        super().__init__(name=f"reader-{name}")
+        self.daemon = True
+        self.stream = name
+        self.read = read
+        self.expected_len = expected_len
+        self.valid_range = valid_range
+        self.samples = deque()       # (t_ns, read_ns, values)
+        self.times = []              # t_ns of every valid sample
+        self.last = None
+        self.stop_event = threading.Event()
+
+        # Stats
+        self.invalid = 0
+        self.errors = 0
+        self.read_ns_max = 0
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            t0 = time.monotonic_ns()
+            try:
+                values = self.read()
+            except Exception:
+                self.errors += 1
+                self.stop_event.wait(0.01)
+                continue
+            t1 = time.monotonic_ns()
+            if classify_read(values, self.expected_len, self.valid_range) is not None:
+                self.invalid += 1
+                continue
+            t = (t0 + t1) // 2
+            self.samples.append((t, t1 - t0, values[:self.expected_len]))
+            self.times.append(t)
+            self.last = values
+            self.read_ns_max = max(self.read_ns_max, t1 - t0)
+
+    def drain(self):
+        out = []
+        while True:
+            try:
+                out.append(self.samples.popleft())
+            except IndexError:
+                return out
+
+    def stats(self):
+        t = np.asarray(self.times, dtype=np.int64)
+        if len(t) < 2:
+            return {'samples': len(t), 'rate_hz': 0.0, 'period_ms_p50': None, 'period_ms_max': None,
+                    'invalid': self.invalid, 'errors': self.errors, 'read_ms_max': self.read_ns_max / 1e6}
+        dt = np.diff(t) / 1e6
+        return {'samples': len(t), 'rate_hz': (len(t) - 1) / ((t[-1] - t[0]) / 1e9),
+                'period_ms_p50': float(np.median(dt)), 'period_ms_max': float(dt.max()),
+                'invalid': self.invalid, 'errors': self.errors, 'read_ms_max': self.read_ns_max / 1e6}
+
+
+def stream_skew(a_ns, b_ns):
+    """
+    Inter-stream skew: for every sample of stream A, the distance (ms) to the
+    nearest sample of stream B. This is the worst alignment error a
+    nearest-sample pairing would make; interpolation does better.
+    """
+    a = np.asarray(a_ns, dtype=np.int64)
+    b = np.asarray(b_ns, dtype=np.int64)
+    if not len(a) or not len(b):
+        return None
+    idx = np.searchsorted(b, a)
+    after = b[np.minimum(idx, len(b) - 1)]
+    before = b[np.maximum(idx - 1, 0)]
+    near = np.minimum(np.abs(a - after), np.abs(a - before)) / 1e6
+    return {'p50_ms': float(np.median(near)), 'p95_ms': float(np.percentile(near, 95)),
+            'max_ms': float(near.max()),
+            'start_offset_ms': float((b[0] - a[0]) / 1e6)}
+
+
+class SyncRecorder:
+    """
+    Records the C650 (leader) and M750 (follower) into one session on a
+    shared time.monotonic_ns clock.
+
+    Logic:
+    1. One StreamReader thread per arm, each on its own serial port, so the
+       two streams run at whatever rate each port sustains and one slow
+       reply never delays the other arm.
+    2. The caller's loop calls flush() periodically; new samples of both
+       streams are appended to one CSV:
+         Stream, T_ns, Read_ns, J1..J7
+       T_ns is relative to the session start (same origin for both streams).
+    3. close() stops the readers, writes the last rows and a JSON sidecar
+       with per-stream rate / jitter / invalid reads and the inter-stream
+       skew, and returns that summary.
+    """
+
+    HEADER = ['Stream', 'T_ns', 'Read_ns', 'J1', 'J2', 'J3', 'J4', 'J5', 'J6', 'J7']
+
+    def __init__(self, leader_read, follower_read, path, leader_len=7, follower_len=6):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.HEADER)
+        self.readers = [StreamReader('leader', leader_read, leader_len),
+                        StreamReader('follower', follower_read, follower_len)]
+        self.t0_ns = None
+        self.t_end_ns = None
+        self.rows = 0
+
+    def start(self):
+        self.t0_ns = time.monotonic_ns()
+        for r in self.readers:
+            r.start()
+
+    def flush(self):
+        """Write everything sampled since the last flush. Returns rows written."""
+        rows = []
+        for r in self.readers:
+            for t, read_ns, values in r.drain():
+                rows.append((t, r.stream, read_ns, values))
+        rows.sort(key=lambda x: x[0])
+        for t, stream, read_ns, values in rows:
+            self.writer.writerow([stream, t - self.t0_ns, read_ns] + [f"{v:.2f}" for v in values])
+        self.file.flush()
+        self.rows += len(rows)
+        return len(rows)
+
+    def latest(self, stream):
+        r = self.readers[0] if stream == 'leader' else self.readers[1]
+        return r.last
+
+    def stats(self):
+        leader, follower = self.readers
+        end = self.t_end_ns or time.monotonic_ns()
+        duration = (end - self.t0_ns) / 1e9 if self.t0_ns else 0.0
+        return {'duration_s': duration, 'leader': leader.stats(), 'follower': follower.stats(),
+                'skew': stream_skew(leader.times, follower.times)}
+
+    def close(self):
+        for r in self.readers:
+            r.stop()
+        for r in self.readers:
+            if r.is_alive():
+                r.join(timeout=1.0)
+        self.t_end_ns = time.monotonic_ns()
+        self.flush()
+        self.file.close()
+        summary = self.stats()
+        summary['file'] = os.path.basename(self.path)
+        with open(os.path.splitext(self.path)[0] + ".json", 'w') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def report(self):
+        st = self.stats()
+        print(f"\n--- Sync Session ({st['duration_s']:.1f}s, {self.rows} rows) ---")
+        for name in ('leader', 'follower'):
+            s = st[name]
+            p50 = f"{s['period_ms_p50']:.1f}" if s['period_ms_p50'] is not None else "n/a"
+            pmax = f"{s['period_ms_max']:.1f}" if s['period_ms_max'] is not None else "n/a"
+            print(f"{name:<8}: {s['samples']} samples @ {s['rate_hz']:.1f} Hz | period p50 {p50} ms, "
+                  f"max {pmax} ms | invalid {s['invalid']}, errors {s['errors']} | read max {s['read_ms_max']:.1f} ms")
+        sk = st['skew']
+        if sk:
+            print(f"Skew (leader -> nearest follower sample): p50 {sk['p50_ms']:.2f} ms, "
+                  f"p95 {sk['p95_ms']:.2f} ms, max {sk['max_ms']:.2f} ms")
+
+
+def load_session(path, leader_len=7, follower_len=6):
+    """
+    Read a session CSV back into per-stream arrays.
+    Returns {'leader': (t_s, angles), 'follower': (t_s, angles)} with times in
+    seconds on the shared session clock. A stream without samples comes back
+    as (0,) times and (0, n_joints) angles, so column slicing still works.
+    """
+    widths = {'leader': leader_len, 'follower': follower_len}
+    streams = {'leader': ([], []), 'follower': ([], [])}
+    with open(path, 'r') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            try:
+                t = int(row[1]) / 1e9
+                values = [float(x) for x in row[3:] if x != '']
+            except (ValueError, IndexError):
+                continue
+            if row[0] in streams:
+                streams[row[0]][0].append(t)
+                streams[row[0]][1].append(values)
+    return {k: (np.asarray(t, dtype=float), np.asarray(v) if v else np.empty((0, widths[k])))
+            for k, (t, v) in streams.items()}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+
+
+class Task:
+    def __init__(self, name, fn, rate_hz, priority=0):
+        self.name = name
+        self.fn = fn
+        self.period = 1.0 / rate_hz
+        self.priority = priority
+        self.next_due = None
+        self.waiting = False     # deferred: sleeps until it must run anyway
+
+        # Stats
+        self.runs = 0
+        self.misses = 0
+        self.deferred = 0
+        self.cost_est = 0.0
+        self.cost_max = 0.0
+        self.late_max = 0.0
+
+
+class RateScheduler:
+    """
+    Cooperative multi-rate scheduler for a single control thread.
+
+    Every serial transaction happens on the caller's thread, one task at a
+    time, so arm / gripper / feedback / telemetry traffic is interleaved
+    instead of all running at the loop rate.
+
+    Logic:
+    1. Each task has its own rate and a priority (0 = most important).
+    2. run_once() runs due tasks in priority order.
+    3. A lower-priority task is deferred if its estimated cost (EMA of past
+       runs) would push it past the next deadline of a more important task.
+       A task deferred for half a period runs anyway, so nothing starves and
+       it stays on its own rate grid.
+    4. Between tasks we sleep until the earliest deadline (never busy-spin).
+       A deferred task's own (past) deadline doesn't count: the loop sleeps
+       until the task that blocked it is due, or until the deferred task
+       must run anyway.
+    """
+
+    def __init__(self, alpha=0.2):
+        self.tasks = []
+        self.alpha = alpha
+        self.running = True
+
+    def add(self, name, fn, rate_hz, priority=0):
+        task = Task(name, fn, rate_hz, priority)
+        self.tasks.append(task)
+        self.tasks.sort(key=lambda t: t.priority)
+        return task
+
+    def stop(self):
+        self.running = False
+
+    def run_once(self, now=None):
+        """Run every task that is due. Returns the number of tasks run."""
+        if now is None:
+            now = time.monotonic()
+        for task in self.tasks:
+            if task.next_due is None:
+                task.next_due = now
+
+        ran = 0
+        for task in self.tasks:
+            now = time.monotonic()
+            if task.next_due > now:
+                continue
+
+            overdue = now - task.next_due
+            if overdue < task.period / 2 and self._would_block(task, now):
+                task.deferred += 1
+                task.waiting = True
+                continue
+            task.waiting = False
+
+            t0 = time.monotonic()
+            try:
+                task.fn()
+            finally:
+                cost = time.monotonic() - t0
+                task.runs += 1
+                task.cost_est += self.alpha * (cost - task.cost_est)
+                task.cost_max = max(task.cost_max, cost)
+                task.late_max = max(task.late_max, overdue)
+
+                # Next deadline on the task's own grid; resync if a whole period was lost
+                task.next_due += task.period
+                if task.next_due < t0:
+                    task.misses += 1
+                    task.next_due = t0 + task.period
+            ran += 1
+        return ran
+
+    def _would_block(self, task, now):
+        for other in self.tasks:
+            if other.priority >= task.priority:
+                break
+            if now + task.cost_est > other.next_due:
+                return True
+        return False
+
+    def next_deadline(self):
+        due = [t.next_due + t.period / 2 if t.waiting else t.next_due
+               for t in self.tasks if t.next_due is not None]
+        return min(due) if due else time.monotonic()
+
+    def sleep_until_next(self):
+        delay = self.next_deadline() - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self):
+        """Run until stop() is called (exceptions propagate to the caller)."""
+        self.running = True
+        while self.running:
+            self.run_once()
+            self.sleep_until_next()
+
+    def stats(self, elapsed=None):
+        """Per-task summary dict (for dashboards / logs)."""
+        return {
+            t.name: {
+                'hz': (t.runs / elapsed) if elapsed else None,
+                'cost_ms': t.cost_est * 1000,
+                'late_ms': t.late_max * 1000,
+                'missed': t.misses,
+                'deferred': t.deferred,
+            }
+            for t in self.tasks
+        }
+
+    def report(self, elapsed=None):
+        print("\n--- Scheduler Report ---")
+        print(f"{'Task':<10} | {'Rate (Hz)':<9} | {'Achieved':<8} | {'Cost avg/max (ms)':<17} | {'Late max (ms)':<13} | {'Missed':<6} | {'Deferred':<8}")
+        for t in self.tasks:
+            achieved = f"{t.runs / elapsed:.1f}" if elapsed else "-"
+            print(f"{t.name:<10} | {1.0/t.period:<9.1f} | {achieved:<8} | "
+                  f"{t.cost_est*1000:>6.2f} / {t.cost_max*1000:<8.2f} | {t.late_max*1000:<13.1f} | {t.misses:<6} | {t.deferred:<8}")
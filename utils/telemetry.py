@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import queue
+import threading
+
+
+class TelemetryPoller(threading.Thread):
+    """
+    Background state reader for the Tk GUIs.
+
+    Logic:
+    1. Every tick this thread does ONE get_angles() read (plus an
+       is_powered_on() read every `power_every` ticks) and packs the result
+       into a snapshot dict.
+    2. Snapshots go into a small queue. If the GUI falls behind, the oldest
+       snapshot is dropped, never the newest.
+    3. The GUI calls latest() from a root.after() callback, so Tk widgets are
+       only ever touched on the Tk thread, and a slow serial reply can only
+       delay the data, never the UI.
+
+    Snapshot: {'t': monotonic, 'angles': list|None, 'powered': bool|None,
+               'read_ms': float}
+    """
+
+    def __init__(self, arm, rate_hz=10.0, power_every=10, maxsize=4):
+        super().__init__()
+        self.daemon = True
+        self.arm = arm
+        self.period = 1.0 / rate_hz
+        self.power_every = power_every
+        self.snapshots = queue.Queue(maxsize=maxsize)
+        self.stop_event = threading.Event()
+
+        # Stats
+        self.ticks = 0
+        self.failed = 0
+        self.dropped = 0
+        self.read_time = 0.0
+        self.read_time_max = 0.0
+
+    def stop(self):
+        self.stop_event.set()
+
+    def poll(self):
+        """One tick: read state and publish a snapshot."""
+        snap = {'t': time.monotonic(), 'angles': None, 'powered': None}
+        t0 = time.monotonic()
+        try:
+            angles = self.arm.get_angles()
+            if isinstance(angles, list) and angles:
+                snap['angles'] = angles
+            else:
+                self.failed += 1
+            if self.power_every and self.ticks % self.power_every == 0:
+                snap['powered'] = self.arm.is_powered_on() == 1
+        except Exception:
+            self.failed += 1
+        dt = time.monotonic() - t0
+        snap['read_ms'] = dt * 1000
+
+        self.ticks += 1
+        self.read_time += dt
+        self.read_time_max = max(self.read_time_max, dt)
+        self._publish(snap)
+
+    def _publish(self, snap):
+        while True:
+            try:
+                self.snapshots.put_nowait(snap)
+                return
+            except queue.Full:
+                try:
+                    self.snapshots.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def latest(self):
+        """
+        Drain the queue (call from the GUI thread).
+        Returns the newest snapshot, with 'powered' carried from the newest
+        snapshot that had it, or None if nothing new arrived.
+        """
+        snap = None
+        powered = None
+        while True:
+            try:
+                s = self.snapshots.get_nowait()
+            except queue.Empty:
+                break
+            if s['powered'] is not None:
+                powered = s['powered']
+            snap = s
+        if snap is not None and snap['powered'] is None:
+            snap['powered'] = powered
+        return snap
+
+    def run(self):
+        next_t = time.monotonic()
+        while not self.stop_event.is_set():
+            self.poll()
+            next_t += self.period
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                self.stop_event.wait(delay)
+            else:
+                next_t = time.monotonic()
+
+    def report(self):
+        avg = (self.read_time / self.ticks * 1000) if self.ticks else 0.0
+        print(f"Telemetry: ticks={self.ticks} failed={self.failed} dropped={self.dropped} "
+              f"read={avg:.1f}ms avg / {self.read_time_max*1000:.1f}ms max")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import sys
+import time
+import threading
+
+CSI = "\033["
+
+
+class TerminalDashboard(threading.Thread):
+    """
+    Flicker-free console dashboard shared by the monitor scripts.
+
+    Logic:
+    1. A fixed refresh timer (`refresh_hz`, own thread) calls render(),
+       which returns the dashboard as a list of text lines built from the
+       newest data. The data rate (serial reads) does not matter.
+    2. The previous frame is kept as a screen model. Only runs of cells that
+       changed are written, each prefixed with a cursor-position escape.
+       Shorter lines are blanked with spaces, so nothing is left behind.
+    3. The whole frame goes out in ONE buffered write + flush. The screen is
+       cleared once at start (no `clear` subprocess, no cursor-up tricks),
+       then fully repainted every `full_every` seconds so stray prints
+       (errors, watchdog messages) cannot leave the screen corrupted.
+
+    CPU time (thread_time) and bytes are measured for every refresh.
+    """
+
+    def __init__(self, render, refresh_hz=10.0, stream=None, full_every=5.0):
+        super().__init__()
+        self.daemon = True
+        self.render = render
+        self.period = 1.0 / refresh_hz
+        self.stream = stream or sys.stdout
+        self.full_every = full_every
+        self.stop_event = threading.Event()
+
+        self.screen = []            # Last frame written (list of strings)
+        self.last_full = None
+
+        # Stats
+        self.refreshes = 0
+        self.full_frames = 0
+        self.cpu_time = 0.0
+        self.cpu_max = 0.0
+        self.bytes_out = 0
+        self.bytes_full = 0         # What a full repaint of every frame would have cost
+
+    def stop(self):
+        self.stop_event.set()
+
+    def diff(self, lines, full=False):
+        """Escape sequence turning the current screen model into `lines`."""
+        out = []
+        if full:
+            out.append(CSI + "2J")
+            old = []
+        else:
+            old = self.screen
+
+        rows = max(len(lines), len(old))
+        for r in range(rows):
+            new = lines[r] if r < len(lines) else ""
+            prev = old[r] if r < len(old) else ""
+            if new == prev:
+                continue
+            if full:
+                out.append(f"{CSI}{r + 1};1H{new}")
+                continue
+            width = max(len(new), len(prev))
+            new = new.ljust(width)
+            prev = prev.ljust(width)
+
+            # Emit each run of changed cells
+            c = 0
+            while c < width:
+                if new[c] == prev[c]:
+                    c += 1
+                    continue
+                start = c
+                while c < width and new[c] != prev[c]:
+                    c += 1
+                out.append(f"{CSI}{r + 1};{start + 1}H{new[start:c]}")
+
+        # Park the cursor below the dashboard
+        out.append(f"{CSI}{len(lines) + 1};1H")
+        self.screen = list(lines)
+        return "".join(out)
+
+    def refresh(self, now=None):
+        """Render + write one frame. Returns the number of bytes written."""
+        if now is None:
+            now = time.monotonic()
+        t0 = time.thread_time()
+        lines = self.render()
+        if lines is None:
+            return 0
+
+        full = self.last_full is None or (self.full_every and now - self.last_full >= self.full_every)
+        if full:
+            self.last_full = now
+            self.full_frames += 1
+        frame = self.diff(lines, full=full)
+        self.stream.write(frame)
+        self.stream.flush()
+
+        dt = time.thread_time() - t0
+        self.refreshes += 1
+        self.cpu_time += dt
+        self.cpu_max = max(self.cpu_max, dt)
+        self.bytes_out += len(frame)
+        self.bytes_full += sum(len(line) + 1 for line in lines)
+        return len(frame)
+
+    def run(self):
+        self.stream.write(CSI + "?25l")  # Hide cursor while drawing
+        next_t = time.monotonic()
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    self.refresh()
+                except Exception as e:
+                    self.stream.write(f"\nDashboard error: {e}\n")
+                next_t += self.period
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    self.stop_event.wait(delay)
+                else:
+                    next_t = time.monotonic()
+        finally:
+            self.stream.write(f"{CSI}{len(self.screen) + 1};1H{CSI}?25h\n")
+            self.stream.flush()
+
+    def close(self):
+        """Stop the refresh thread and leave the cursor below the dashboard."""
+        self.stop()
+        if self.is_alive():
+            self.join(timeout=1.0)
+
+    def stats(self):
+        n = self.refreshes
+        return {
+            'refreshes': n,
+            'full_frames': self.full_frames,
+            'cpu_us_avg': (self.cpu_time / n * 1e6) if n else 0.0,
+            'cpu_us_max': self.cpu_max * 1e6,
+            'bytes_avg': (self.bytes_out / n) if n else 0.0,
+            'bytes_full_avg': (self.bytes_full / n) if n else 0.0,
+        }
+
+    def report(self):
+        st = self.stats()
+        print(f"Dashboard: {st['refreshes']} refreshes ({st['full_frames']} full) | "
+              f"CPU {st['cpu_us_avg']:.0f}us avg / {st['cpu_us_max']:.0f}us max per refresh | "
+              f"{st['bytes_avg']:.0f} B/frame (full repaint {st['bytes_full_avg']:.0f} B)")
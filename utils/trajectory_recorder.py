@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+
+from utils.transport import classify_read, Backoff, ERR_IO
+from utils.rate_stats import RateStats
+
+
+class TrajectoryRecorder:
+    """
+    Max-rate M750 trajectory recorder with a decimated gripper poll.
+
+    Logic:
+    1. Joints are read back-to-back with no sleep, so the sample rate is
+       whatever the serial link sustains.
+    2. The gripper costs a second round trip, so it is only read when
+       1 / gripper_hz has passed since the last gripper read; its value is
+       carried forward into every joint row in between.
+    3. Every kept joint read becomes one CSV row
+         Timestamp (s since start, monotonic clock), J1..J6, Gripper
+       Reads that fail (None / short / out of range / OSError) are dropped
+       and counted by kind in RateStats.
+    4. OSErrors back off (transport.Backoff); after `max_io_errors` in a row
+       the port is considered lost and run() returns with link_lost set.
+    """
+
+    def __init__(self, arm, writer, gripper_hz=2.0, status=None, status_hz=2.0, max_io_errors=20,
+                 backoff=None, sleep=time.sleep):
+        self.arm = arm
+        self.writer = writer
+        self.gripper_period = 1.0 / gripper_hz if gripper_hz else None
+        self.status = status
+        self.status_period = 1.0 / status_hz
+        self.gripper_value = 0
+        self.joints = RateStats()
+        self.gripper = RateStats()
+        self.t0 = None
+        self.max_io_errors = max_io_errors
+        self.backoff = backoff or Backoff()
+        self.sleep = sleep
+        self.io_errors = 0
+        self.link_lost = False
+
+    def _poll_gripper(self, now):
+        try:
+            value = self.arm.get_gripper_value()
+        except OSError:
+            self.gripper.drop(ERR_IO)
+            return
+        if isinstance(value, (int, float)) and value >= 0:
+            self.gripper_value = value
+            self.gripper.tick(now)
+        else:
+            self.gripper.drop('invalid')
+
+    def run(self, duration=None, stop_event=None):
+        """Record until `duration` seconds pass, stop_event is set, the port is lost, or KeyboardInterrupt."""
+        self.t0 = time.monotonic()
+        next_gripper = self.t0
+        next_status = self.t0
+        while True:
+            now = time.monotonic()
+            if duration is not None and now - self.t0 >= duration:
+                break
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            if self.gripper_period and now >= next_gripper:
+                self._poll_gripper(now)
+                next_gripper += self.gripper_period
+                if next_gripper < now:
+                    next_gripper = now + self.gripper_period
+
+            try:
+                angles = self.arm.get_angles()
+            except OSError:
+                self.joints.drop(ERR_IO)
+                self.io_errors += 1
+                if self.io_errors >= self.max_io_errors:
+                    self.link_lost = True
+                    break
+                self.sleep(self.backoff.next())
+                continue
+            self.io_errors = 0
+            self.backoff.reset()
+            t = time.monotonic()
+            err = classify_read(angles, 6)
+            if err:
+                self.joints.drop(err)
+                continue
+            self.joints.tick(t)
+            self.writer.writerow([f"{t - self.t0:.4f}"] + angles[:6] + [self.gripper_value])
+
+            if self.status and t >= next_status:
+                self.status(t - self.t0, angles)
+                next_status = t + self.status_period
+
+    def stats(self):
+        return {'joints': self.joints.stats(), 'gripper': self.gripper.stats()}
+
+    def report(self):
+        print("\n--- Recording Report ---")
+        self.joints.report("Joints ")
+        self.gripper.report("Gripper")
+        if self.link_lost:
+            print(f"Stopped: port lost ({self.io_errors} I/O errors in a row)")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import threading
+
+# Error classes (what went wrong on the wire)
+ERR_NONE = 'none'           # Read returned None (timeout / no reply)
+ERR_SHORT = 'short'         # Read returned fewer values than expected
+ERR_INVALID = 'invalid'     # Values out of physical range (corrupted frame)
+ERR_IO = 'io'               # OSError from the serial port
+ERR_DISCONNECTED = 'disconnected'
+
+ERROR_KINDS = (ERR_NONE, ERR_SHORT, ERR_INVALID, ERR_IO, ERR_DISCONNECTED)
+
+
+def classify_read(result, expected_len, valid_range=200.0):
+    """Return an error kind for a read result, or None if it is usable."""
+    if result is None:
+        return ERR_NONE
+    if not isinstance(result, list) or len(result) < expected_len:
+        return ERR_SHORT
+    if valid_range is not None and (max(result) > valid_range or min(result) < -valid_range):
+        return ERR_INVALID
+    return None
+
+
+class Backoff:
+    """Bounded exponential backoff. The delay is never zero, so callers cannot busy-spin."""
+
+    def __init__(self, base=0.005, factor=2.0, max_delay=0.5):
+        self.base = base
+        self.factor = factor
+        self.max_delay = max_delay
+        self.delay = base
+
+    def next(self):
+        d = self.delay
+        self.delay = min(self.delay * self.factor, self.max_delay)
+        return d
+
+    def reset(self):
+        self.delay = self.base
+
+
+def _close_port(client):
+    try:
+        client._serial_port.close()
+    except Exception:
+        pass
+
+
+class ResilientArm:
+    """
+    Fault-tolerant wrapper around a pymycobot client (MyArmC / MyArmMControl).
+
+    Logic:
+    1. Every call goes through call(): OSErrors are classified and counted
+       instead of propagating into the control loop.
+    2. read() additionally validates the frame (None / short / out of range)
+       and returns None for anything unusable, after a bounded backoff sleep
+       so a failing device can never busy-spin a core.
+    3. After `max_io_errors` consecutive OSErrors the link is declared down
+       and a background thread reconnects (re-finding the port by USB
+       identity if it re-enumerated). Meanwhile writes are dropped, so the
+       follower simply holds its last commanded pose. `on_down(arm)` is
+       called once per outage, on the thread that hit the last error (keep
+       it short).
+    4. Counters: reads, errors per kind, retries, reconnects, time spent
+       disconnected and CPU time spent inside the wrapper.
+
+    Any other client method is available as an attribute and guarded the
+    same way, e.g. arm.write_angles(angles, speed).
+    """
+
+    def __init__(self, connect, port, read_method='get_joints_angle', expected_len=7,
+                 valid_range=200.0, max_io_errors=3, backoff=None, port_finder=None,
+                 client=None, sleep=time.sleep, on_down=None):
+        self.connect = connect
+        self.port = port
+        self.read_method = read_method
+        self.expected_len = expected_len
+        self.valid_range = valid_range
+        self.max_io_errors = max_io_errors
+        self.backoff = backoff or Backoff()
+        self.reconnect_backoff = Backoff(base=0.1, max_delay=2.0)
+        self.port_finder = port_finder
+        self.sleep = sleep
+        self.on_down = on_down
+
+        self.client = client if client is not None else connect(port)
+        self.connected = True
+        self.lock = threading.Lock()
+        self.reconnect_thread = None
+        self.running = True
+        self.consecutive_io = 0
+        self.last_error = None
+        self.down_since = None
+
+        # Counters
+        self.reads = 0
+        self.ok_reads = 0
+        self.writes = 0
+        self.dropped_writes = 0
+        self.retries = 0
+        self.errors = {k: 0 for k in ERROR_KINDS}
+        self.reconnects = 0
+        self.reconnect_time = 0.0
+        self.cpu_time = 0.0
+
+    # --- Calls ---
+    def call(self, name, *args, **kwargs):
+        """Call a client method. Returns its result, or None if the link failed."""
+        cpu0 = time.thread_time()
+        self.last_error = None
+        try:
+            if not self.connected:
+                self.last_error = ERR_DISCONNECTED
+                self.errors[ERR_DISCONNECTED] += 1
+                return None
+            try:
+                result = getattr(self.client, name)(*args, **kwargs)
+            except OSError:
+                self.last_error = ERR_IO
+                self.errors[ERR_IO] += 1
+                self.consecutive_io += 1
+                if self.consecutive_io >= self.max_io_errors:
+                    self._mark_down()
+                return None
+            self.consecutive_io = 0
+            return result
+        finally:
+            self.cpu_time += time.thread_time() - cpu0
+
+    def read(self):
+        """Validated read. Returns the angle list, or None (after a backoff sleep)."""
+        self.reads += 1
+        result = self.call(self.read_method)
+        if self.last_error is None:
+            kind = classify_read(result, self.expected_len, self.valid_range)
+            if kind is None:
+                self.ok_reads += 1
+                self.backoff.reset()
+                return result
+            self.errors[kind] += 1
+        self.retries += 1
+        self.sleep(self.backoff.next())
+        return None
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the wrapper itself
+        if name.startswith('_') or name in ('client', 'connect'):
+            raise AttributeError(name)
+
+        def guarded(*args, **kwargs):
+            if name.startswith(('write_', 'send_', 'set_')):
+                if not self.connected:
+                    self.dropped_writes += 1
+                    return None
+                self.writes += 1
+            return self.call(name, *args, **kwargs)
+        return guarded
+
+    # --- Reconnect ---
+    def _mark_down(self):
+        with self.lock:
+            if not self.connected:
+                return
+            self.connected = False
+            self.down_since = time.monotonic()
+            self.reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
+            self.reconnect_thread.start()
+        if self.on_down:
+            self.on_down(self)
+
+    def _reconnect_loop(self):
+        self.reconnect_backoff.reset()
+        _close_port(self.client)
+        while self.running:
+            port = self.port_finder() if self.port_finder else self.port
+            if port:
+                client = None
+                try:
+                    client = self.connect(port)
+                    # Probe: the link is only back once a full, valid read succeeds
+                    # (a reply of the wrong length means another device took the port)
+                    probe = getattr(client, self.read_method)()
+                    if (classify_read(probe, self.expected_len, self.valid_range) is None
+                            and len(probe) == self.expected_len):
+                        with self.lock:
+                            self.client = client
+                            self.port = port
+                            self.consecutive_io = 0
+                            self.reconnects += 1
+                            self.reconnect_time += time.monotonic() - self.down_since
+                            self.down_since = None
+                            self.connected = True
+                        return
+                except Exception:
+                    pass # Port not back yet (SerialException, OSError, ...)
+                _close_port(client)   # Candidate not adopted: don't leak its handle
+            time.sleep(self.reconnect_backoff.next())
+
+    def wait_connected(self, timeout=None):
+        end = None if timeout is None else time.monotonic() + timeout
+        while not self.connected:
+            if end is not None and time.monotonic() > end:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self):
+        self.running = False
+        _close_port(self.client)
+
+    # --- Stats ---
+    def stats(self):
+        down = self.reconnect_time
+        if self.down_since is not None:
+            down += time.monotonic() - self.down_since
+        return {
+            'port': self.port,
+            'reads': self.reads,
+            'ok_reads': self.ok_reads,
+            'writes': self.writes,
+            'dropped_writes': self.dropped_writes,
+            'retries': self.retries,
+            'errors': dict(self.errors),
+            'reconnects': self.reconnects,
+            'disconnected_s': down,
+            'cpu_s': self.cpu_time,
+        }
+
+    def report(self, label="Link"):
+        st = self.stats()
+        errs = ", ".join(f"{k}={v}" for k, v in st['errors'].items() if v)
+        print(f"{label} [{st['port']}]: reads={st['reads']} ok={st['ok_reads']} retries={st['retries']} "
+              f"writes={st['writes']} dropped={st['dropped_writes']} reconnects={st['reconnects']} "
+              f"down={st['disconnected_s']:.2f}s cpu={st['cpu_s']*1000:.1f}ms"
+              + (f" errors: {errs}" if errs else ""))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import time
+import threading
+
+
+class CommWatchdog(threading.Thread):
+    """
+    Communication-loss watchdog for the teleop loop.
+
+    Logic:
+    1. The loop calls feed_leader() after every valid leader frame and
+       feed_follower() after every acknowledged follower write
+       (time.monotonic timestamps, so wall-clock jumps don't matter).
+    2. This thread checks both ages every `check_period`. If either exceeds
+       `timeout`, it trips once and calls on_trip(reason) from this thread,
+       so the reaction does not depend on the (possibly stuck) control loop.
+    3. Recovery depends on what tripped it, and needs the link healthy for
+       `recover_checks` consecutive checks (hysteresis), then calls
+       on_recover(reason):
+       - 'leader': leader frames are fresh again. The follower age is reset,
+         since no writes are sent while tripped.
+       - 'follower': no writes are sent while tripped either, so a fresh ack
+         has to come from `follower_probe()` (e.g. a validated angle read),
+         which this thread calls at most once per `timeout`.
+
+    Reaction latency is measured per trip:
+      detect = trip time - (last frame + timeout)   -> watchdog overshoot
+      action = time spent inside on_trip()         -> e.g. serial stop
+    """
+
+    def __init__(self, timeout=0.1, check_period=None, on_trip=None, on_recover=None,
+                 watch_follower=True, follower_probe=None, recover_checks=3):
+        super().__init__()
+        self.daemon = True
+        self.timeout = timeout
+        self.check_period = check_period or timeout / 10.0
+        self.on_trip = on_trip
+        self.on_recover = on_recover
+        self.watch_follower = watch_follower
+        self.follower_probe = follower_probe
+        self.recover_checks = recover_checks
+
+        self.stop_event = threading.Event()
+        now = time.monotonic()
+        self.last_leader = now
+        self.last_follower = now
+        self.tripped = False
+        self.trip_reason = None
+        self.healthy_checks = 0
+        self.last_probe = now
+
+        # Stats
+        self.trips = 0
+        self.detect_max = 0.0
+        self.action_max = 0.0
+        self.reactions = []     # (reason, detect_s, action_s)
+
+    def feed_leader(self):
+        self.last_leader = time.monotonic()
+
+    def feed_follower(self):
+        self.last_follower = time.monotonic()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def check(self, now=None):
+        """One watchdog evaluation (split out for testing). Returns True if it tripped now."""
+        if now is None:
+            now = time.monotonic()
+        leader_age = now - self.last_leader
+        follower_age = now - self.last_follower
+
+        if self.tripped:
+            if self._healthy(now):
+                self.healthy_checks += 1
+            else:
+                self.healthy_checks = 0
+            if self.healthy_checks >= self.recover_checks:
+                reason = self.trip_reason
+                self.tripped = False
+                self.trip_reason = None
+                self.healthy_checks = 0
+                self.last_follower = now
+                if self.on_recover:
+                    self.on_recover(reason)
+            return False
+
+        reason, last = None, None
+        if leader_age > self.timeout:
+            reason, last = 'leader', self.last_leader
+        elif self.watch_follower and follower_age > self.timeout:
+            reason, last = 'follower', self.last_follower
+        if reason is None:
+            return False
+
+        self.tripped = True
+        self.trip_reason = reason
+        self.healthy_checks = 0
+        self.trips += 1
+        detect = now - (last + self.timeout)
+
+        t0 = time.monotonic()
+        if self.on_trip:
+            try:
+                self.on_trip(reason)
+            except Exception as e:
+                print(f"Watchdog action failed: {e}")
+        action = time.monotonic() - t0
+
+        self.detect_max = max(self.detect_max, detect)
+        self.action_max = max(self.action_max, action)
+        self.reactions.append((reason, detect, action))
+        return True
+
+    def _healthy(self, now):
+        if now - self.last_leader > self.timeout:
+            return False
+        if self.trip_reason != 'follower':
+            return True
+        if self.follower_probe and now - self.last_probe >= self.timeout:
+            self.last_probe = now
+            try:
+                if self.follower_probe():
+                    self.last_follower = now
+            except Exception as e:
+                print(f"Watchdog follower probe failed: {e}")
+        return now - self.last_follower <= self.timeout
+
+    def run(self):
+        while not self.stop_event.wait(self.check_period):
+            self.check()
+
+    def report(self):
+        print("\n--- Watchdog Report ---")
+        print(f"Timeout: {self.timeout*1000:.0f} ms, check period: {self.check_period*1000:.1f} ms")
+        print(f"Trips: {self.trips}")
+        if self.reactions:
+            worst = max(d + a for _, d, a in self.reactions)
+            print(f"Detect overshoot max: {self.detect_max*1000:.1f} ms | Action max: {self.action_max*1000:.1f} ms")
+            print(f"Worst-case reaction (last frame -> action done): {(self.timeout + worst)*1000:.1f} ms")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>MyArm Teleop</title>
+<style>
+body { font-family: Helvetica, sans-serif; margin: 12px; background: #fafafa; }
+#grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px; }
+canvas { background: #fff; border: 1px solid #ccc; width: 100%; height: 140px; }
+table { border-collapse: collapse; margin-top: 10px; font-size: 13px; }
+td, th { border: 1px solid #ccc; padding: 2px 8px; text-align: right; }
+.in { color: #1f77b4; } .out { color: #ff7f0e; }
+#status { color: #888; }
+</style></head><body>
+<h3>Teleop: <span class="in">Input (C650)</span> / <span class="out">Output (M750)</span>
+ <span id="status">connecting...</span></h3>
+<div id="grid"></div>
+<table id="joints"></table>
+<table id="loop"></table>
+<script>
+const WINDOW = 10.0, N = 6;
+const hist = [];
+const grid = document.getElementById('grid');
+const canvases = [];
+for (let i = 0; i < N; i++) {
+  const c = document.createElement('canvas');
+  c.width = 400; c.height = 140;
+  grid.appendChild(c); canvases.push(c);
+}
+function plot(k, now) {
+  const c = canvases[k], g = c.getContext('2d');
+  g.clearRect(0, 0, c.width, c.height);
+  let lo = Infinity, hi = -Infinity;
+  for (const f of hist) {
+    lo = Math.min(lo, f.in[k], f.out[k]); hi = Math.max(hi, f.in[k], f.out[k]);
+  }
+  if (!isFinite(lo)) return;
+  if (hi - lo < 10) { const m = (hi + lo) / 2; lo = m - 5; hi = m + 5; }
+  const X = t => c.width * (1 - (now - t) / WINDOW);
+  const Y = v => c.height - 4 - (c.height - 8) * (v - lo) / (hi - lo);
+  for (const [key, color] of [['in', '#1f77b4'], ['out', '#ff7f0e']]) {
+    g.strokeStyle = color; g.beginPath();
+    hist.forEach((f, j) => j ? g.lineTo(X(f.t), Y(f[key][k])) : g.moveTo(X(f.t), Y(f[key][k])));
+    g.stroke();
+  }
+  g.fillStyle = '#333';
+  g.fillText('J' + (k + 1) + '  [' + lo.toFixed(0) + ', ' + hi.toFixed(0) + ']', 4, 12);
+}
+function table(f) {
+  let h = '<tr><th>Joint</th><th>Input</th><th>Norm (%)</th><th>Output</th></tr>';
+  for (let i = 0; i < N; i++)
+    h += '<tr><td>J' + (i + 1) + '</td><td>' + f.in[i].toFixed(1) + '</td><td>' +
+         (f.norm[i] * 100).toFixed(0) + '</td><td>' + f.out[i].toFixed(1) + '</td></tr>';
+  h += '<tr><td>Grip</td><td>' + (f.in.length > 6 ? f.in[6].toFixed(1) : '-') +
+       '</td><td></td><td>' + f.grip + '</td></tr>';
+  document.getElementById('joints').innerHTML = h;
+  let l = '<tr><th>Task</th><th>Hz</th><th>Cost (ms)</th><th>Late max (ms)</th><th>Missed</th></tr>';
+  for (const [name, s] of Object.entries(f.loop || {}))
+    l += '<tr><td>' + name + '</td><td>' + s.hz + '</td><td>' + s.cost_ms + '</td><td>' +
+         s.late_ms + '</td><td>' + s.missed + '</td></tr>';
+  document.getElementById('loop').innerHTML = l;
+}
+const es = new EventSource('/stream');
+es.onopen = () => document.getElementById('status').textContent = 'live';
+es.onerror = () => document.getElementById('status').textContent = 'disconnected';
+es.onmessage = ev => {
+  const f = JSON.parse(ev.data);
+  hist.push(f);
+  while (hist.length && f.t - hist[0].t > WINDOW) hist.shift();
+  for (let k = 0; k < N; k++) plot(k, f.t);
+  table(f);
+};
+</script></body></html>
+"""
+
+
+def _compact(value, digits=2):
+    """Round floats (recursively) so frames stay small on the wire."""
+    if isinstance(value, float):
+        return round(value, digits)
+    if isinstance(value, (list, tuple)):
+        return [_compact(v, digits) for v in value]
+    if isinstance(value, dict):
+        return {k: _compact(v, digits) for k, v in value.items()}
+    return value
+
+
+class WebDashboard:
+    """
+    Local browser dashboard for the teleop loop (stdlib only).
+
+    Logic:
+    1. The control loop calls publish(frame). That only stores a reference
+       to the newest frame dict, so the loop-side cost is a few us.
+    2. A broadcaster thread wakes at `rate_hz`, JSON-encodes the newest
+       frame once (floats rounded) and wakes every connected client.
+    3. Each browser holds one Server-Sent-Events stream (/stream) served by
+       its own daemon thread; slow clients just skip frames.
+       GET /        -> plotting page
+       GET /frame   -> newest frame as JSON (for curl / scripts)
+
+    Cost is measured on both sides: publish() time on the loop thread, and
+    encode + send time on the server threads (they share the GIL with the
+    loop, so that is the share of CPU taken away from it).
+    """
+
+    def __init__(self, port=8050, host='127.0.0.1', rate_hz=10.0):
+        self.period = 1.0 / rate_hz
+        self.latest = None
+        self.seq = 0
+
+        self.cond = threading.Condition()
+        self.payload = None
+        self.payload_seq = 0
+        self.running = False
+
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address[:2]
+        self.threads = []
+
+        # Stats
+        self.started = None
+        self.published = 0
+        self.publish_time = 0.0
+        self.publish_max = 0.0
+        self.broadcasts = 0
+        self.server_time = 0.0
+        self.bytes_sent = 0
+        self.clients = 0
+        self.stats_lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        self.running = True
+        self.started = time.monotonic()
+        for target in (self.server.serve_forever, self._broadcast_loop):
+            t = threading.Thread(target=target, daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def stop(self):
+        self.running = False
+        with self.cond:
+            self.cond.notify_all()
+        if self.threads:
+            self.server.shutdown()
+        self.server.server_close()
+
+    def publish(self, frame):
+        """Hand the newest frame to the dashboard (loop thread, never blocks)."""
+        t0 = time.perf_counter()
+        self.latest = frame
+        self.seq += 1
+        dt = time.perf_counter() - t0
+        self.published += 1
+        self.publish_time += dt
+        self.publish_max = max(self.publish_max, dt)
+
+    def _broadcast_loop(self):
+        sent_seq = 0
+        next_t = time.monotonic()
+        while self.running:
+            frame, seq = self.latest, self.seq
+            if frame is not None and seq != sent_seq:
+                t0 = time.perf_counter()
+                data = json.dumps(_compact(frame), separators=(',', ':')).encode()
+                self._add_server_time(time.perf_counter() - t0)
+                sent_seq = seq
+                with self.cond:
+                    self.payload = data
+                    self.payload_seq += 1
+                    self.broadcasts += 1
+                    self.cond.notify_all()
+            next_t += self.period
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_t = time.monotonic()
+
+    def _add_server_time(self, dt, nbytes=0):
+        with self.stats_lock:
+            self.server_time += dt
+            self.bytes_sent += nbytes
+
+    def _serve_stream(self, handler):
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.send_header("Connection", "keep-alive")
+        handler.end_headers()
+        with self.stats_lock:
+            self.clients += 1
+
+        seen = 0
+        try:
+            while self.running:
+                with self.cond:
+                    while self.running and self.payload_seq == seen:
+                        self.cond.wait(1.0)
+                    if not self.running:
+                        break
+                    data, seen = self.payload, self.payload_seq
+                t0 = time.perf_counter()
+                chunk = b"data: " + data + b"\n\n"
+                handler.wfile.write(chunk)
+                handler.wfile.flush()
+                self._add_server_time(time.perf_counter() - t0, len(chunk))
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Browser tab closed
+        finally:
+            with self.stats_lock:
+                self.clients -= 1
+
+    def _handler_class(self):
+        dashboard = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/stream":
+                    dashboard._serve_stream(self)
+                elif self.path == "/frame":
+                    self._reply(dashboard.payload or b"{}", "application/json")
+                elif self.path in ("/", "/index.html"):
+                    self._reply(PAGE.encode(), "text/html; charset=utf-8")
+                else:
+                    self.send_error(404)
+
+            def _reply(self, body, ctype):
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass  # Keep the teleop console clean
+
+        return Handler
+
+    def stats(self, loop_period=None):
+        elapsed = (time.monotonic() - self.started) if self.started else 0.0
+        publish_avg = self.publish_time / self.published if self.published else 0.0
+        return {
+            'published': self.published,
+            'broadcasts': self.broadcasts,
+            'clients': self.clients,
+            'bytes_sent': self.bytes_sent,
+            'publish_us_avg': publish_avg * 1e6,
+            'publish_us_max': self.publish_max * 1e6,
+            # Loop side: publish cost relative to one loop period
+            'loop_budget_pct': (publish_avg / loop_period * 100) if loop_period else None,
+            # Server side: encode + send time as a share of wall time
+            'server_cpu_pct': (self.server_time / elapsed * 100) if elapsed else 0.0,
+        }
+
+    def report(self, loop_period=None):
+        st = self.stats(loop_period)
+        print("\n--- Web Dashboard Report ---")
+        print(f"Frames published: {st['published']} | broadcast: {st['broadcasts']} | "
+              f"sent: {st['bytes_sent']/1024:.1f} KiB")
+        line = f"publish(): {st['publish_us_avg']:.1f}us avg / {st['publish_us_max']:.1f}us max"
+        if st['loop_budget_pct'] is not None:
+            line += f" ({st['loop_budget_pct']:.3f}% of loop period)"
+        print(line)
+        print(f"Server threads (encode + send): {st['server_cpu_pct']:.2f}% of wall time")